@@ -1,17 +1,106 @@
 # apps/banking/admin.py
 from django.contrib import admin
-from .models import Account, TransactionHistory
+from .admin_large_table import LargeTableAdminMixin
+from .models import (
+    Account, ArchiveSegment, DailyWithdrawal, OutboxConsumer, PendingPosting, PurgeJob,
+    StandingOrder, Statement, TransactionHistory, UserShard,
+)
 
 @admin.register(Account)
-class AccountAdmin(admin.ModelAdmin):
+class AccountAdmin(LargeTableAdminMixin, admin.ModelAdmin):
     list_display = ("id", "user", "bank_code", "account_number", "account_type", "balance", "created_at")
     list_filter = ("bank_code", "account_type", "created_at")
-    search_fields = ("account_number", "user__email")
+    list_select_related = ("user",)
+    # 인덱스 가능한 검색만: 계좌번호 접두사(idx_acct_number), 이메일 정확 일치(unique)
+    search_fields = ("account_number__startswith", "user__email__exact")
+    search_help_text = "계좌번호 앞자리 또는 이메일 전체"
     autocomplete_fields = ("user",)
 
 @admin.register(TransactionHistory)
-class TransactionHistoryAdmin(admin.ModelAdmin):
+class TransactionHistoryAdmin(LargeTableAdminMixin, admin.ModelAdmin):
     list_display = ("id", "account", "io_type", "method", "amount", "balance_after", "created_at", "description")
     list_filter = ("io_type", "method", "created_at")
-    search_fields = ("account__account_number", "description")
+    list_select_related = ("account",)
+    # description 부분 일치(icontains)는 인덱스를 못 타므로 제외
+    search_fields = ("account__account_number__startswith",)
+    search_help_text = "계좌번호 앞자리"
     autocomplete_fields = ("account",)
+
+@admin.register(StandingOrder)
+class StandingOrderAdmin(admin.ModelAdmin):
+    list_display = (
+        "id", "account", "io_type", "method", "amount", "interval", "next_run_at",
+        "status", "attempts", "last_error",
+    )
+    list_filter = ("status", "interval")
+    list_select_related = ("account",)
+    search_fields = ("account__account_number__startswith",)
+    autocomplete_fields = ("account",)
+    readonly_fields = ("attempts", "last_error", "last_run_at", "claimed_by", "claimed_until")
+
+@admin.register(PendingPosting)
+class PendingPostingAdmin(admin.ModelAdmin):
+    list_display = (
+        "seq", "handle", "account", "io_type", "amount", "status", "error",
+        "created_at", "applied_at",
+    )
+    list_filter = ("status",)
+    list_select_related = ("account",)
+    search_fields = ("=handle",)
+    show_full_result_count = False
+
+@admin.register(OutboxConsumer)
+class OutboxConsumerAdmin(admin.ModelAdmin):
+    list_display = ("name", "last_offset", "lease_until", "updated_at")
+
+
+@admin.register(PurgeJob)
+class PurgeJobAdmin(admin.ModelAdmin):
+    list_display = (
+        "id", "target_type", "target_id", "status", "progress", "last_error",
+        "created_at", "finished_at",
+    )
+    list_filter = ("status", "target_type")
+    search_fields = ("=target_id",)
+    readonly_fields = ("progress",)
+
+
+@admin.register(UserShard)
+class UserShardAdmin(admin.ModelAdmin):
+    # 이동은 move_user_shard 커맨드로 (여기서 alias 를 직접 바꾸면 데이터는 옮겨지지 않음)
+    list_display = ("user_id", "alias", "moving", "updated_at")
+    list_filter = ("alias", "moving")
+    search_fields = ("=user_id",)
+    readonly_fields = ("user_id", "alias", "moving", "updated_at")
+
+
+@admin.register(ArchiveSegment)
+class ArchiveSegmentAdmin(admin.ModelAdmin):
+    list_display = (
+        "account", "month", "row_count", "min_created_at", "max_created_at",
+        "closing_balance", "path",
+    )
+    list_select_related = ("account",)
+    search_fields = ("account__account_number__startswith",)
+    readonly_fields = [f.name for f in ArchiveSegment._meta.fields]
+
+
+@admin.register(Statement)
+class StatementAdmin(admin.ModelAdmin):
+    list_display = (
+        "account", "month", "opening_balance", "closing_balance", "line_count", "created_at",
+    )
+    list_select_related = ("account",)
+    list_filter = ("month",)
+    search_fields = ("account__account_number__startswith",)
+    readonly_fields = [f.name for f in Statement._meta.fields]
+
+
+@admin.register(DailyWithdrawal)
+class DailyWithdrawalAdmin(admin.ModelAdmin):
+    # 출금 시 함께 갱신되는 누적값 — 고칠 때는 rebuild_withdrawal_counters 로
+    list_display = ("account", "day", "method", "amount", "count", "updated_at")
+    list_select_related = ("account",)
+    list_filter = ("method", "day")
+    search_fields = ("account__account_number__startswith",)
+    readonly_fields = [f.name for f in DailyWithdrawal._meta.fields]
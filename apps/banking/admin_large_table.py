@@ -0,0 +1,165 @@
+# apps/banking/admin_large_table.py
+"""
+대용량 테이블용 어드민 모드 (transaction_history / accounts)
+
+- COUNT(*) 대신 플래너 통계로 건수 추정 (PostgreSQL: pg_class.reltuples / EXPLAIN 추정 행 수)
+- show_full_result_count 비활성 → 페이지마다 전체 COUNT(*) 한 번 더 하지 않음
+- 기본 정렬일 때는 OFFSET 대신 키셋(커서) 페이징: (created_at, id) < (마지막 행) 조건
+- list_select_related 로 목록의 FK __str__ 조회를 JOIN 한 번으로
+- 검색은 인덱스를 탈 수 있는 접두사/정확 일치 lookup 만 (search_fields에 lookup 명시)
+"""
+import json
+from datetime import datetime
+
+from django.contrib.admin.views.main import ORDER_VAR, PAGE_VAR, ChangeList
+from django.core.exceptions import ValidationError
+from django.core.paginator import Paginator
+from django.db import connections
+from django.db.models import Q
+from django.utils.functional import cached_property
+
+CURSOR_VAR = "after"
+
+
+def estimate_count(queryset):
+    """
+    플래너 통계 기반 행 수 추정. 추정할 수 없으면 None (→ 정확한 COUNT 사용).
+    - 필터 없음: pg_class.reltuples (ANALYZE/autovacuum 가 갱신)
+    - 필터 있음: EXPLAIN (FORMAT JSON) 의 최상위 "Plan Rows"
+    """
+    connection = connections[queryset.db]
+    if connection.vendor != "postgresql":
+        return None
+
+    queryset = queryset.order_by()
+    with connection.cursor() as cursor:
+        if not queryset.query.where:
+            cursor.execute(
+                "SELECT reltuples::bigint FROM pg_class WHERE oid = %s::regclass",
+                [queryset.model._meta.db_table],
+            )
+            row = cursor.fetchone()
+            rows = row[0] if row else -1
+        else:
+            sql, params = queryset.query.sql_with_params()
+            cursor.execute("EXPLAIN (FORMAT JSON) " + sql, params)
+            plan = cursor.fetchone()[0]
+            if isinstance(plan, str):
+                plan = json.loads(plan)
+            rows = plan[0]["Plan"]["Plan Rows"]
+    # reltuples = -1: 한 번도 ANALYZE 되지 않은 테이블
+    return int(rows) if rows is not None and rows >= 0 else None
+
+
+class EstimatedCountPaginator(Paginator):
+    """추정치가 임계값 이상이면 추정치를, 작으면 정확한 COUNT(*)를 쓴다."""
+    exact_count_threshold = 10_000
+    is_estimate = False
+
+    @cached_property
+    def count(self):
+        estimate = estimate_count(self.object_list)
+        if estimate is None or estimate < self.exact_count_threshold:
+            return super().count
+        self.is_estimate = True
+        return estimate
+
+
+class KeysetChangeList(ChangeList):
+    """
+    ?after=<created_at ISO>|<pk> 커서로 다음 페이지를 가져오는 ChangeList.
+    사용자가 컬럼 정렬(?o=)을 바꾸면 기존 페이지 번호 방식으로 동작한다.
+    """
+
+    def __init__(self, request, *args, **kwargs):
+        self.cursor = request.GET.get(CURSOR_VAR, "")
+        self.keyset_enabled = ORDER_VAR not in request.GET
+        super().__init__(request, *args, **kwargs)
+
+    def get_filters_params(self, params=None):
+        lookup_params = super().get_filters_params(params)
+        lookup_params.pop(CURSOR_VAR, None)
+        return lookup_params
+
+    def get_query_string(self, new_params=None, remove=None):
+        # 필터/정렬 링크를 누르면 커서는 처음부터 다시
+        new_params = new_params or {}
+        if CURSOR_VAR not in new_params:
+            remove = [*(remove or []), CURSOR_VAR]
+        return super().get_query_string(new_params, remove)
+
+    def get_queryset(self, request, exclude_parameters=None):
+        qs = super().get_queryset(request, exclude_parameters)
+        if exclude_parameters is None and self.keyset_enabled and self.cursor:
+            key = self._decode_cursor(self.cursor)
+            if key is not None:
+                qs = qs.filter(self._after_q(key))
+                self.page_num = 1
+        return qs
+
+    # --- 커서 인코딩/조건 ---
+    def _keyset_fields(self):
+        return self.model_admin.keyset_ordering
+
+    def _decode_cursor(self, raw):
+        parts = raw.split("|")
+        if len(parts) != len(self._keyset_fields()):
+            return None
+        try:
+            return [
+                self._field(field).to_python(part)
+                for field, part in zip(self._keyset_fields(), parts, strict=True)
+            ]
+        except ValidationError:
+            return None
+
+    def _field(self, ordering_field):
+        name = ordering_field.lstrip("-")
+        return self.lookup_opts.pk if name == "pk" else self.lookup_opts.get_field(name)
+
+    def _after_q(self, values):
+        """(f1, f2, ...) 사전식 비교: f1 < v1 OR (f1 = v1 AND f2 < v2) ..."""
+        q = Q()
+        equal = {}
+        for field, value in zip(self._keyset_fields(), values, strict=True):
+            name = field.lstrip("-")
+            op = "lt" if field.startswith("-") else "gt"
+            q |= Q(**equal, **{f"{name}__{op}": value})
+            equal[name] = value
+        return q
+
+    def _encode_cursor(self, obj):
+        parts = []
+        for field in self._keyset_fields():
+            value = getattr(obj, field.lstrip("-"))
+            parts.append(value.isoformat() if isinstance(value, datetime) else str(value))
+        return "|".join(parts)
+
+    @cached_property
+    def next_page_url(self):
+        if not self.keyset_enabled:
+            return None
+        rows = list(self.result_list)
+        if len(rows) < self.list_per_page:
+            return None
+        return self.get_query_string({CURSOR_VAR: self._encode_cursor(rows[-1])}, remove=[PAGE_VAR])
+
+    @property
+    def first_page_url(self):
+        return self.get_query_string(remove=[PAGE_VAR])
+
+
+class LargeTableAdminMixin:
+    """
+    ModelAdmin 에 섞어 쓰는 대용량 모드.
+    keyset_ordering 은 모델 기본 정렬과 같게, 마지막은 pk로 끝나야 순서가 결정적이다.
+    """
+    keyset_ordering = ("-created_at", "-pk")
+    paginator = EstimatedCountPaginator
+    show_full_result_count = False
+
+    def get_ordering(self, request):
+        return self.keyset_ordering
+
+    def get_changelist(self, request, **kwargs):
+        return KeysetChangeList
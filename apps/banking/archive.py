@@ -0,0 +1,227 @@
+# apps/banking/archive.py
+"""
+오래된 거래내역 보관(cold storage)
+
+- archive_account: 기준 시각 이전에 "끝난 달"의 거래를 계좌 × 월 단위 gzip JSONL 파일로 옮김
+  파일은 매번 새 경로(버전)에 저장 → ArchiveSegment 기록 + 원본 행 삭제(한 트랜잭션)
+  이전 버전 파일은 커밋된 뒤(on_commit)에만 지우고, 롤백되면 새 파일을 지움
+  → 어느 시점에 실패해도 목록 행은 항상 있는 파일을 가리키고, 행과 파일에 같은 거래가 겹치지 않음
+- 스토리지: STORAGES[TRANSACTION_ARCHIVE["STORAGE"]] (기본 로컬 디스크, S3 호환 백엔드로 교체 가능)
+- archived_transactions: 조회 조건과 겹치는 세그먼트만 연다
+  (목록 테이블의 min/max_created_at 로 먼저 거름)
+  → 최근 기간만 조회하면 파일을 전혀 읽지 않음, 읽을 때도 필요한 달까지만 한 달씩
+- stitch: DB(최근) + 보관 파일 결과를 created_at 내림차순으로 병합
+- archived_by_id: id 로 보관된 거래 찾기 (일괄 조회에서 DB 에 없는 id)
+"""
+import gzip
+import heapq
+import json
+import uuid
+from datetime import timedelta
+from decimal import Decimal
+from functools import partial
+from itertools import groupby
+from operator import attrgetter
+
+from django.conf import settings
+from django.core.files.base import ContentFile
+from django.core.files.storage import storages
+from django.db import transaction
+from django.db.models import Min
+from django.utils import timezone
+from django.utils.dateparse import parse_datetime
+
+from config.ids import uuid7_time
+from config.sharding import ledger_atomic, ledger_db
+
+from .models import ArchiveSegment, TransactionHistory
+
+
+def archive_settings():
+    return {"STORAGE": "archive", "AFTER_DAYS": 365, **getattr(settings, "TRANSACTION_ARCHIVE", {})}
+
+
+def archive_storage():
+    return storages[archive_settings()["STORAGE"]]
+
+
+def month_start(dt):
+    return timezone.localtime(dt).replace(day=1, hour=0, minute=0, second=0, microsecond=0)
+
+
+def next_month(start):
+    return (start.replace(day=28) + timedelta(days=4)).replace(day=1)
+
+
+def default_cutoff(now=None):
+    return (now or timezone.now()) - timedelta(days=archive_settings()["AFTER_DAYS"])
+
+
+def segment_path(account_id, month):
+    """같은 달을 다시 써도 기존 파일을 덮지 않도록 버전마다 새 경로"""
+    return f"transactions/{account_id}/{month:%Y-%m}.{uuid.uuid4().hex[:12]}.jsonl.gz"
+
+
+def _dump(txn):
+    return json.dumps({
+        "id": str(txn.id),
+        "amount": str(txn.amount),
+        "balance_after": str(txn.balance_after),
+        "description": txn.description,
+        "io_type": txn.io_type,
+        "method": txn.method,
+        "created_at": txn.created_at.isoformat(),
+    }, ensure_ascii=False)
+
+
+def _load(row, account_id):
+    return TransactionHistory(
+        id=uuid.UUID(row["id"]),
+        account_id=account_id,
+        amount=Decimal(row["amount"]),
+        balance_after=Decimal(row["balance_after"]),
+        description=row["description"],
+        io_type=row["io_type"],
+        method=row["method"],
+        created_at=parse_datetime(row["created_at"]),
+    )
+
+
+def read_segment(segment):
+    """세그먼트 파일 → 저장되지 않은 TransactionHistory 인스턴스 목록 (오래된 순)"""
+    with archive_storage().open(segment.path, "rb") as fh:
+        data = gzip.decompress(fh.read())
+    return [_load(json.loads(line), segment.account_id) for line in data.splitlines() if line]
+
+
+def _write(path, rows):
+    body = gzip.compress(("\n".join(_dump(t) for t in rows) + "\n").encode())
+    return archive_storage().save(path, ContentFile(body))
+
+
+def archive_account(account_id, *, cutoff=None):
+    """cutoff 이 속한 달 이전의 거래를 월별로 보관. 반환: 옮긴 행 수"""
+    end = month_start(cutoff or default_cutoff())
+    moved = 0
+    while True:
+        oldest = (
+            TransactionHistory.objects.filter(account_id=account_id, created_at__lt=end)
+            .aggregate(m=Min("created_at"))["m"]
+        )
+        if oldest is None:
+            return moved
+        start = month_start(oldest)
+        moved += _archive_month(account_id, start, next_month(start))
+
+
+@ledger_atomic
+def _archive_month(account_id, start, end):
+    rows = list(
+        TransactionHistory.objects.select_for_update()
+        .filter(account_id=account_id, created_at__gte=start, created_at__lt=end)
+        .order_by("created_at", "id")
+    )
+    if not rows:
+        return 0
+    ids = [t.pk for t in rows]
+
+    month = start.date()
+    segment = ArchiveSegment.objects.filter(account_id=account_id, month=month).first()
+    if segment is not None:
+        # 이미 보관된 달에 늦게 들어온 거래(과거 일시) → 기존 파일과 합쳐 다시 씀
+        merged = {t.pk: t for t in read_segment(segment)}
+        merged.update((t.pk, t) for t in rows)
+        rows = sorted(merged.values(), key=attrgetter("created_at", "id"))
+
+    storage = archive_storage()
+    path = _write(segment_path(account_id, start), rows)
+    try:
+        ArchiveSegment.objects.update_or_create(
+            account_id=account_id,
+            month=month,
+            defaults={
+                "path": path,
+                "row_count": len(rows),
+                "min_created_at": rows[0].created_at,
+                "max_created_at": rows[-1].created_at,
+                "closing_balance": rows[-1].balance_after,
+            },
+        )
+        # 접수 큐(PendingPosting)의 참조는 SET_NULL 로 정리됨
+        TransactionHistory.objects.filter(pk__in=ids).delete()
+    except BaseException:
+        storage.delete(path)   # 이 트랜잭션은 롤백 → 기존 행/파일이 그대로 유효
+        raise
+    if segment is not None:
+        transaction.on_commit(partial(storage.delete, segment.path), using=ledger_db())
+    return len(ids)
+
+
+def archived_transactions(account_ids, *, date_from=None, date_to=None, io_type=None, method=None,
+                          min_amount=None, max_amount=None):
+    """
+    보관된 거래 중 조건에 맞는 것 (최신순 이터레이터). account_ids 는 값 목록 또는 서브쿼리
+    세그먼트 목록은 바로 조회하고 파일은 한 달씩 늦게 연다
+    → 페이지가 차거나 스트리밍이 끝나면 더 오래된 달은 읽지 않고, 메모리에는 한 달 분량만
+    """
+    segments = ArchiveSegment.objects.filter(account_id__in=account_ids)
+    if date_from is not None:
+        segments = segments.filter(max_created_at__gte=date_from)
+    if date_to is not None:
+        segments = segments.filter(min_created_at__lte=date_to)
+    months = groupby(segments.order_by("-month", "account_id"), key=attrgetter("month"))
+    months = [list(group) for _, group in months]   # 목록만 지금 (스트리밍 중 DB 컨텍스트 불필요)
+
+    def matches(t):
+        return not (
+            (date_from is not None and t.created_at < date_from)
+            or (date_to is not None and t.created_at > date_to)
+            or (io_type and t.io_type != io_type)
+            or (method and t.method != method)
+            or (min_amount is not None and t.amount < min_amount)
+            or (max_amount is not None and t.amount > max_amount)
+        )
+
+    def rows():
+        # 세그먼트는 달 단위로 겹치지 않음 → 달마다 정렬해 이어 붙이면 전체도 최신순
+        for group in months:
+            month_rows = [t for segment in group for t in read_segment(segment) if matches(t)]
+            month_rows.sort(key=attrgetter("created_at", "id"), reverse=True)
+            yield from month_rows
+
+    return rows()
+
+
+def archived_by_id(account_ids, ids):
+    """
+    보관된 거래 중 ids 에 해당하는 것 {pk: 인스턴스}
+    UUIDv7 id 의 생성 시각보다 늦게 시작하는 세그먼트는 열지 않음
+    (created_at 은 생성 시각 이전만 가능)
+    """
+    wanted = set(ids)
+    if not wanted:
+        return {}
+    segments = ArchiveSegment.objects.filter(account_id__in=account_ids).order_by("-month")
+    times = [uuid7_time(pk) for pk in wanted]
+    if all(times):
+        segments = segments.filter(min_created_at__lte=max(times))
+    found = {}
+    for segment in segments:
+        for t in read_segment(segment):
+            if t.pk in wanted:
+                found[t.pk] = t
+        if len(found) == len(wanted):
+            break
+    return found
+
+
+def stitch(recent, archived):
+    """둘 다 (created_at, id) 내림차순 → 병합 결과도 내림차순 (지연 평가)"""
+    return heapq.merge(recent, archived, key=attrgetter("created_at", "id"), reverse=True)
+
+
+def delete_segments(account_id):
+    """계좌 삭제(purge) 시 보관 파일 제거. 목록 행은 호출한 쪽이 지운다"""
+    storage = archive_storage()
+    for path in ArchiveSegment.objects.filter(account_id=account_id).values_list("path", flat=True):
+        storage.delete(path)
@@ -0,0 +1,71 @@
+# apps/banking/batch.py
+"""
+id 목록 일괄 조회 (GET ?ids=a,b,c 또는 POST {"ids": [...]})
+
+- 뷰의 get_queryset()(내 것만) 에 pk IN (...) 한 번 → 요청 순서대로 정렬
+- 없는 id, 남의 id, 형식이 틀린 id 는 모두 "missing" 으로만 알려줌 (존재 여부를 드러내지 않음)
+- 중복 id 는 한 번만
+- batch_fallback: 뷰가 queryset 밖(예: 보관 파일)에서 더 찾을 때 재정의
+"""
+import uuid
+
+from rest_framework.decorators import action
+from rest_framework.exceptions import ValidationError
+from rest_framework.response import Response
+
+BATCH_MAX = 200
+
+
+def requested_ids(request):
+    if request.method == "POST":
+        ids = request.data.get("ids") if hasattr(request.data, "get") else None
+        if not isinstance(ids, list):
+            raise ValidationError({"ids": "id 목록(배열)이 필요합니다."})
+        values = [str(v) for v in ids]
+    else:
+        values = [v for v in request.query_params.get("ids", "").split(",") if v]
+    return list(dict.fromkeys(v.strip() for v in values))
+
+
+class BatchRetrieveMixin:
+    """ViewSet 에 섞어 쓰면 /<prefix>/batch/ 액션 추가"""
+
+    batch_max = BATCH_MAX
+    # POST 지만 조회 (ShardContextMixin 이동 중 쓰기 차단 대상 아님)
+    # ShardContextMixin 이 MRO 에서 먼저 오면 가려지므로 뷰에서 두 튜플을 합쳐 지정
+    read_only_actions = ("batch",)
+
+    def batch_fallback(self, pks):
+        """queryset 에서 못 찾은 pk 들 → {pk: 인스턴스}"""
+        return {}
+
+    @action(detail=False, methods=["get", "post"])
+    def batch(self, request):
+        values = requested_ids(request)
+        if not values:
+            raise ValidationError({"ids": "조회할 id 를 지정해 주세요."})
+        if len(values) > self.batch_max:
+            raise ValidationError(
+                {"ids": f"한 번에 최대 {self.batch_max}개까지 조회할 수 있습니다."}
+            )
+
+        parsed = {}
+        for value in values:
+            try:
+                parsed[value] = uuid.UUID(value)
+            except ValueError:
+                pass
+        found = {obj.pk: obj for obj in self.get_queryset().filter(pk__in=parsed.values())}
+        rest = [pk for pk in parsed.values() if pk not in found]
+        if rest:
+            found.update(self.batch_fallback(rest))
+
+        results, missing = [], []
+        for value in values:
+            obj = found.get(parsed.get(value))
+            if obj is None:
+                missing.append(value)
+            else:
+                results.append(obj)
+        data = self.get_serializer(results, many=True).data
+        return Response({"results": data, "missing": missing})
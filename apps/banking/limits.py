@@ -0,0 +1,65 @@
+# apps/banking/limits.py
+"""
+출금 한도 (settings.WITHDRAWAL_LIMITS, 거래타입별)
+
+- PER_TRANSACTION: 금액만 비교
+- DAILY: account_daily_withdrawals 의 (계좌, 날짜) 행들 — 계좌 행을 잠근 트랜잭션 안에서 읽고 더함
+  → 거래내역 SUM 없이 유니크 인덱스 조회 한 번, 잠금 구간이 거래 수에 비례해 늘지 않음
+- 한도가 없는 거래타입도 누적은 기록 (한도를 나중에 켜도 그날 누적이 맞도록)
+"""
+from decimal import Decimal
+
+from django.conf import settings
+
+from .models import DailyWithdrawal
+
+
+def withdrawal_limits(method):
+    """(일일 한도, 1회 한도) — 없으면 None"""
+    cfg = getattr(settings, "WITHDRAWAL_LIMITS", {}).get(method) or {}
+    daily, per_transaction = cfg.get("DAILY"), cfg.get("PER_TRANSACTION")
+    return (
+        Decimal(str(daily)) if daily not in (None, "") else None,
+        Decimal(str(per_transaction)) if per_transaction not in (None, "") else None,
+    )
+
+
+class WithdrawalCounter:
+    """계좌 하나의 하루 출금 누적. 반드시 그 계좌 행을 select_for_update 한 트랜잭션 안에서 사용"""
+
+    def __init__(self, account_id, day, *, using=None):
+        self.account_id = account_id
+        self.day = day
+        self.using = using
+        self._rows = None
+        self._dirty = {}
+
+    def _row(self, method):
+        if self._rows is None:
+            qs = DailyWithdrawal.objects.filter(account_id=self.account_id, day=self.day)
+            if self.using:
+                qs = qs.using(self.using)
+            self._rows = {row.method: row for row in qs}
+        if method not in self._rows:
+            self._rows[method] = DailyWithdrawal(
+                account_id=self.account_id, day=self.day, method=method
+            )
+        return self._rows[method]
+
+    def charge(self, method, amount):
+        """한도 안이면 누적에 더하고 None, 넘으면 거절 사유"""
+        daily, per_transaction = withdrawal_limits(method)
+        if per_transaction is not None and amount > per_transaction:
+            return "1회 출금 한도 초과"
+        row = self._row(method)
+        if daily is not None and row.amount + amount > daily:
+            return "일일 출금 한도 초과"
+        row.amount += amount
+        row.count += 1
+        self._dirty[method] = row
+        return None
+
+    def save(self):
+        for row in self._dirty.values():
+            row.save(using=self.using)
+        self._dirty.clear()
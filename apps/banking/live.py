@@ -0,0 +1,252 @@
+# apps/banking/live.py
+"""
+실시간 원장 이벤트 (SSE 스트림 GET /api/events/ 의 공급원)
+
+- notify(user_id): 원장 쓰기 트랜잭션 안에서 호출
+  → 커밋되면(on_commit) 같은 프로세스의 구독자를 깨움
+- OutboxBridge: 다른 프로세스(다른 ASGI 워커, apply_postings, run_standing_orders ...)의 커밋은
+  LIVE_EVENTS["POLL_INTERVAL"] 마다 샤드별 outbox 의 새 id 를 훑어 해당 사용자 구독자를 깨움
+  (구독자가 있을 때만)
+- 알림에는 내용이 없다: 깬 스트림이 outbox 에서 (user_id, id > 워터마크) 를 직접 읽음
+  → 어느 경로로 깨든 같은 순서/같은 내용, 이벤트 id = outbox id (재접속 시 Last-Event-ID)
+- outbox id 는 INSERT 순서라 커밋 순서와 다를 수 있음
+  → Frontier: 샤드별로 프로세스 하나가 전체 outbox 의 새 id 를 훑어 빈 id(아직 커밋 안 됨)를
+  추적하고 "이 id 까지는 전부 보임" 위치를 낸다 (outbox.claim_batch 의 gaps 와 같은 방식)
+  스트림 워터마크는 그 위치까지만 올리고, 그 위는 보낸 id 로 중복만 거름
+  → 늦게 커밋된 낮은 id 도 빠지지 않음
+  (프로세스가 처음 Frontier 를 만들 때 이미 진행 중이던 트랜잭션의 id 는 추적하지 못함)
+"""
+import asyncio
+import logging
+import threading
+import time
+from collections import defaultdict
+from functools import partial
+
+from django.conf import settings
+from django.db import close_old_connections, transaction
+from django.db.models import Max
+
+from config.sharding import ledger_db, ledger_shards, use_shard
+
+from .models import Account, OutboxEvent
+from .outbox import GAP_TIMEOUT, MAX_GAPS, find_gaps
+
+logger = logging.getLogger(__name__)
+
+FETCH_LIMIT = 100
+FRONTIER_SCAN = 10_000
+
+
+def live_settings():
+    return {
+        "HEARTBEAT": 15,
+        "MAX_AGE": 300,
+        "RETRY_MS": 3000,
+        "POLL_INTERVAL": 1.0,
+        **getattr(settings, "LIVE_EVENTS", {}),
+    }
+
+
+class Broker:
+    """
+    프로세스 안 구독 목록: user_id → {(이벤트 루프, asyncio.Event)}
+    publish 는 아무 스레드에서나
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._subscribers = defaultdict(set)
+
+    def subscribe(self, user_id):
+        sub = (asyncio.get_running_loop(), asyncio.Event())
+        with self._lock:
+            self._subscribers[str(user_id)].add(sub)
+        return sub
+
+    def unsubscribe(self, user_id, sub):
+        with self._lock:
+            subs = self._subscribers.get(str(user_id))
+            if subs is not None:
+                subs.discard(sub)
+                if not subs:
+                    del self._subscribers[str(user_id)]
+
+    def has_subscribers(self):
+        return bool(self._subscribers)
+
+    def publish(self, user_id):
+        with self._lock:
+            subs = list(self._subscribers.get(str(user_id), ()))
+        for loop, event in subs:
+            try:
+                loop.call_soon_threadsafe(event.set)
+            except RuntimeError:   # 루프가 이미 닫힘 (연결 종료 직후)
+                pass
+
+
+broker = Broker()
+
+
+def notify(user_id, *, using=None):
+    """원장 트랜잭션 안에서 호출. 커밋되면 구독자를 깨우고, 롤백되면 아무 일도 없음"""
+    transaction.on_commit(partial(broker.publish, user_id), using=using)
+
+
+class Frontier:
+    """
+    샤드 하나의 outbox 에서 "이 id 이하는 모두 커밋되어 보임" 위치 (프로세스 공용)
+    advance() 가 마지막으로 본 id 이후만 읽어 빈 id 를 기록하고,
+    채워지거나 GAP_TIMEOUT 이 지나면 지운다.
+    """
+
+    def __init__(self, alias):
+        self.alias = alias
+        self.last = None
+        self.gaps = {}   # id → 처음 발견한 시각(monotonic)
+        self._lock = threading.Lock()
+
+    @property
+    def position(self):
+        return min(self.gaps) - 1 if self.gaps else self.last
+
+    def advance(self):
+        """반환: 새로 보인 (id, user_id) 목록 (브리지가 구독자를 깨우는 데 씀)"""
+        with self._lock, use_shard(self.alias):
+            qs = OutboxEvent.objects.using(ledger_db())
+            if self.last is None:
+                self.last = qs.aggregate(m=Max("id"))["m"] or 0
+                return []
+            now = time.monotonic()
+            if self.gaps:
+                filled = set(qs.filter(id__in=list(self.gaps)).values_list("id", flat=True))
+                timeout = GAP_TIMEOUT.total_seconds()
+                self.gaps = {
+                    i: seen for i, seen in self.gaps.items()
+                    if i not in filled and now - seen < timeout
+                }
+            rows = list(
+                qs.filter(id__gt=self.last).order_by("id")
+                .values_list("id", "user_id")[:FRONTIER_SCAN]
+            )
+            for i in find_gaps(self.last, [i for i, _ in rows])[:MAX_GAPS]:
+                self.gaps.setdefault(i, now)
+            if rows:
+                self.last = rows[-1][0]
+            return rows
+
+
+_frontiers = {}
+_frontiers_lock = threading.Lock()
+
+
+def frontier(alias):
+    with _frontiers_lock:
+        if alias not in _frontiers:
+            _frontiers[alias] = Frontier(alias)
+        return _frontiers[alias]
+
+
+def reset_frontiers():
+    """테스트용: 트랜잭션 롤백으로 id 가 다시 쓰이는 환경"""
+    with _frontiers_lock:
+        _frontiers.clear()
+
+
+class OutboxBridge(threading.Thread):
+    """다른 프로세스가 커밋한 이벤트 감지 (프로세스당 하나, 첫 구독 때 시작)"""
+
+    def __init__(self, interval):
+        super().__init__(name="outbox-bridge", daemon=True)
+        self.interval = interval
+
+    def run(self):
+        while True:
+            time.sleep(self.interval)
+            if not broker.has_subscribers():
+                continue
+            try:
+                self.poll()
+            except Exception:
+                logger.exception("outbox bridge poll failed")
+            finally:
+                close_old_connections()
+
+    def poll(self):
+        for alias in ledger_shards():
+            for user_id in {user_id for _, user_id in frontier(alias).advance()}:
+                broker.publish(user_id)
+
+
+_bridge = None
+_bridge_lock = threading.Lock()
+
+
+def ensure_bridge():
+    global _bridge
+    interval = live_settings()["POLL_INTERVAL"]
+    if not interval or _bridge is not None:
+        return
+    with _bridge_lock:
+        if _bridge is None:
+            _bridge = OutboxBridge(interval)
+            _bridge.start()
+
+
+# ---- 스트림에서 sync_to_async 로 부르는 조회 ----
+# (사용자 샤드의 primary 에서 읽음: 복제 지연 없이)
+
+def snapshot(alias, user_id):
+    """
+    (시작 위치, 계좌 잔액 목록, 잔액에 이미 반영된 위치 위의 이벤트 id)
+    시작 위치는 Frontier 기준 → 그 위에서 늦게 커밋되는 낮은 id 도 스트림에서 전달됨
+    """
+    position = advance_frontier(alias)
+    with use_shard(alias):
+        db = ledger_db()
+        seen = set(
+            OutboxEvent.objects.using(db).filter(user_id=user_id, id__gt=position)
+            .values_list("id", flat=True)
+        )
+        accounts = list(
+            Account.objects.using(db).filter(user_id=user_id, deleted_at__isnull=True)
+            .order_by("-created_at").values("id", "bank_code", "account_number", "balance")
+        )
+    return position, accounts, seen
+
+
+def advance_frontier(alias):
+    f = frontier(alias)
+    f.advance()   # 첫 호출이면 현재 최대 id 를 기준으로 시작
+    return f.position
+
+
+def fetch_events(alias, user_id, after, *, exclude=(), limit=FETCH_LIMIT):
+    """after 이후 사용자 이벤트 중 exclude(이미 보낸 id) 제외 → (이벤트, 잘렸는지, Frontier 위치)"""
+    position = advance_frontier(alias)
+    with use_shard(alias):
+        events = list(
+            OutboxEvent.objects.using(ledger_db()).filter(user_id=user_id, id__gt=after)
+            .exclude(id__in=list(exclude)).order_by("id")[:limit]
+        )
+    return events, len(events) == limit, position
+
+
+class Cursor:
+    """
+    스트림 하나의 읽기 위치: watermark 이하는 모두 보냄(재접속 시 Last-Event-ID),
+    그 위는 sent 로 중복 제거
+    watermark 는 Frontier 위치를 넘지 않음 → 늦게 커밋된 낮은 id 는 다음 조회에서 잡힌다
+    """
+
+    def __init__(self, after, sent=()):
+        self.watermark = after
+        self.sent = set(sent)
+
+    def take(self, events, *, truncated, frontier):
+        fresh = [e for e in events if e.id not in self.sent]
+        self.sent.update(e.id for e in fresh)
+        top = min(frontier, events[-1].id) if truncated else frontier
+        self.watermark = max(self.watermark, top)
+        self.sent = {i for i in self.sent if i > self.watermark}
+        return fresh
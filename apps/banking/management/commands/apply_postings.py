@@ -0,0 +1,40 @@
+# apps/banking/management/commands/apply_postings.py
+import time
+from collections import Counter
+
+from django.core.management.base import BaseCommand
+from django.db import close_old_connections
+
+from config.sharding import ledger_shards, use_shard
+
+from ...postings import drain_account, pending_account_ids
+
+
+class Command(BaseCommand):
+    help = "비동기 접수된 거래를 계좌별로 모아(계좌 잠금 1번 + bulk_create 1번) 반영합니다."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--batch-size", type=int, default=500,
+                            help="계좌당 한 번에 반영할 최대 건수")
+        parser.add_argument("--accounts", type=int, default=100, help="한 루프에서 처리할 계좌 수")
+        parser.add_argument("--loop", action="store_true", help="종료하지 않고 계속 폴링")
+        parser.add_argument("--interval", type=float, default=0.2,
+                            help="대기 시간(초), --loop 일 때")
+
+    def handle(self, *args, batch_size, accounts, loop, interval, **options):
+        totals = Counter()
+        while True:
+            progressed = False
+            for alias in ledger_shards():
+                with use_shard(alias):
+                    for account_id in pending_account_ids(limit=accounts):
+                        applied, rejected = drain_account(account_id, batch_size=batch_size)
+                        totals.update(applied=applied, rejected=rejected)
+                        progressed = progressed or bool(applied or rejected)
+            if progressed:
+                continue
+            if not loop:
+                break
+            close_old_connections()
+            time.sleep(interval)
+        self.stdout.write(self.style.SUCCESS(f"완료: {dict(totals)}"))
@@ -0,0 +1,40 @@
+# apps/banking/management/commands/archive_transactions.py
+from collections import Counter
+from datetime import timedelta
+
+from django.core.management.base import BaseCommand
+from django.utils import timezone
+
+from config.sharding import ledger_shards, use_shard
+
+from ...archive import archive_account, archive_settings, month_start
+from ...models import TransactionHistory
+
+
+class Command(BaseCommand):
+    help = "오래된 거래내역을 계좌 × 월 단위 압축 파일로 보관하고 DB 에서 지웁니다."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--older-than-days", type=int, default=None,
+                            help="기준 일수 (기본 TRANSACTION_ARCHIVE['AFTER_DAYS'])")
+        parser.add_argument("--accounts", type=int, default=0,
+                            help="샤드마다 처리할 최대 계좌 수 (0: 전부)")
+
+    def handle(self, *args, older_than_days, accounts, **options):
+        days = archive_settings()["AFTER_DAYS"] if older_than_days is None else older_than_days
+        cutoff = timezone.now() - timedelta(days=days)
+        totals = Counter()
+        for alias in ledger_shards():
+            with use_shard(alias):
+                ids = (
+                    TransactionHistory.objects.filter(created_at__lt=month_start(cutoff))
+                    .order_by()
+                    .values_list("account_id", flat=True)
+                    .distinct()
+                )
+                if accounts:
+                    ids = ids[:accounts]
+                for account_id in list(ids):
+                    moved = archive_account(account_id, cutoff=cutoff)
+                    totals.update(accounts=1, rows=moved)
+        self.stdout.write(self.style.SUCCESS(f"완료: {dict(totals)}"))
@@ -0,0 +1,72 @@
+# apps/banking/management/commands/backfill_minor_units.py
+import time
+from collections import Counter
+
+from django.core.management.base import BaseCommand
+from django.db.models import BigIntegerField, F, Q
+from django.db.models.functions import Cast, Round
+
+from config.sharding import ledger_shards, use_shard
+
+from ...models import Account, TransactionHistory
+from ...money import SCALE
+
+# (모델, [(NUMERIC 필드, BIGINT 필드), ...])
+TARGETS = (
+    (Account, [("balance", "balance_minor")]),
+    (TransactionHistory, [("amount", "amount_minor"), ("balance_after", "balance_after_minor")]),
+)
+
+
+def _minor(field):
+    return Cast(Round(F(field) * SCALE), BigIntegerField())
+
+
+class Command(BaseCommand):
+    help = ("금액 *_minor(BIGINT) 컬럼이 비어 있는 행을 pk 순 배치로 채웁니다 "
+            "(MONEY_STORAGE MODE=dual 에서 실행).")
+
+    def add_arguments(self, parser):
+        parser.add_argument("--batch-size", type=int, default=5000)
+        parser.add_argument("--pause", type=float, default=0.0, help="배치 사이 대기(초)")
+        parser.add_argument("--check", action="store_true",
+                            help="채우지 않고 빈 값/불일치 건수만 출력")
+
+    def handle(self, *args, batch_size, pause, check, **options):
+        totals = Counter()
+        for alias in ledger_shards():
+            with use_shard(alias):
+                for model, pairs in TARGETS:
+                    label = f"{alias}.{model._meta.db_table}"
+                    missing = Q()
+                    for _, minor in pairs:
+                        missing |= Q(**{f"{minor}__isnull": True})
+                    if check:
+                        mismatch = Q()
+                        for field, minor in pairs:
+                            mismatch |= ~Q(**{minor: _minor(field)})
+                        totals[f"{label}.missing"] = model.objects.filter(missing).count()
+                        totals[f"{label}.mismatch"] = (
+                            model.objects.exclude(missing).filter(mismatch).count()
+                        )
+                        continue
+                    totals[label] += self._backfill(model, pairs, missing, batch_size, pause)
+        self.stdout.write(self.style.SUCCESS(f"완료: {dict(totals)}"))
+
+    @staticmethod
+    def _backfill(model, pairs, missing, batch_size, pause):
+        """빈 행만 채움 → dual 모드 쓰기와 겹쳐도 방금 기록된 값은 건드리지 않음"""
+        filled, last = 0, None
+        while True:
+            qs = model.objects.filter(missing).order_by("pk")
+            if last is not None:
+                qs = qs.filter(pk__gt=last)
+            ids = list(qs.values_list("pk", flat=True)[:batch_size])
+            if not ids:
+                return filled
+            filled += model.objects.filter(pk__in=ids).filter(missing).update(
+                **{minor: _minor(field) for field, minor in pairs}
+            )
+            last = ids[-1]
+            if pause:
+                time.sleep(pause)
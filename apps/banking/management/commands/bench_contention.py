@@ -0,0 +1,176 @@
+# apps/banking/management/commands/bench_contention.py
+import statistics
+import time
+import uuid
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from decimal import Decimal
+from random import Random
+
+from django.contrib.auth import get_user_model
+from django.core.exceptions import ValidationError
+from django.core.management.base import BaseCommand
+from django.db import OperationalError, connections
+
+from config.process_pool import worker_pool
+from config.sharding import use_shard
+
+from ...models import Account, TransactionHistory
+
+# PostgreSQL SQLSTATE
+DEADLOCK = "40P01"
+SERIALIZATION = "40001"
+
+
+def _classify(exc):
+    cause = exc.__cause__
+    code = getattr(cause, "sqlstate", None) or getattr(cause, "pgcode", None)
+    if code == DEADLOCK:
+        return "deadlock"
+    if code == SERIALIZATION:
+        return "serialization"
+    return "db_error"
+
+
+def run_worker(task):
+    """
+    워커 하나(스레드 또는 프로세스, 자체 DB 커넥션): 계좌들에 입/출금을 ops 번 실행
+    반환: (결과 Counter, 지연 목록(초), 잠금 대기 합(초), 실행 시간(초))
+    """
+    alias, account_ids, ops, seed, deposit_ratio = task
+    rnd = Random(seed)
+    stats, latencies, lock_wait = Counter(), [], [0.0]
+
+    def time_locks(execute, sql, params, many, context):
+        # SELECT ... FOR UPDATE 소요 = 대부분 행 잠금 대기
+        if "FOR UPDATE" not in sql:
+            return execute(sql, params, many, context)
+        start = time.perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            lock_wait[0] += time.perf_counter() - start
+
+    connection = connections[alias]
+    try:
+        with use_shard(alias), connection.execute_wrapper(time_locks):
+            accounts = {a.pk: a for a in Account.objects.using(alias).filter(pk__in=account_ids)}
+            began = time.perf_counter()
+            for _ in range(ops):
+                account = accounts[rnd.choice(account_ids)]
+                io_type = "DEPOSIT" if rnd.random() < deposit_ratio else "WITHDRAW"
+                amount = Decimal(rnd.randrange(100, 10_000)) / 100
+                start = time.perf_counter()
+                try:
+                    account.apply_transaction(
+                        amount=amount, io_type=io_type, method="ETC", description="bench"
+                    )
+                    stats["ok"] += 1
+                except ValidationError:
+                    stats["rejected"] += 1   # 잔액 부족
+                except OperationalError as e:
+                    stats[_classify(e)] += 1
+                latencies.append(time.perf_counter() - start)
+            elapsed = time.perf_counter() - began
+    finally:
+        connection.close()
+    return stats, latencies, lock_wait[0], elapsed
+
+
+def verify_chain(alias, account_ids):
+    """
+    계좌별 (created_at, id) 순서로 balance_after 가 이어지고 마지막 값이 잔액과 같은지
+    반환: 깨진 계좌 수
+    """
+    broken = 0
+    for account in Account.objects.using(alias).filter(pk__in=account_ids):
+        balance = Decimal("0.00")
+        rows = (
+            TransactionHistory.objects.using(alias).filter(account=account)
+            .order_by("created_at", "id")
+            .values_list("io_type", "amount", "balance_after")
+        )
+        ok = True
+        for io_type, amount, balance_after in rows.iterator(chunk_size=5000):
+            balance = balance + amount if io_type == "DEPOSIT" else balance - amount
+            if balance != balance_after or balance < 0:
+                ok = False
+                break
+        if not ok or balance != account.balance:
+            broken += 1
+    return broken
+
+
+class Command(BaseCommand):
+    help = (
+        "한 계좌/소수 계좌/다수 계좌에 동시 입출금(Account.apply_transaction)을 걸어 "
+        "처리량, 지연 백분위, 잠금 대기, 교착/직렬화 실패를 측정하고 잔액 체인을 검증합니다."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--workers", default="1,4,16", help="동시 작성자 수 목록 (쉼표)")
+        parser.add_argument("--accounts", default="1,4,1000", help="대상 계좌 수 목록 (쉼표)")
+        parser.add_argument("--ops", type=int, default=500, help="작성자당 거래 수")
+        parser.add_argument("--mode", choices=("process", "thread"), default="process")
+        parser.add_argument("--deposit-ratio", type=float, default=0.6)
+        parser.add_argument("--database", default="default", help="원장 DB alias (샤드 포함)")
+        parser.add_argument("--keep", action="store_true", help="벤치 데이터를 지우지 않음")
+
+    def handle(self, *args, workers, accounts, ops, mode, deposit_ratio, database, keep, **options):
+        vendor = connections[database].vendor
+        if vendor != "postgresql":
+            self.stderr.write(
+                f"주의: {vendor} — 행 잠금이 없어 PostgreSQL 수치와 비교할 수 없습니다."
+            )
+
+        email = f"bench-{uuid.uuid4().hex[:12]}@example.com"
+        user = get_user_model().objects.create_user(email=email)
+        self.stdout.write(
+            f"{'writers':>7}{'accounts':>9}{'ok':>8}{'rej':>6}{'dead':>6}{'ser':>6}{'err':>6}"
+            f"{'tx/s':>9}{'p50ms':>8}{'p95ms':>8}{'p99ms':>8}{'lock%':>7}{'chain':>7}"
+        )
+        try:
+            for n_accounts in (int(x) for x in accounts.split(",")):
+                for n_workers in (int(x) for x in workers.split(",")):
+                    self._scenario(user, database, n_workers, n_accounts, ops, mode, deposit_ratio)
+        finally:
+            if not keep:
+                with use_shard(database):
+                    Account.objects.using(database).filter(user_id=user.pk).delete()
+                user.delete()
+
+    def _scenario(self, user, alias, n_workers, n_accounts, ops, mode, deposit_ratio):
+        with use_shard(alias):
+            ids = [
+                Account.objects.create(
+                    user=user, bank_code="ETC", account_number=str(uuid.uuid4().int)[:14],
+                    account_type="DEMAND",
+                ).pk
+                for _ in range(n_accounts)
+            ]
+        tasks = [(alias, ids, ops, seed, deposit_ratio) for seed in range(n_workers)]
+
+        if mode == "thread":
+            with ThreadPoolExecutor(max_workers=n_workers) as pool:
+                results = list(pool.map(run_worker, tasks))
+        else:
+            with worker_pool(n_workers) as pool:
+                results = list(pool.map(run_worker, tasks))
+
+        # 처리량은 워커 안에서 잰 시간 기준 (프로세스 기동/django.setup 제외)
+        stats, latencies, lock_wait, elapsed = Counter(), [], 0.0, 0.0
+        for s, lat, wait, took in results:
+            stats.update(s)
+            latencies += lat
+            lock_wait += wait
+            elapsed = max(elapsed, took)
+        q = statistics.quantiles(latencies, n=100) if len(latencies) > 1 else [latencies[0]] * 99
+        broken = verify_chain(alias, ids)
+        lock_pct = 100 * lock_wait / max(sum(latencies), 1e-9)
+        chain = "OK" if not broken else f"{broken}!"
+        self.stdout.write(
+            f"{n_workers:>7}{n_accounts:>9}{stats['ok']:>8}{stats['rejected']:>6}{stats['deadlock']:>6}"
+            f"{stats['serialization']:>6}{stats['db_error']:>6}{stats['ok'] / elapsed:>9,.0f}"
+            f"{q[49] * 1000:>8.1f}{q[94] * 1000:>8.1f}{q[98] * 1000:>8.1f}"
+            f"{lock_pct:>6.0f}%{chain:>7}"
+        )
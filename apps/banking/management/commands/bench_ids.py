@@ -0,0 +1,71 @@
+# apps/banking/management/commands/bench_ids.py
+import time
+import uuid
+
+from django.core.management.base import BaseCommand
+from django.db import connection, transaction
+
+from config.ids import uuid7
+
+GENERATORS = (("uuid4", uuid.uuid4), ("uuid7", uuid7))
+
+
+class Command(BaseCommand):
+    help = "PK 생성 방식 비교: uuid4 vs uuid7 — 임시 테이블에 INSERT 처리량과 PK 인덱스 크기"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--rows", type=int, default=200_000)
+        parser.add_argument("--batch-size", type=int, default=1000, help="커밋 단위")
+
+    def handle(self, *args, rows, batch_size, **options):
+        id_type = "uuid" if connection.vendor == "postgresql" else "char(32)"
+        self.stdout.write(f"{'PK':<8}{'rows/s':>12}{'PK 인덱스':>14}")
+        for name, generate in GENERATORS:
+            table = f"bench_ids_{name}"
+            with connection.cursor() as cursor:
+                cursor.execute(f"DROP TABLE IF EXISTS {table}")
+                cursor.execute(
+                    f"CREATE TABLE {table} (id {id_type} PRIMARY KEY, account_id {id_type}, "
+                    f"amount bigint, created_at timestamp)"
+                )
+            try:
+                rate = self._insert(table, generate, rows, batch_size)
+                size = self._index_size(table)
+                self.stdout.write(f"{name:<8}{rate:>12,.0f}{size:>14}")
+            finally:
+                with connection.cursor() as cursor:
+                    cursor.execute(f"DROP TABLE IF EXISTS {table}")
+
+    @staticmethod
+    def _insert(table, generate, rows, batch_size):
+        account = uuid.uuid4()
+        as_param = (lambda u: u) if connection.vendor == "postgresql" else (lambda u: u.hex)
+        sql = (
+            f"INSERT INTO {table} (id, account_id, amount, created_at) "
+            f"VALUES (%s, %s, %s, CURRENT_TIMESTAMP)"
+        )
+        start = time.perf_counter()
+        for offset in range(0, rows, batch_size):
+            params = [
+                (as_param(generate()), as_param(account), i)
+                for i in range(offset, min(offset + batch_size, rows))
+            ]
+            with transaction.atomic(), connection.cursor() as cursor:
+                cursor.executemany(sql, params)
+        return rows / (time.perf_counter() - start)
+
+    @staticmethod
+    def _index_size(table):
+        with connection.cursor() as cursor:
+            if connection.vendor == "postgresql":
+                cursor.execute("SELECT pg_size_pretty(pg_relation_size(%s))", [f"{table}_pkey"])
+                return cursor.fetchone()[0]
+            if connection.vendor == "sqlite":
+                try:
+                    cursor.execute("SELECT SUM(pgsize) FROM dbstat WHERE name = %s",
+                                   [f"sqlite_autoindex_{table}_1"])
+                except Exception:
+                    return "-"   # dbstat 미지원 빌드
+                size = cursor.fetchone()[0] or 0
+                return f"{size / 1024:,.0f} kB"
+        return "-"
@@ -0,0 +1,86 @@
+# apps/banking/management/commands/bench_money.py
+import time
+import uuid
+from datetime import timedelta
+from decimal import Decimal
+from random import Random
+
+from django.contrib.auth import get_user_model
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from django.db.models import Sum
+from django.test.utils import override_settings
+from django.utils import timezone
+from rest_framework.renderers import JSONRenderer
+
+from config.sharding import ledger_db
+
+from ...models import Account, TransactionHistory
+from ...serializers_transactions import TransactionSerializer
+
+
+class Command(BaseCommand):
+    help = ("금액 저장 방식 비교: NUMERIC vs BIGINT(최소 단위) 집계 / 직렬화 속도 "
+            "(임시 데이터, 끝나면 롤백)")
+
+    def add_arguments(self, parser):
+        parser.add_argument("--rows", type=int, default=20_000)
+        parser.add_argument("--repeat", type=int, default=5)
+
+    def handle(self, *args, rows, repeat, **options):
+        with transaction.atomic(), transaction.atomic(using=ledger_db()):
+            account = self._fixture(rows)
+            qs = TransactionHistory.objects.filter(account=account)
+
+            agg_decimal = self._best(repeat, lambda: qs.aggregate(s=Sum("amount"))["s"])
+            agg_minor = self._best(repeat, lambda: qs.aggregate(s=Sum("amount_minor"))["s"])
+
+            loaded = list(qs.order_by("-created_at"))
+            outputs = {}
+
+            def render(mode):
+                with override_settings(MONEY_STORAGE={"MODE": mode}):
+                    data = TransactionSerializer(loaded, many=True).data
+                    outputs[mode] = JSONRenderer().render(data)
+
+            ser_decimal = self._best(repeat, lambda: render("decimal"))
+            ser_minor = self._best(repeat, lambda: render("minor"))
+
+            self.stdout.write(f"{'':<12}{'NUMERIC':>12}{'BIGINT':>12}")
+            for label, numeric, bigint in (("SUM (ms)", agg_decimal, agg_minor),
+                                           ("JSON (ms)", ser_decimal, ser_minor)):
+                self.stdout.write(f"{label:<12}{numeric * 1000:>12.1f}{bigint * 1000:>12.1f}")
+            same = outputs["decimal"] == outputs["minor"]
+            verdict = "JSON 출력 동일" if same else "JSON 출력 다름!"
+            self.stdout.write(f"{verdict} ({len(loaded)}건)")
+            transaction.set_rollback(True)
+            transaction.set_rollback(True, using=ledger_db())
+
+    @staticmethod
+    def _fixture(rows):
+        rnd = Random(0)
+        user = get_user_model().objects.create_user(
+            email=f"bench-{uuid.uuid4().hex[:8]}@example.com", password=None
+        )
+        account = Account.objects.create(
+            user=user, bank_code="ETC", account_number=str(rnd.randrange(10**11, 10**12))
+        )
+        now, balance, txns = timezone.now(), Decimal("0.00"), []
+        for i in range(rows):
+            amount = Decimal(rnd.randrange(1, 10_000_000)) / 100
+            balance += amount
+            txns.append(TransactionHistory(
+                account=account, amount=amount, balance_after=balance,
+                io_type="DEPOSIT", method="ETC", created_at=now - timedelta(seconds=rows - i),
+            ).set_minor_units())
+        TransactionHistory.objects.bulk_create(txns, batch_size=2000)
+        return account
+
+    @staticmethod
+    def _best(repeat, fn):
+        best = float("inf")
+        for _ in range(repeat):
+            start = time.perf_counter()
+            fn()
+            best = min(best, time.perf_counter() - start)
+        return best
@@ -0,0 +1,26 @@
+# apps/banking/management/commands/check_account_owners.py
+from django.core.management.base import BaseCommand, CommandError
+
+from config.sharding import ledger_shards, use_shard
+
+from ...purge import orphaned_accounts
+
+
+class Command(BaseCommand):
+    help = ("사용자 행이 없는 계좌를 샤드별로 찾습니다. "
+            "(Account.user 는 DB FK 제약이 없음, 있으면 종료 코드 1)")
+
+    def add_arguments(self, parser):
+        parser.add_argument("--batch-size", type=int, default=1000)
+
+    def handle(self, *args, batch_size, **options):
+        total = 0
+        for alias in ledger_shards():
+            with use_shard(alias):
+                ids = list(orphaned_accounts(batch_size=batch_size))
+            for account_id in ids:
+                self.stdout.write(f"[{alias}] {account_id}")
+            total += len(ids)
+        if total:
+            raise CommandError(f"사용자 없는 계좌 {total}개")
+        self.stdout.write(self.style.SUCCESS("모든 계좌의 사용자가 존재합니다."))
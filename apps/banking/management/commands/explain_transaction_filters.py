@@ -0,0 +1,62 @@
+# apps/banking/management/commands/explain_transaction_filters.py
+from django.core.management.base import BaseCommand, CommandError
+from django.db import DEFAULT_DB_ALIAS, connections, transaction
+
+from config.sharding import ledger_db, ledger_shards, use_shard
+
+from ...query_plans import SHAPES, SUPPORTED_VENDORS, inspect_shape, seed, supported
+
+
+class _Rollback(Exception):
+    pass
+
+
+class Command(BaseCommand):
+    help = ("거래내역 목록 필터 조합마다 실행 계획을 보고 "
+            "순차 스캔/정렬/인덱스 밖 필터와 필요한 인덱스를 알려줍니다.")
+
+    def add_arguments(self, parser):
+        parser.add_argument("--users", type=int, default=200, help="임시 사용자 수")
+        parser.add_argument("--accounts", type=int, default=3, help="사용자당 계좌 수")
+        parser.add_argument("--rows", type=int, default=300, help="계좌당 거래 수")
+        parser.add_argument("--shape", action="append", choices=sorted(SHAPES),
+                            help="일부 조합만 (여러 번 지정)")
+        parser.add_argument("--shard", default=None, help="점검할 원장 샤드 (기본: 첫 샤드)")
+        parser.add_argument("--check", action="store_true", help="문제가 있으면 실패 종료 (CI 용)")
+
+    def handle(self, *args, users, accounts, rows, shape, shard, check, **options):
+        alias = shard or ledger_shards()[0]
+        if not supported(alias):
+            raise CommandError(
+                f"{alias}: {connections[alias].vendor} 실행 계획은 읽을 수 없습니다 "
+                f"(지원: {', '.join(SUPPORTED_VENDORS)})"
+            )
+        shapes = [SHAPES[name] for name in shape] if shape else list(SHAPES.values())
+        problems = 0
+        # 임시 데이터는 점검 후 롤백 (사용자는 default, 계좌/거래는 샤드)
+        try:
+            with use_shard(alias), transaction.atomic(using=DEFAULT_DB_ALIAS), \
+                    transaction.atomic(using=ledger_db()):
+                user, account = seed(users=users, accounts=accounts, rows=rows)
+                for s in shapes:
+                    report = inspect_shape(user, s, account_id=account.id)
+                    problems += len(report.problems)
+                    self._print(report)
+                raise _Rollback
+        except _Rollback:
+            pass
+        if check and problems:
+            raise CommandError(f"문제 {problems}건")
+        self.stdout.write(self.style.SUCCESS(f"완료: 조합 {len(shapes)}개, 문제 {problems}건"))
+
+    def _print(self, report):
+        mark = self.style.ERROR("✗") if report.problems else self.style.SUCCESS("✓")
+        indexes = ", ".join(sorted(report.indexes)) or "-"
+        self.stdout.write(f"{mark} {report.shape.name:<18} {indexes}")
+        for step in report.steps:
+            self.stdout.write(f"      {step.detail}")
+        for problem in report.problems:
+            self.stdout.write(self.style.WARNING(f"    ! {problem}"))
+        if report.suggestion is not None:
+            index = report.suggestion
+            self.stdout.write(f"    → models.Index(fields={index.fields!r}, name={index.name!r})")
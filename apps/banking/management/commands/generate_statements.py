@@ -0,0 +1,46 @@
+# apps/banking/management/commands/generate_statements.py
+from collections import Counter
+from itertools import repeat
+
+from django.core.management.base import BaseCommand, CommandError
+from django.utils import timezone
+
+from config.process_pool import worker_pool
+from config.sharding import ledger_shards, use_shard
+
+from ...archive import month_start, next_month
+from ...models import Account
+from ...statements import build_statement, last_closed_month, parse_month
+
+
+class Command(BaseCommand):
+    help = ("끝난 달의 계좌별 거래명세서를 워커 프로세스에서 만들어 저장합니다 "
+            "(이미 있는 명세서는 건너뜀).")
+
+    def add_arguments(self, parser):
+        parser.add_argument("--month", help="YYYY-MM (기본: 지난달)")
+        parser.add_argument("--workers", type=int, default=4,
+                            help="워커 프로세스 수 (1 이하: 현재 프로세스)")
+        parser.add_argument("--chunksize", type=int, default=20, help="워커에 한 번에 넘길 계좌 수")
+
+    def handle(self, *args, month, workers, chunksize, **options):
+        start = parse_month(month) if month else last_closed_month()
+        if start >= month_start(timezone.now()):
+            raise CommandError("아직 끝나지 않은 달입니다.")
+        label = f"{start:%Y-%m}"
+        totals = Counter()
+        with worker_pool(workers) as pool:
+            for alias in ledger_shards():
+                with use_shard(alias):
+                    ids = list(
+                        Account.objects
+                        .filter(created_at__lt=next_month(start), deleted_at__isnull=True)
+                        .exclude(statements__month=start.date())
+                        .values_list("id", flat=True)
+                    )
+                results = Counter(pool.map(
+                    build_statement, ids, repeat(label), repeat(alias), chunksize=chunksize
+                ))
+                totals.update(results)
+                self.stdout.write(f"[{alias}] {label}: {dict(results)}")
+        self.stdout.write(self.style.SUCCESS(f"완료: {dict(totals)}"))
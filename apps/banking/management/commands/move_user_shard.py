@@ -0,0 +1,22 @@
+# apps/banking/management/commands/move_user_shard.py
+from django.core.management.base import BaseCommand, CommandError
+
+from ...shards import locate_user, move_user
+
+
+class Command(BaseCommand):
+    help = "사용자의 원장 데이터(계좌/거래/예약/접수)를 다른 샤드로 온라인 이동합니다."
+
+    def add_arguments(self, parser):
+        parser.add_argument("user_id")
+        parser.add_argument("target", help="대상 DB alias (LEDGER_SHARDS 중 하나)")
+        parser.add_argument("--batch-size", type=int, default=1000)
+
+    def handle(self, *args, user_id, target, batch_size, **options):
+        source, _ = locate_user(user_id, fresh=True)
+        self.stdout.write(f"{user_id}: {source} → {target}")
+        try:
+            move_user(user_id, target, batch_size=batch_size, log=self.stdout.write)
+        except ValueError as e:
+            raise CommandError(str(e)) from e
+        self.stdout.write(self.style.SUCCESS("완료"))
@@ -0,0 +1,22 @@
+# apps/banking/management/commands/prune_outbox.py
+from datetime import timedelta
+
+from django.core.management.base import BaseCommand
+
+from config.sharding import ledger_shards, use_shard
+
+from ...outbox import prune
+
+
+class Command(BaseCommand):
+    help = "모든 소비자가 처리한 오래된 outbox 이벤트를 배치 단위로 삭제합니다."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--keep-days", type=int, default=7)
+        parser.add_argument("--batch-size", type=int, default=10_000)
+
+    def handle(self, *args, keep_days, batch_size, **options):
+        for alias in ledger_shards():
+            with use_shard(alias):
+                deleted = prune(keep=timedelta(days=keep_days), batch_size=batch_size)
+            self.stdout.write(self.style.SUCCESS(f"[{alias}] outbox 이벤트 {deleted}건 삭제"))
@@ -0,0 +1,39 @@
+# apps/banking/management/commands/purge_deleted.py
+import time
+import uuid
+from collections import Counter
+
+from django.core.management.base import BaseCommand
+from django.db import close_old_connections
+
+from ...purge import claim_jobs, run_job
+
+
+class Command(BaseCommand):
+    help = "삭제 요청된 사용자/계좌의 하위 데이터를 배치 단위로 지우고 대상 행을 삭제합니다."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--batch-size", type=int, default=5000,
+                            help="DELETE 한 번에 지울 최대 행 수")
+        parser.add_argument("--jobs", type=int, default=10, help="한 번에 선점할 작업 수")
+        parser.add_argument("--pause", type=float, default=0.0, help="배치 사이 대기(초)")
+        parser.add_argument("--loop", action="store_true", help="종료하지 않고 계속 폴링")
+        parser.add_argument("--interval", type=float, default=10.0,
+                            help="대기 시간(초), --loop 일 때")
+
+    def handle(self, *args, batch_size, jobs, pause, loop, interval, **options):
+        worker_id = uuid.uuid4()
+        totals = Counter()
+        while True:
+            ids = claim_jobs(worker_id=worker_id, limit=jobs)
+            for job_id in ids:
+                outcome = run_job(job_id, worker_id, batch_size=batch_size, pause=pause)
+                totals[outcome] += 1
+                self.stdout.write(f"{job_id}: {outcome}")
+            if len(ids) == jobs:
+                continue  # 밀린 작업이 남아 있으면 바로 다음 배치
+            if not loop:
+                break
+            close_old_connections()
+            time.sleep(interval)
+        self.stdout.write(self.style.SUCCESS(f"완료: {dict(totals)}"))
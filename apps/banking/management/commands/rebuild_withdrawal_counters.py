@@ -0,0 +1,64 @@
+# apps/banking/management/commands/rebuild_withdrawal_counters.py
+from collections import Counter
+from datetime import datetime, time, timedelta
+
+from django.core.management.base import BaseCommand
+from django.db.models import Count, Sum
+from django.db.models.functions import TruncDate
+from django.utils import timezone
+
+from config.sharding import ledger_atomic, ledger_shards, use_shard
+
+from ...models import Account, DailyWithdrawal, TransactionHistory
+
+
+@ledger_atomic
+def rebuild_account(account_id, since):
+    """
+    계좌를 잠그고 since(날짜) 이후 누적을 거래내역에서 다시 계산
+    → 진행 중인 출금과 엇갈리지 않음
+    """
+    Account.objects.select_for_update().filter(pk=account_id).first()
+    DailyWithdrawal.objects.filter(account_id=account_id, day__gte=since).delete()
+    start = timezone.make_aware(datetime.combine(since, time.min))
+    rows = (
+        TransactionHistory.objects
+        .filter(account_id=account_id, io_type="WITHDRAW", created_at__gte=start)
+        .annotate(day=TruncDate("created_at"))   # 현재 TIME_ZONE 기준 날짜
+        .values("day", "method")
+        .annotate(total=Sum("amount"), n=Count("id"))
+        .order_by()
+    )
+    counters = [
+        DailyWithdrawal(
+            account_id=account_id, day=r["day"], method=r["method"], amount=r["total"], count=r["n"]
+        )
+        for r in rows
+    ]
+    DailyWithdrawal.objects.bulk_create(counters)
+    return len(counters)
+
+
+class Command(BaseCommand):
+    help = "출금 한도 누적(account_daily_withdrawals)을 거래내역에서 다시 계산합니다."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--days", type=int, default=1,
+                            help="오늘 포함 최근 며칠 (기본 1: 오늘만)")
+
+    def handle(self, *args, days, **options):
+        since = timezone.localdate() - timedelta(days=max(days, 1) - 1)
+        start = timezone.make_aware(datetime.combine(since, time.min))
+        totals = Counter()
+        for alias in ledger_shards():
+            with use_shard(alias):
+                # 거래가 있었던 계좌 + 지워야 할 누적만 남은 계좌
+                ids = set(
+                    TransactionHistory.objects.filter(io_type="WITHDRAW", created_at__gte=start)
+                    .order_by().values_list("account_id", flat=True).distinct()
+                )
+                counted = DailyWithdrawal.objects.filter(day__gte=since)
+                ids.update(counted.values_list("account_id", flat=True))
+                for account_id in sorted(ids):
+                    totals.update(accounts=1, rows=rebuild_account(account_id, since))
+        self.stdout.write(self.style.SUCCESS(f"완료: {dict(totals)}"))
@@ -0,0 +1,49 @@
+# apps/banking/management/commands/run_standing_orders.py
+import time
+import uuid
+from collections import Counter
+from itertools import repeat
+
+from django.core.management.base import BaseCommand
+from django.db import close_old_connections
+
+from config.process_pool import worker_pool
+from config.sharding import ledger_shards, use_shard
+
+from ...standing_orders import claim_due_orders, execute_order
+
+
+class Command(BaseCommand):
+    help = "도래한 예약 이체를 배치로 선점(SKIP LOCKED)해 워커 프로세스에서 실행합니다."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--batch-size", type=int, default=100)
+        parser.add_argument("--workers", type=int, default=4,
+                            help="워커 프로세스 수 (1 이하: 현재 프로세스)")
+        parser.add_argument("--loop", action="store_true", help="종료하지 않고 계속 폴링")
+        parser.add_argument("--interval", type=float, default=10.0,
+                            help="대기 시간(초), --loop 일 때")
+
+    def handle(self, *args, batch_size, workers, loop, interval, **options):
+        executor_id = uuid.uuid4()
+        totals = Counter()
+        with worker_pool(workers) as pool:
+            while True:
+                backlog = False
+                for alias in ledger_shards():
+                    with use_shard(alias):
+                        ids = claim_due_orders(executor_id=executor_id, batch_size=batch_size)
+                    if ids:
+                        results = Counter(
+                            pool.map(execute_order, ids, repeat(executor_id), repeat(alias))
+                        )
+                        totals.update(results)
+                        self.stdout.write(f"[{alias}] {len(ids)}건 처리: {dict(results)}")
+                        backlog = backlog or len(ids) == batch_size
+                if backlog:
+                    continue  # 밀린 회차가 남아 있으면 바로 다음 배치
+                if not loop:
+                    break
+                close_old_connections()
+                time.sleep(interval)
+        self.stdout.write(self.style.SUCCESS(f"완료: {dict(totals)}"))
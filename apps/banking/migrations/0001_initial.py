@@ -26,7 +26,9 @@ class Migration(migrations.Migration):
                 ('balance', models.DecimalField(decimal_places=2, default=0, max_digits=18)),
                 ('created_at', models.DateTimeField(default=django.utils.timezone.now)),
                 ('updated_at', models.DateTimeField(auto_now=True)),
-                ('user', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='accounts', to=settings.AUTH_USER_MODEL)),
+                # 원장 샤드 DB 에는 users 테이블이 없으므로(ShardRouter.allow_migrate) 처음부터 DB 제약 없이 만든다.
+                # (0010 의 AlterField 는 이 제약을 이미 만든 기존 default DB 에서만 실제로 제약을 지움)
+                ('user', models.ForeignKey(db_constraint=False, on_delete=django.db.models.deletion.CASCADE, related_name='accounts', to=settings.AUTH_USER_MODEL)),
             ],
             options={
                 'db_table': 'accounts',
@@ -0,0 +1,27 @@
+# Generated by Django 5.2.7 on 2026-10-19 14:27
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('banking', '0004_alter_account_options_and_more'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='account',
+            index=models.Index(fields=['account_number'], name='idx_acct_number', opclasses=['varchar_pattern_ops']),
+        ),
+        migrations.AddIndex(
+            model_name='account',
+            index=models.Index(fields=['-created_at'], name='idx_acct_created'),
+        ),
+        migrations.AddIndex(
+            model_name='transactionhistory',
+            index=models.Index(fields=['-created_at'], name='idx_txn_created'),
+        ),
+    ]
@@ -0,0 +1,46 @@
+# Generated by Django 5.2.7 on 2026-10-19 14:28
+
+import django.db.models.deletion
+import django.utils.timezone
+import uuid
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('banking', '0005_admin_large_table_indexes'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='StandingOrder',
+            fields=[
+                ('id', models.UUIDField(default=uuid.uuid4, editable=False, primary_key=True, serialize=False)),
+                ('amount', models.DecimalField(decimal_places=2, max_digits=18)),
+                ('io_type', models.CharField(choices=[('DEPOSIT', '입금'), ('WITHDRAW', '출금')], max_length=10)),
+                ('method', models.CharField(choices=[('CASH', '현금'), ('TRANSFER', '계좌 이체'), ('AUTO', '자동 이체'), ('CARD', '카드 결제'), ('ETC', '기타')], default='AUTO', max_length=16)),
+                ('description', models.CharField(blank=True, default='', max_length=255)),
+                ('interval', models.CharField(choices=[('DAILY', '매일'), ('WEEKLY', '매주'), ('MONTHLY', '매월')], default='MONTHLY', max_length=10)),
+                ('start_at', models.DateTimeField(default=django.utils.timezone.now)),
+                ('end_at', models.DateTimeField(blank=True, null=True)),
+                ('next_run_at', models.DateTimeField(blank=True)),
+                ('due_at', models.DateTimeField(blank=True)),
+                ('status', models.CharField(choices=[('ACTIVE', '활성'), ('PAUSED', '일시 정지'), ('ENDED', '종료')], default='ACTIVE', max_length=10)),
+                ('attempts', models.PositiveIntegerField(default=0)),
+                ('max_attempts', models.PositiveIntegerField(default=3)),
+                ('last_error', models.CharField(blank=True, default='', max_length=255)),
+                ('last_run_at', models.DateTimeField(blank=True, null=True)),
+                ('claimed_by', models.UUIDField(blank=True, null=True)),
+                ('claimed_until', models.DateTimeField(blank=True, null=True)),
+                ('created_at', models.DateTimeField(default=django.utils.timezone.now)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('account', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='standing_orders', to='banking.account')),
+            ],
+            options={
+                'db_table': 'standing_orders',
+                'ordering': ('next_run_at',),
+                'indexes': [models.Index(fields=['status', 'due_at'], name='idx_so_status_due')],
+            },
+        ),
+    ]
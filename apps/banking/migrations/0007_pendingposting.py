@@ -0,0 +1,38 @@
+# Generated by Django 5.2.7 on 2026-10-19 14:30
+
+import django.db.models.deletion
+import django.utils.timezone
+import uuid
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('banking', '0006_standingorder'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='PendingPosting',
+            fields=[
+                ('seq', models.BigAutoField(primary_key=True, serialize=False)),
+                ('handle', models.UUIDField(default=uuid.uuid4, editable=False, unique=True)),
+                ('amount', models.DecimalField(decimal_places=2, max_digits=18)),
+                ('io_type', models.CharField(choices=[('DEPOSIT', '입금'), ('WITHDRAW', '출금')], max_length=10)),
+                ('method', models.CharField(choices=[('CASH', '현금'), ('TRANSFER', '계좌 이체'), ('AUTO', '자동 이체'), ('CARD', '카드 결제'), ('ETC', '기타')], default='TRANSFER', max_length=16)),
+                ('description', models.CharField(blank=True, default='', max_length=255)),
+                ('status', models.CharField(choices=[('PENDING', '대기'), ('APPLIED', '반영'), ('REJECTED', '거절')], default='PENDING', max_length=10)),
+                ('error', models.CharField(blank=True, default='', max_length=255)),
+                ('created_at', models.DateTimeField(default=django.utils.timezone.now)),
+                ('applied_at', models.DateTimeField(blank=True, null=True)),
+                ('account', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='pending_postings', to='banking.account')),
+                ('transaction_history', models.OneToOneField(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='posting', to='banking.transactionhistory')),
+            ],
+            options={
+                'db_table': 'pending_postings',
+                'ordering': ('seq',),
+                'indexes': [models.Index(condition=models.Q(('status', 'PENDING')), fields=['account', 'seq'], name='idx_posting_pending')],
+            },
+        ),
+    ]
@@ -0,0 +1,41 @@
+# Generated by Django 5.2.7 on 2026-10-19 14:41
+
+import django.utils.timezone
+import uuid
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('banking', '0008_outbox'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='account',
+            name='deleted_at',
+            field=models.DateTimeField(blank=True, null=True),
+        ),
+        migrations.CreateModel(
+            name='PurgeJob',
+            fields=[
+                ('id', models.UUIDField(default=uuid.uuid4, editable=False, primary_key=True, serialize=False)),
+                ('target_type', models.CharField(choices=[('USER', '사용자'), ('ACCOUNT', '계좌')], max_length=10)),
+                ('target_id', models.UUIDField()),
+                ('status', models.CharField(choices=[('PENDING', '대기'), ('RUNNING', '진행 중'), ('DONE', '완료'), ('FAILED', '실패')], default='PENDING', max_length=10)),
+                ('progress', models.JSONField(blank=True, default=dict)),
+                ('claimed_by', models.UUIDField(blank=True, null=True)),
+                ('claimed_until', models.DateTimeField(blank=True, null=True)),
+                ('last_error', models.CharField(blank=True, default='', max_length=255)),
+                ('created_at', models.DateTimeField(default=django.utils.timezone.now)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('finished_at', models.DateTimeField(blank=True, null=True)),
+            ],
+            options={
+                'db_table': 'purge_jobs',
+                'ordering': ('created_at',),
+                'indexes': [models.Index(fields=['status', 'created_at'], name='idx_purge_status_created')],
+            },
+        ),
+    ]
@@ -0,0 +1,41 @@
+# Generated by Django 5.2.7 on 2026-10-19 14:46
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('banking', '0009_purge_jobs'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='UserShard',
+            fields=[
+                ('user_id', models.UUIDField(primary_key=True, serialize=False)),
+                ('alias', models.CharField(max_length=32)),
+                ('moving', models.BooleanField(default=False)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+            ],
+            options={
+                'db_table': 'user_shards',
+            },
+        ),
+        migrations.AddField(
+            model_name='purgejob',
+            name='shard',
+            field=models.CharField(default='default', max_length=32),
+        ),
+        # 계좌(샤드 DB) → 사용자(default) 는 DB 를 넘나드는 참조라 FK 제약을 둘 수 없다.
+        # 단일 DB 배포도 같은 스키마를 써야 나중에 샤드를 켤 때 move_user 로 옮길 수 있으므로 제약을 뺀다.
+        # 정합성은 PurgeJob(계좌 먼저 삭제)과 check_account_owners 명령으로 점검한다.
+        migrations.AlterField(
+            model_name='account',
+            name='user',
+            field=models.ForeignKey(db_constraint=False, on_delete=django.db.models.deletion.CASCADE, related_name='accounts', to=settings.AUTH_USER_MODEL),
+        ),
+    ]
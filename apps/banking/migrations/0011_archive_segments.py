@@ -0,0 +1,33 @@
+# Generated by Django 5.2.7 on 2026-10-19 14:47
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('banking', '0010_user_shards'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ArchiveSegment',
+            fields=[
+                ('id', models.BigAutoField(primary_key=True, serialize=False)),
+                ('month', models.DateField()),
+                ('path', models.CharField(max_length=255)),
+                ('row_count', models.PositiveIntegerField()),
+                ('min_created_at', models.DateTimeField()),
+                ('max_created_at', models.DateTimeField()),
+                ('closing_balance', models.DecimalField(decimal_places=2, max_digits=18)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('account', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='archive_segments', to='banking.account')),
+            ],
+            options={
+                'db_table': 'transaction_archive_segments',
+                'ordering': ('account', 'month'),
+                'constraints': [models.UniqueConstraint(fields=('account', 'month'), name='uq_archive_acct_month')],
+            },
+        ),
+    ]
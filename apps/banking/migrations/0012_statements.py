@@ -0,0 +1,34 @@
+# Generated by Django 5.2.7 on 2026-10-19 14:49
+
+import django.core.serializers.json
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('banking', '0011_archive_segments'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='Statement',
+            fields=[
+                ('id', models.BigAutoField(primary_key=True, serialize=False)),
+                ('month', models.DateField()),
+                ('opening_balance', models.DecimalField(decimal_places=2, max_digits=18)),
+                ('closing_balance', models.DecimalField(decimal_places=2, max_digits=18)),
+                ('totals', models.JSONField(default=dict, encoder=django.core.serializers.json.DjangoJSONEncoder)),
+                ('line_count', models.PositiveIntegerField(default=0)),
+                ('path', models.CharField(max_length=255)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('account', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='statements', to='banking.account')),
+            ],
+            options={
+                'db_table': 'account_statements',
+                'ordering': ('account', '-month'),
+                'constraints': [models.UniqueConstraint(fields=('account', 'month'), name='uq_statement_acct_month')],
+            },
+        ),
+    ]
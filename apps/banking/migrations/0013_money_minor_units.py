@@ -0,0 +1,28 @@
+# Generated by Django 5.2.7 on 2026-10-19 14:52
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('banking', '0012_statements'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='account',
+            name='balance_minor',
+            field=models.BigIntegerField(blank=True, editable=False, null=True),
+        ),
+        migrations.AddField(
+            model_name='transactionhistory',
+            name='amount_minor',
+            field=models.BigIntegerField(blank=True, editable=False, null=True),
+        ),
+        migrations.AddField(
+            model_name='transactionhistory',
+            name='balance_after_minor',
+            field=models.BigIntegerField(blank=True, editable=False, null=True),
+        ),
+    ]
@@ -0,0 +1,24 @@
+# Generated by Django 5.2.7 on 2026-10-19 14:54
+
+import config.ids
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('banking', '0013_money_minor_units'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='account',
+            name='id',
+            field=models.UUIDField(default=config.ids.uuid7, editable=False, primary_key=True, serialize=False),
+        ),
+        migrations.AlterField(
+            model_name='transactionhistory',
+            name='id',
+            field=models.UUIDField(default=config.ids.uuid7, editable=False, primary_key=True, serialize=False),
+        ),
+    ]
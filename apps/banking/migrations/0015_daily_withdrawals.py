@@ -0,0 +1,31 @@
+# Generated by Django 5.2.7 on 2026-10-19 14:59
+
+import django.db.models.deletion
+from decimal import Decimal
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('banking', '0014_uuid7_pks'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='DailyWithdrawal',
+            fields=[
+                ('id', models.BigAutoField(primary_key=True, serialize=False)),
+                ('day', models.DateField()),
+                ('method', models.CharField(choices=[('CASH', '현금'), ('TRANSFER', '계좌 이체'), ('AUTO', '자동 이체'), ('CARD', '카드 결제'), ('ETC', '기타')], max_length=16)),
+                ('amount', models.DecimalField(decimal_places=2, default=Decimal('0.00'), max_digits=18)),
+                ('count', models.PositiveIntegerField(default=0)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('account', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='daily_withdrawals', to='banking.account')),
+            ],
+            options={
+                'db_table': 'account_daily_withdrawals',
+                'constraints': [models.UniqueConstraint(fields=('account', 'day', 'method'), name='uq_withdrawal_acct_day_method')],
+            },
+        ),
+    ]
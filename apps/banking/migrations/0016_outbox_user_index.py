@@ -0,0 +1,17 @@
+# Generated by Django 5.2.7 on 2026-10-19 15:01
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('banking', '0015_daily_withdrawals'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='outboxevent',
+            index=models.Index(fields=['user_id', 'id'], name='idx_outbox_user_id'),
+        ),
+    ]
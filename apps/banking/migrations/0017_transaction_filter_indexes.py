@@ -0,0 +1,37 @@
+# Generated by Django 5.2.7 on 2026-10-19 15:05
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('banking', '0016_outbox_user_index'),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='transactionhistory',
+            name='idx_txn_acct_created',
+        ),
+        migrations.RemoveIndex(
+            model_name='transactionhistory',
+            name='idx_txn_acct_io',
+        ),
+        migrations.AddIndex(
+            model_name='transactionhistory',
+            index=models.Index(fields=['account', '-created_at', '-id'], name='idx_txn_acct_created'),
+        ),
+        migrations.AddIndex(
+            model_name='transactionhistory',
+            index=models.Index(fields=['account', 'io_type', '-created_at', '-id'], name='idx_txn_acct_io'),
+        ),
+        migrations.AddIndex(
+            model_name='transactionhistory',
+            index=models.Index(fields=['account', 'method', '-created_at', '-id'], name='idx_txn_acct_method_created'),
+        ),
+        migrations.AddIndex(
+            model_name='transactionhistory',
+            index=models.Index(fields=['account', 'amount'], name='idx_txn_acct_amount'),
+        ),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 5.2.7 on 2026-10-19 15:31
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('banking', '0017_transaction_filter_indexes'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='outboxconsumer',
+            name='gaps',
+            field=models.JSONField(blank=True, default=dict),
+        ),
+    ]
@@ -1,12 +1,19 @@
 # apps/banking/models.py
+import calendar
 import uuid
+from datetime import timedelta
 from decimal import Decimal
 
 from django.conf import settings
 from django.core.exceptions import ValidationError
-from django.db import models, transaction
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db import models, router, transaction
 from django.utils import timezone
 
+from config.ids import uuid7
+
+from .money import dual_write, to_minor
+
 
 # ---- CHOICES ----
 BANK_CODES = [
@@ -41,6 +48,36 @@ TRANSACTION_METHOD = [
     ("ETC", "기타"),
 ]
 
+POSTING_STATUS = [
+    ("PENDING", "대기"),
+    ("APPLIED", "반영"),
+    ("REJECTED", "거절"),
+]
+
+PURGE_TARGETS = [
+    ("USER", "사용자"),
+    ("ACCOUNT", "계좌"),
+]
+
+PURGE_STATUS = [
+    ("PENDING", "대기"),
+    ("RUNNING", "진행 중"),
+    ("DONE", "완료"),
+    ("FAILED", "실패"),
+]
+
+STANDING_ORDER_INTERVALS = [
+    ("DAILY", "매일"),
+    ("WEEKLY", "매주"),
+    ("MONTHLY", "매월"),
+]
+
+STANDING_ORDER_STATUS = [
+    ("ACTIVE", "활성"),
+    ("PAUSED", "일시 정지"),
+    ("ENDED", "종료"),
+]
+
 
 class Account(models.Model):
     """
@@ -48,15 +85,27 @@ class Account(models.Model):
     - 유저(FK), 계좌번호, 은행코드, 계좌종류, 잔액, 생성/수정시각
     - (user, bank_code, account_number) 조합 유니크 → 한 유저가 같은 계좌를 중복 등록 불가
     """
-    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
-    user = models.ForeignKey(settings.AUTH_USER_MODEL, on_delete=models.CASCADE, related_name="accounts")
+    id = models.UUIDField(primary_key=True, default=uuid7, editable=False)
+    # 샤딩 시 계좌는 사용자 샤드 DB, 사용자는 default 에 있으므로 DB 수준 FK 제약은 두지 않음
+    # (샤드를 나중에 켜도 마이그레이션 없이 옮길 수 있도록 샤딩 여부와 관계없이 동일)
+    # 사용자 삭제는 PurgeJob 이 계좌부터 지우고,
+    # 우회 경로로 생긴 고아 계좌는 check_account_owners 로 점검
+    user = models.ForeignKey(
+        settings.AUTH_USER_MODEL, on_delete=models.CASCADE, related_name="accounts",
+        db_constraint=False,
+    )
     account_number = models.CharField(max_length=32)  # 하이픈 제거 저장 권장
     bank_code = models.CharField(max_length=16, choices=BANK_CODES)
     account_type = models.CharField(max_length=16, choices=ACCOUNT_TYPES, default="DEMAND")
     balance = models.DecimalField(max_digits=18, decimal_places=2, default=Decimal("0.00"))
+    # 최소 단위(원/센트) 정수 사본 — MONEY_STORAGE["MODE"] 가 dual/minor 일 때 함께 기록
+    # (apps/banking/money.py)
+    balance_minor = models.BigIntegerField(blank=True, null=True, editable=False)
 
     created_at = models.DateTimeField(default=timezone.now)
     updated_at = models.DateTimeField(auto_now=True)
+    # 삭제 요청 시각: 설정되면 API 에서 제외되고 purge_deleted 워커가 하위 데이터부터 배치 삭제
+    deleted_at = models.DateTimeField(blank=True, null=True)
 
     class Meta:
         db_table = "accounts"
@@ -68,6 +117,10 @@ class Account(models.Model):
         ]
         indexes = [
             models.Index(fields=["user", "-created_at"], name="idx_acct_user_created"),
+            # 어드민 대용량 모드: 계좌번호 접두사 검색(LIKE 'x%'), 생성일 필터
+            models.Index(fields=["account_number"], name="idx_acct_number",
+                         opclasses=["varchar_pattern_ops"]),
+            models.Index(fields=["-created_at"], name="idx_acct_created"),
         ]
         ordering = ("-created_at",)
 
@@ -80,7 +133,7 @@ class Account(models.Model):
             return
 
         # 기존 레코드와 비교하여 불변 필드가 변경되면 막기
-        old = Account.objects.get(pk=self.pk)
+        old = Account.objects.using(self._state.db).get(pk=self.pk)
         immutable_changed = (
             old.bank_code != self.bank_code
             or old.account_number != self.account_number
@@ -92,9 +145,13 @@ class Account(models.Model):
     def save(self, *args, **kwargs):
         # 필드/비즈니스 검증 수행 (clean() 포함)
         self.full_clean()
+        if dual_write():
+            self.balance_minor = to_minor(self.balance)
+            update_fields = kwargs.get("update_fields")
+            if update_fields is not None and "balance" in update_fields:
+                kwargs["update_fields"] = [*update_fields, "balance_minor"]
         return super().save(*args, **kwargs)
 
-    @transaction.atomic
     def apply_transaction(
         self,
         *,
@@ -109,7 +166,13 @@ class Account(models.Model):
         - 자기 계좌 행을 select_for_update로 잠금
         - 금액은 양수로 가정(입금/출금은 io_type으로 구분)
         - 잔액 갱신 + 거래 레코드 생성
+        - 계좌가 속한 DB(샤드)의 트랜잭션 하나로 처리
         """
+        db = router.db_for_write(Account, instance=self)
+        with transaction.atomic(using=db):
+            return self._apply_transaction(db, amount, io_type, method, description, when)
+
+    def _apply_transaction(self, db, amount, io_type, method, description, when):
         if amount <= 0:
             raise ValidationError("거래 금액은 0보다 커야 합니다.")
         if io_type not in dict(TRANSACTION_IO):
@@ -117,25 +180,40 @@ class Account(models.Model):
         if method not in dict(TRANSACTION_METHOD):
             raise ValidationError("허용되지 않는 거래 타입입니다.")
 
+        from .limits import WithdrawalCounter
+        from .live import notify
+
         # 🔒 동시성 잠금 후 최신 잔액 기준으로 처리
-        acc = Account.objects.select_for_update().get(pk=self.pk)
+        acc = Account.objects.using(db).select_for_update().get(pk=self.pk)
+        # 시각은 잠금을 얻은 뒤에: (created_at, id) 순서 = 잠금 순서 = balance_after 체인 순서
+        when = when or timezone.now()
 
-        if io_type == "WITHDRAW" and acc.balance < amount:
-            raise ValidationError("잔액 부족")
+        if io_type == "WITHDRAW":
+            if acc.balance < amount:
+                raise ValidationError("잔액 부족")
+            # 출금 한도: 같은 잠금 안에서 오늘 누적 행 하나만 읽고 더함 (거래내역 SUM 없음)
+            counter = WithdrawalCounter(acc.pk, timezone.localdate(when), using=db)
+            reason = counter.charge(method, amount)
+            if reason:
+                raise ValidationError(reason)
+            counter.save()
 
         new_balance = acc.balance + amount if io_type == "DEPOSIT" else acc.balance - amount
         acc.balance = new_balance
         acc.save(update_fields=["balance", "updated_at"])
 
-        txn = TransactionHistory.objects.create(
+        txn = TransactionHistory.objects.using(db).create(
             account=acc,
             amount=amount,
             balance_after=new_balance,
             description=description or "",
             io_type=io_type,
             method=method,
-            created_at=when or timezone.now(),
+            created_at=when,
         )
+        # 같은 트랜잭션에서 변경 피드(outbox) 기록 → 커밋된 거래만 하위 시스템에 전달
+        OutboxEvent.for_transaction(txn, user_id=acc.user_id).save(using=db)
+        notify(acc.user_id, using=db)   # 커밋되면 SSE 구독자에게
         return txn
 
 
@@ -144,7 +222,7 @@ class TransactionHistory(models.Model):
     transaction_history 테이블
     - 계좌(FK), 거래금액, 거래 후 잔액, 설명, 입출금 타입, 거래 타입, 거래일시
     """
-    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    id = models.UUIDField(primary_key=True, default=uuid7, editable=False)
     account = models.ForeignKey(Account, on_delete=models.CASCADE, related_name="transactions")
     amount = models.DecimalField(max_digits=18, decimal_places=2)         # 양수
     balance_after = models.DecimalField(max_digits=18, decimal_places=2)  # 거래 직후 잔액
@@ -152,15 +230,344 @@ class TransactionHistory(models.Model):
     io_type = models.CharField(max_length=10, choices=TRANSACTION_IO)
     method = models.CharField(max_length=16, choices=TRANSACTION_METHOD, default="TRANSFER")
     created_at = models.DateTimeField(default=timezone.now)
+    amount_minor = models.BigIntegerField(blank=True, null=True, editable=False)
+    balance_after_minor = models.BigIntegerField(blank=True, null=True, editable=False)
 
     class Meta:
         db_table = "transaction_history"
         indexes = [
-            models.Index(fields=["account", "-created_at"], name="idx_txn_acct_created"),
-            models.Index(fields=["account", "io_type"], name="idx_txn_acct_io"),
+            # 계좌별 목록/필터: 같음(=) 조건 뒤에 (-created_at, -id) → 정렬 없이 최신순
+            # (apps/banking/query_plans.py)
+            models.Index(fields=["account", "-created_at", "-id"], name="idx_txn_acct_created"),
+            models.Index(fields=["account", "io_type", "-created_at", "-id"],
+                         name="idx_txn_acct_io"),
+            models.Index(fields=["account", "method", "-created_at", "-id"],
+                         name="idx_txn_acct_method_created"),
+            models.Index(fields=["account", "amount"], name="idx_txn_acct_amount"),
+            # 계좌 무관 기간 조회(어드민 created_at 필터/키셋 페이징)
+            models.Index(fields=["-created_at"], name="idx_txn_created"),
         ]
         ordering = ("-created_at",)
 
+    def save(self, *args, **kwargs):
+        if dual_write():
+            self.set_minor_units()
+        return super().save(*args, **kwargs)
+
+    def set_minor_units(self):
+        """bulk_create 처럼 save() 를 거치지 않는 경로는 직접 호출"""
+        self.amount_minor = to_minor(self.amount)
+        self.balance_after_minor = to_minor(self.balance_after)
+        return self
+
     def __str__(self):
         sign = "+" if self.io_type == "DEPOSIT" else "-"
         return f"{self.account_id} {sign}{self.amount} @ {self.created_at:%F %T}"
+
+
+class DailyWithdrawal(models.Model):
+    """
+    account_daily_withdrawals 테이블 (계좌 × 날짜 × 거래타입별 출금 누적)
+    - 출금 시 계좌 잠금 안에서 함께 갱신 → 일일 한도 검사는 이 행 하나 (apps/banking/limits.py)
+    - 날짜는 TIME_ZONE 기준. 어긋나면 `manage.py rebuild_withdrawal_counters`
+    """
+    id = models.BigAutoField(primary_key=True)
+    account = models.ForeignKey(Account, on_delete=models.CASCADE, related_name="daily_withdrawals")
+    day = models.DateField()
+    method = models.CharField(max_length=16, choices=TRANSACTION_METHOD)
+    amount = models.DecimalField(max_digits=18, decimal_places=2, default=Decimal("0.00"))
+    count = models.PositiveIntegerField(default=0)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        db_table = "account_daily_withdrawals"
+        constraints = [
+            models.UniqueConstraint(fields=["account", "day", "method"],
+                                    name="uq_withdrawal_acct_day_method"),
+        ]
+
+    def __str__(self):
+        return f"{self.account_id} {self.day} {self.method} -{self.amount} ({self.count})"
+
+
+class ArchiveSegment(models.Model):
+    """
+    transaction_archive_segments 테이블 (오래된 거래내역 보관 파일 목록)
+    - 계좌 × 월 하나당 gzip JSONL 파일 하나 (apps/banking/archive.py)
+    - min/max_created_at 로 조회 범위와 겹치는 파일만 연다 → 최근 범위 조회는 파일을 읽지 않음
+    - closing_balance: 그 달 마지막 거래의 balance_after
+    """
+    id = models.BigAutoField(primary_key=True)
+    account = models.ForeignKey(Account, on_delete=models.CASCADE, related_name="archive_segments")
+    month = models.DateField()                  # 해당 월 1일
+    path = models.CharField(max_length=255)     # 보관 스토리지 안의 경로
+    row_count = models.PositiveIntegerField()
+    min_created_at = models.DateTimeField()
+    max_created_at = models.DateTimeField()
+    closing_balance = models.DecimalField(max_digits=18, decimal_places=2)
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        db_table = "transaction_archive_segments"
+        constraints = [
+            models.UniqueConstraint(fields=["account", "month"], name="uq_archive_acct_month"),
+        ]
+        ordering = ("account", "month")
+
+    def __str__(self):
+        return f"{self.account_id} {self.month:%Y-%m} ({self.row_count})"
+
+
+class Statement(models.Model):
+    """
+    account_statements 테이블 (월별 거래명세서, 월이 끝난 뒤 한 번 생성 — 이후 변경하지 않음)
+    - 파일(JSON)은 STORAGES[STATEMENTS["STORAGE"]] 에, 이 행은 목록 + 잔액 체크포인트
+    - opening/closing_balance: 그 달 시작/끝 잔액 → balance_at 이 이전 달을 훑지 않게
+    """
+    id = models.BigAutoField(primary_key=True)
+    account = models.ForeignKey(Account, on_delete=models.CASCADE, related_name="statements")
+    month = models.DateField()                  # 해당 월 1일
+    opening_balance = models.DecimalField(max_digits=18, decimal_places=2)
+    closing_balance = models.DecimalField(max_digits=18, decimal_places=2)
+    totals = models.JSONField(default=dict, encoder=DjangoJSONEncoder)   # io_type/method 별 합계
+    line_count = models.PositiveIntegerField(default=0)
+    path = models.CharField(max_length=255)
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        db_table = "account_statements"
+        constraints = [
+            models.UniqueConstraint(fields=["account", "month"], name="uq_statement_acct_month"),
+        ]
+        ordering = ("account", "-month")
+
+    def __str__(self):
+        return f"{self.account_id} {self.month:%Y-%m}"
+
+
+class StandingOrder(models.Model):
+    """
+    standing_orders 테이블 (예약/자동 이체)
+    - 계좌(FK), 금액/입출금 타입/거래 타입, 주기(매일/매주/매월)
+    - next_run_at: 이번 회차 예정 시각, due_at: 실제 실행 가능 시각(재시도 백오프 반영)
+    - claimed_by/claimed_until: 실행기 임대(lease) → 여러 실행기가 같은 회차를 중복 실행하지 않음
+    """
+    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    account = models.ForeignKey(Account, on_delete=models.CASCADE, related_name="standing_orders")
+    amount = models.DecimalField(max_digits=18, decimal_places=2)
+    io_type = models.CharField(max_length=10, choices=TRANSACTION_IO)
+    method = models.CharField(max_length=16, choices=TRANSACTION_METHOD, default="AUTO")
+    description = models.CharField(max_length=255, blank=True, default="")
+    interval = models.CharField(max_length=10, choices=STANDING_ORDER_INTERVALS, default="MONTHLY")
+
+    start_at = models.DateTimeField(default=timezone.now)   # 주기 기준(매월 n일 등)
+    end_at = models.DateTimeField(blank=True, null=True)
+    next_run_at = models.DateTimeField(blank=True)   # 비우면 start_at
+    due_at = models.DateTimeField(blank=True)        # 비우면 next_run_at
+    status = models.CharField(max_length=10, choices=STANDING_ORDER_STATUS, default="ACTIVE")
+
+    attempts = models.PositiveIntegerField(default=0)       # 이번 회차 실패 횟수
+    max_attempts = models.PositiveIntegerField(default=3)
+    last_error = models.CharField(max_length=255, blank=True, default="")
+    last_run_at = models.DateTimeField(blank=True, null=True)
+
+    claimed_by = models.UUIDField(blank=True, null=True)
+    claimed_until = models.DateTimeField(blank=True, null=True)
+
+    created_at = models.DateTimeField(default=timezone.now)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        db_table = "standing_orders"
+        indexes = [
+            models.Index(fields=["status", "due_at"], name="idx_so_status_due"),
+        ]
+        ordering = ("next_run_at",)
+
+    def __str__(self):
+        return f"{self.account_id} {self.interval} {self.io_type} {self.amount}"
+
+    def save(self, *args, **kwargs):
+        if self.next_run_at is None:
+            self.next_run_at = self.start_at
+        if self.due_at is None:
+            self.due_at = self.next_run_at
+        return super().save(*args, **kwargs)
+
+    def following_run(self):
+        """다음 회차 시각. 매월은 시작일(start_at)의 '일'을 기준으로 말일 보정"""
+        current = self.next_run_at
+        if self.interval == "DAILY":
+            return current + timedelta(days=1)
+        if self.interval == "WEEKLY":
+            return current + timedelta(weeks=1)
+        year, month = divmod(current.month, 12)
+        year, month = current.year + year, month + 1
+        day = min(self.start_at.day, calendar.monthrange(year, month)[1])
+        return current.replace(year=year, month=month, day=day)
+
+
+class PendingPosting(models.Model):
+    """
+    pending_postings 테이블 (비동기 거래 접수 큐)
+    - seq: 접수 순서(자동 증가) → 같은 계좌 안에서는 seq 순서대로 반영
+    - handle: 클라이언트에게 돌려주는 조회 키(202 응답)
+    - 반영되면 transaction_history 에 연결, 잔액 부족 등은 REJECTED + error
+    """
+    seq = models.BigAutoField(primary_key=True)
+    handle = models.UUIDField(default=uuid.uuid4, unique=True, editable=False)
+    account = models.ForeignKey(Account, on_delete=models.CASCADE, related_name="pending_postings")
+    amount = models.DecimalField(max_digits=18, decimal_places=2)
+    io_type = models.CharField(max_length=10, choices=TRANSACTION_IO)
+    method = models.CharField(max_length=16, choices=TRANSACTION_METHOD, default="TRANSFER")
+    description = models.CharField(max_length=255, blank=True, default="")
+
+    status = models.CharField(max_length=10, choices=POSTING_STATUS, default="PENDING")
+    transaction_history = models.OneToOneField(
+        TransactionHistory, on_delete=models.SET_NULL, blank=True, null=True, related_name="posting"
+    )
+    error = models.CharField(max_length=255, blank=True, default="")
+    created_at = models.DateTimeField(default=timezone.now)
+    applied_at = models.DateTimeField(blank=True, null=True)
+
+    class Meta:
+        db_table = "pending_postings"
+        indexes = [
+            # 대기 중인 행만 담는 부분 인덱스 → 처리 완료 행이 쌓여도 작게 유지
+            models.Index(fields=["account", "seq"], name="idx_posting_pending",
+                         condition=models.Q(status="PENDING")),
+        ]
+        ordering = ("seq",)
+
+    def __str__(self):
+        return f"{self.handle} {self.status}"
+
+
+class OutboxEvent(models.Model):
+    """
+    ledger_outbox 테이블 (원장 변경 피드, append-only)
+    - id: 단조 증가 오프셋 → 소비자는 자기 오프셋 이후만 읽음
+    - 원장 변경과 같은 DB 트랜잭션에서 INSERT (롤백되면 이벤트도 없음)
+    """
+    id = models.BigAutoField(primary_key=True)
+    # transaction.posted / account.created / account.deleted
+    event_type = models.CharField(max_length=32)
+    user_id = models.UUIDField()
+    aggregate_id = models.UUIDField()              # 계좌 id
+    payload = models.JSONField(encoder=DjangoJSONEncoder)
+    created_at = models.DateTimeField(default=timezone.now)
+
+    class Meta:
+        db_table = "ledger_outbox"
+        indexes = [
+            # SSE 스트림: 사용자별 id 이후 이벤트 (재접속 시 Last-Event-ID 부터)
+            models.Index(fields=["user_id", "id"], name="idx_outbox_user_id"),
+        ]
+        ordering = ("id",)
+
+    def __str__(self):
+        return f"#{self.id} {self.event_type} {self.aggregate_id}"
+
+    @classmethod
+    def for_transaction(cls, txn, *, user_id):
+        return cls(
+            event_type="transaction.posted",
+            user_id=user_id,
+            aggregate_id=txn.account_id,
+            payload={
+                "transaction_id": txn.id,
+                "account_id": txn.account_id,
+                "amount": txn.amount,
+                "balance_after": txn.balance_after,
+                "io_type": txn.io_type,
+                "method": txn.method,
+                "description": txn.description,
+                "created_at": txn.created_at.isoformat(),   # µs 정밀도 유지
+            },
+        )
+
+    @classmethod
+    def for_account(cls, account, event_type):
+        return cls(
+            event_type=event_type,
+            user_id=account.user_id,
+            aggregate_id=account.id,
+            payload={
+                "account_id": account.id,
+                "bank_code": account.bank_code,
+                "account_number": account.account_number,
+                "account_type": account.account_type,
+                "balance": account.balance,
+            },
+        )
+
+
+class OutboxConsumer(models.Model):
+    """
+    ledger_outbox_consumers 테이블 (소비자별 오프셋)
+    - lease_token/lease_until: 같은 이름의 소비자 인스턴스가 여러 개여도
+      한 번에 하나만 배치를 가져감
+    """
+    name = models.CharField(max_length=64, primary_key=True)
+    last_offset = models.BigIntegerField(default=0)
+    # 오프셋 아래에서 아직 안 보인 id → 처음 발견한 시각(ISO)
+    # 늦게 커밋되면 다음 배치에서 전달 (apps/banking/outbox.py)
+    gaps = models.JSONField(default=dict, blank=True)
+    lease_token = models.UUIDField(blank=True, null=True)
+    lease_until = models.DateTimeField(blank=True, null=True)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        db_table = "ledger_outbox_consumers"
+
+    def __str__(self):
+        return f"{self.name}@{self.last_offset}"
+
+
+class PurgeJob(models.Model):
+    """
+    purge_jobs 테이블 (사용자/계좌 삭제 작업)
+    - 삭제 요청은 대상에 deleted_at 만 찍고 작업을 만든 뒤 202 응답
+    - purge_deleted 워커가 거래내역 등 하위 행을 배치 단위 DELETE 로 지우고 마지막에 대상 행 삭제
+    - progress: 테이블별 삭제 건수 (배치마다 갱신)
+    """
+    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    target_type = models.CharField(max_length=10, choices=PURGE_TARGETS)
+    target_id = models.UUIDField()
+    status = models.CharField(max_length=10, choices=PURGE_STATUS, default="PENDING")
+    progress = models.JSONField(default=dict, blank=True)
+    shard = models.CharField(max_length=32, default="default")   # 대상 원장 데이터가 있는 DB alias
+    claimed_by = models.UUIDField(blank=True, null=True)
+    claimed_until = models.DateTimeField(blank=True, null=True)
+    last_error = models.CharField(max_length=255, blank=True, default="")
+    created_at = models.DateTimeField(default=timezone.now)
+    updated_at = models.DateTimeField(auto_now=True)
+    finished_at = models.DateTimeField(blank=True, null=True)
+
+    class Meta:
+        db_table = "purge_jobs"
+        indexes = [
+            models.Index(fields=["status", "created_at"], name="idx_purge_status_created"),
+        ]
+        ordering = ("created_at",)
+
+    def __str__(self):
+        return f"{self.target_type}:{self.target_id} [{self.status}]"
+
+
+class UserShard(models.Model):
+    """
+    user_shards 테이블 (샤드 디렉터리, 항상 default DB)
+    - 해시 링과 다른 샤드에 있는 사용자(이동된 사용자)만 기록
+    - moving=True: 이동 마무리 중 → 해당 사용자의 원장 쓰기는 잠시 503
+    """
+    user_id = models.UUIDField(primary_key=True)
+    alias = models.CharField(max_length=32)
+    moving = models.BooleanField(default=False)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        db_table = "user_shards"
+
+    def __str__(self):
+        return f"{self.user_id} → {self.alias}{' (moving)' if self.moving else ''}"
@@ -0,0 +1,46 @@
+# apps/banking/money.py
+"""
+금액 저장 방식 (MONEY_STORAGE["MODE"])
+
+- "decimal": NUMERIC(18,2) 컬럼만 (기존)
+- "dual":    NUMERIC + *_minor(BIGINT, 최소 단위) 함께 기록, 읽기는 NUMERIC
+             ← backfill_minor_units 실행 구간
+- "minor":   함께 기록, 집계/직렬화는 *_minor (정수 SUM, Decimal 양자화 없이 문자열화)
+
+무중단 전환: 컬럼 추가(배포) → MODE=dual → backfill_minor_units → --check 로 0 확인 → MODE=minor
+되돌릴 때는 MODE 만 되돌리면 됨 (NUMERIC 은 계속 기록). NUMERIC 컬럼 제거는 별도 단계
+API 출력은 어느 모드든 같은 문자열("1234.50")
+"""
+from decimal import ROUND_HALF_EVEN, Decimal
+
+from django.conf import settings
+
+DECIMAL_PLACES = 2
+SCALE = 10 ** DECIMAL_PLACES
+
+
+def money_mode():
+    return getattr(settings, "MONEY_STORAGE", {}).get("MODE", "decimal")
+
+
+def dual_write():
+    return money_mode() != "decimal"
+
+
+def read_minor():
+    return money_mode() == "minor"
+
+
+def to_minor(value):
+    return int((Decimal(value) * SCALE).to_integral_value(ROUND_HALF_EVEN))
+
+
+def from_minor(value):
+    return Decimal(value).scaleb(-DECIMAL_PLACES)
+
+
+def format_minor(value):
+    """정수 최소 단위 → DRF DecimalField(decimal_places=2) 와 같은 문자열"""
+    sign = "-" if value < 0 else ""
+    whole, frac = divmod(abs(value), SCALE)
+    return f"{sign}{whole}.{frac:0{DECIMAL_PLACES}d}"
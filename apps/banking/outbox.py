@@ -0,0 +1,161 @@
+# apps/banking/outbox.py
+"""
+원장 변경 피드(outbox) 소비 API
+
+    batch = claim_batch("notifications")     # SKIP LOCKED 로 소비자 행 선점 + 오프셋 이후 이벤트
+    for event in batch.events: ...
+    ack(batch)                               # 오프셋 전진 + lease 해제 (실패 시 release(batch))
+
+- 소비자마다 독립 오프셋(OutboxConsumer). 같은 이름의 인스턴스가 여러 개면 lease 를 가진 하나만 진행
+- 빈 id(gaps): id 는 INSERT 순서라 커밋 순서와 다름
+  → 오래 걸린 트랜잭션의 낮은 id 가 오프셋을 지난 뒤에 보일 수 있다.
+  오프셋을 넘기면서 건너뛴 id 를 소비자 행에 기록해 두고 매 배치에서 다시 찾는다
+  (롤백으로 영영 안 채워지는 id 는 GAP_TIMEOUT 이 지나면 포기 — 가장 긴 원장 트랜잭션보다 길게)
+- prune: 모든 소비자가 지나간 이벤트를 보존 기간 이후 배치 단위로 삭제
+- 이벤트/오프셋은 샤드마다 따로 (소비자는 샤드별로 use_shard 안에서 돈다)
+"""
+import uuid
+from dataclasses import dataclass, field
+from datetime import timedelta
+
+from django.db.models import Min, Q
+from django.utils import timezone
+from django.utils.dateparse import parse_datetime
+
+from config.sharding import ledger_atomic
+
+from .models import OutboxConsumer, OutboxEvent
+
+LEASE = timedelta(seconds=30)
+GAP_TIMEOUT = timedelta(minutes=10)
+MAX_GAPS = 10_000   # 시퀀스가 크게 건너뛴 경우(장애 후 캐시 등) 무한히 쌓지 않음
+
+
+class LeaseLost(Exception):
+    """ack 전에 lease 가 만료되어 다른 인스턴스가 배치를 가져감 → 이 배치는 다시 전달될 수 있음"""
+
+
+@dataclass
+class Batch:
+    consumer: str
+    token: uuid.UUID | None
+    events: list = field(default_factory=list)
+    last_offset: int | None = None   # ack 때 저장할 오프셋 / 빈 id
+    gaps: dict = field(default_factory=dict)
+
+
+def find_gaps(after, ids):
+    """after 다음부터 오름차순 ids 사이에서 빠진 id"""
+    missing, expected = [], after + 1
+    for i in ids:
+        missing.extend(range(expected, i))
+        expected = i + 1
+    return missing
+
+
+@ledger_atomic
+def claim_batch(consumer, *, limit=100, lease=LEASE, gap_timeout=GAP_TIMEOUT):
+    """다른 인스턴스가 lease 중이면 None, 읽을 이벤트가 없으면 빈 Batch"""
+    now = timezone.now()
+    OutboxConsumer.objects.get_or_create(name=consumer)
+    state = (
+        OutboxConsumer.objects.select_for_update(skip_locked=True)
+        .filter(name=consumer)
+        .filter(Q(lease_until__isnull=True) | Q(lease_until__lt=now))
+        .first()
+    )
+    if state is None:
+        return None
+
+    expiry = now - gap_timeout
+    gaps = {int(i): seen for i, seen in state.gaps.items() if parse_datetime(seen) > expiry}
+    events = list(
+        OutboxEvent.objects.filter(Q(id__gt=state.last_offset) | Q(id__in=list(gaps)))
+        .order_by("id")[:limit]
+    )
+    if not events:
+        if len(gaps) != len(state.gaps):   # 만료된 빈 id 정리
+            state.gaps = {str(i): seen for i, seen in gaps.items()}
+            state.save(update_fields=["gaps", "updated_at"])
+        return Batch(consumer, None)
+
+    above = [e.id for e in events if e.id > state.last_offset]
+    for i in find_gaps(state.last_offset, above)[:MAX_GAPS]:
+        gaps[i] = now.isoformat()
+    for e in events:
+        gaps.pop(e.id, None)
+
+    state.lease_token = uuid.uuid4()
+    state.lease_until = now + lease
+    state.save(update_fields=["lease_token", "lease_until", "updated_at"])
+    offset = above[-1] if above else state.last_offset
+    pending = {str(i): seen for i, seen in gaps.items()}
+    return Batch(consumer, state.lease_token, events, offset, pending)
+
+
+def ack(batch):
+    if batch.token is None:
+        return
+    updated = OutboxConsumer.objects.filter(name=batch.consumer, lease_token=batch.token).update(
+        last_offset=batch.last_offset, gaps=batch.gaps, lease_token=None, lease_until=None,
+        updated_at=timezone.now(),
+    )
+    if not updated:
+        raise LeaseLost(batch.consumer)
+
+
+def release(batch):
+    """처리 실패: 오프셋은 그대로 두고 lease 만 풀어 즉시 재시도 가능하게"""
+    if batch.token is None:
+        return
+    OutboxConsumer.objects.filter(name=batch.consumer, lease_token=batch.token).update(
+        lease_token=None, lease_until=None, updated_at=timezone.now()
+    )
+
+
+def prune(*, keep=timedelta(days=7), batch_size=10_000):
+    """모든 소비자가 ack 했고 keep 보다 오래된 이벤트 삭제. 반환: 삭제 건수"""
+    low_water = OutboxConsumer.objects.aggregate(m=Min("last_offset"))["m"]
+    if low_water is None:
+        return 0
+    cutoff = timezone.now() - keep
+    deleted = 0
+    while True:
+        ids = list(
+            OutboxEvent.objects.filter(id__lte=low_water, created_at__lt=cutoff)
+            .order_by("id")
+            .values_list("id", flat=True)[:batch_size]
+        )
+        if not ids:
+            return deleted
+        deleted += OutboxEvent.objects.filter(id__in=ids).delete()[0]
+
+
+class LocalConsumer:
+    """
+    같은 프로세스에서 핸들러를 호출하는 소비자 (테스트/단일 프로세스용)
+    handler(events) 가 예외를 던지면 release 후 예외를 그대로 올린다.
+    """
+
+    def __init__(self, name, handler, *, batch_size=100):
+        self.name = name
+        self.handler = handler
+        self.batch_size = batch_size
+
+    def poll(self):
+        batch = claim_batch(self.name, limit=self.batch_size)
+        if not batch or not batch.events:
+            return 0
+        try:
+            self.handler(batch.events)
+        except Exception:
+            release(batch)
+            raise
+        ack(batch)
+        return len(batch.events)
+
+    def drain(self):
+        total = 0
+        while n := self.poll():
+            total += n
+        return total
@@ -0,0 +1,49 @@
+# apps/banking/pagination.py
+"""
+키셋(커서) 페이지네이션 — 정렬 키 (created_at, id) 내림차순
+
+- OFFSET 없이 "마지막으로 본 행보다 작은 키" 조건으로 다음 페이지
+  → 깊은 페이지도 인덱스 범위 스캔 한 번
+- created_at 이 같은 행은 id 로 순서를 정함 (UUIDv7 은 생성 순서와 같은 방향)
+- 커서는 불투명 문자열(base64). 형식이 틀리면 400
+"""
+import base64
+import uuid
+
+from django.db.models import Q
+from django.utils.dateparse import parse_datetime
+from rest_framework.exceptions import ValidationError
+
+DEFAULT_LIMIT = 50
+MAX_LIMIT = 200
+
+
+def page_limit(params):
+    try:
+        limit = int(params.get("limit", DEFAULT_LIMIT))
+    except ValueError:
+        raise ValidationError({"limit": "정수여야 합니다."}) from None
+    return max(1, min(limit, MAX_LIMIT))
+
+
+def encode_cursor(row):
+    raw = f"{row.created_at.isoformat()}|{row.id}".encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_cursor(value):
+    """반환: (created_at, id)"""
+    try:
+        raw = base64.urlsafe_b64decode(value + "=" * (-len(value) % 4)).decode()
+        created_at, pk = raw.split("|")
+        key = (parse_datetime(created_at), uuid.UUID(pk))
+    except (ValueError, UnicodeDecodeError):
+        raise ValidationError({"cursor": "잘못된 커서입니다."}) from None
+    if key[0] is None:
+        raise ValidationError({"cursor": "잘못된 커서입니다."})
+    return key
+
+
+def before_cursor(created_at, pk):
+    """정렬 키가 커서보다 뒤(더 오래된) 행"""
+    return Q(created_at__lt=created_at) | Q(created_at=created_at, id__lt=pk)
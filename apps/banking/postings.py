@@ -0,0 +1,106 @@
+# apps/banking/postings.py
+"""
+비동기 거래 접수(쓰기 병합) 큐
+
+- enqueue: 요청 스레드는 큐 테이블에 INSERT 만 하고 바로 202 응답 (계좌 행 잠금 대기 없음)
+- drain_account: 계좌별 단일 작성자(applier)가 계좌 행을 한 번 잠그고
+  대기 중인 거래를 seq 순서대로 모아 잔액 계산 → bulk_create 한 번 + 잔액 UPDATE 한 번
+- 계좌 잠금은 SKIP LOCKED: 다른 applier/동기 거래가 잡고 있으면 건너뛰고 다음 루프에서 처리
+- 모두 현재 샤드(use_shard) 기준. apply_postings 는 샤드마다 돈다
+  계좌를 잠근 뒤 사용자가 이동 중이거나 다른 샤드로 옮겨졌으면 건너뜀 (대상 샤드의 사본이 반영)
+"""
+from datetime import timedelta
+
+from django.utils import timezone
+
+from config.sharding import ledger_atomic, ledger_db
+
+from .limits import WithdrawalCounter
+from .live import notify
+from .models import Account, OutboxEvent, PendingPosting, TransactionHistory
+from .money import dual_write, to_minor
+from .shards import homed_here
+
+
+def enqueue(account, *, amount, io_type, method, description=""):
+    return PendingPosting.objects.create(
+        account=account,
+        amount=amount,
+        io_type=io_type,
+        method=method,
+        description=description or "",
+    )
+
+
+def pending_account_ids(limit=100):
+    """대기 중인 접수가 있는 계좌들 (오래 기다린 계좌 먼저)"""
+    rows = (
+        PendingPosting.objects.filter(status="PENDING")
+        .order_by("seq")
+        .values_list("account_id", flat=True)[: limit * 10]
+    )
+    return list(dict.fromkeys(rows))[:limit]
+
+
+@ledger_atomic
+def drain_account(account_id, batch_size=500):
+    """반환: (반영 건수, 거절 건수). 다른 작성자가 계좌를 잡고 있으면 (0, 0)"""
+    acc = Account.objects.select_for_update(skip_locked=True).filter(pk=account_id).first()
+    if acc is None or not homed_here(acc.user_id):
+        return 0, 0
+
+    entries = list(
+        PendingPosting.objects.filter(account_id=account_id, status="PENDING")
+        .order_by("seq")[:batch_size]
+    )
+    if not entries:
+        return 0, 0
+
+    now = timezone.now()
+    balance = acc.balance
+    counter = WithdrawalCounter(account_id, timezone.localdate(now))
+    txns = []
+    for i, entry in enumerate(entries):
+        entry.applied_at = now
+        if entry.io_type == "WITHDRAW":
+            if balance < entry.amount:
+                reason = "잔액 부족"
+            else:
+                reason = counter.charge(entry.method, entry.amount)
+            if reason:
+                entry.status = "REJECTED"
+                entry.error = reason
+                continue
+
+        balance = balance + entry.amount if entry.io_type == "DEPOSIT" else balance - entry.amount
+        txn = TransactionHistory(
+            account_id=account_id,
+            amount=entry.amount,
+            balance_after=balance,
+            description=entry.description,
+            io_type=entry.io_type,
+            method=entry.method,
+            # 같은 배치 안에서도 created_at 정렬 = 반영(seq) 순서가 되도록 1µs씩 증가
+            created_at=now + timedelta(microseconds=i),
+        )
+        entry.status = "APPLIED"
+        entry.transaction_history = txn
+        txns.append(txn)
+
+    minor = dual_write()
+    if minor:
+        for txn in txns:
+            txn.set_minor_units()   # bulk_create 는 save() 를 거치지 않음
+    TransactionHistory.objects.bulk_create(txns)
+    if txns:
+        extra = {"balance_minor": to_minor(balance)} if minor else {}
+        Account.objects.filter(pk=account_id).update(balance=balance, updated_at=now, **extra)
+        OutboxEvent.objects.bulk_create(
+            [OutboxEvent.for_transaction(t, user_id=acc.user_id) for t in txns]
+        )
+        notify(acc.user_id, using=ledger_db())
+    counter.save()
+    PendingPosting.objects.bulk_update(
+        entries, ["status", "transaction_history", "error", "applied_at"]
+    )
+    return len(txns), len(entries) - len(txns)
@@ -0,0 +1,190 @@
+# apps/banking/purge.py
+"""
+사용자/계좌 삭제를 요청 밖으로 (PurgeJob)
+
+1) schedule_*_purge: 대상에 deleted_at 표시 + 작업 생성 (요청 안에서는 UPDATE/INSERT 몇 건뿐)
+2) claim_jobs: 작업을 SELECT ... FOR UPDATE SKIP LOCKED 로 선점(lease)
+3) run_job: 계좌마다 하위 테이블을
+     DELETE FROM t WHERE pk IN (SELECT pk FROM t WHERE account_id = %s LIMIT n)
+   로 n 건씩 지움 (배치마다 커밋 → 잠금이 짧고, Collector 가 수백만 행을 메모리에 올리지 않음)
+   하위 행이 비면 계좌/사용자 행은 ORM delete (남은 소규모 관계 + post_delete 신호 처리)
+- 작업(PurgeJob)은 default, 지울 원장 데이터는 job.shard 에 있다
+- orphaned_accounts: 사용자 행이 없는 계좌 찾기 (Account.user 는 DB FK 제약이 없으므로
+  사용자 삭제가 이 경로를 우회했을 때의 정합성 점검용, check_account_owners 명령)
+"""
+import logging
+import time
+from datetime import timedelta
+
+from django.contrib.auth import get_user_model
+from django.db import DEFAULT_DB_ALIAS, connections, transaction
+from django.db.models import Q
+from django.utils import timezone
+
+from config.sharding import ledger_db, use_shard
+
+from .archive import delete_segments
+from .models import (
+    Account,
+    ArchiveSegment,
+    DailyWithdrawal,
+    PendingPosting,
+    PurgeJob,
+    StandingOrder,
+    Statement,
+    TransactionHistory,
+)
+from .statements import delete_statements
+
+logger = logging.getLogger(__name__)
+
+LEASE = timedelta(minutes=5)
+
+# 계좌 하위 테이블 (지우는 순서: 거래내역을 참조하는 접수 큐 먼저)
+ACCOUNT_CHILDREN = (
+    (PendingPosting, "account"),
+    (StandingOrder, "account"),
+    (TransactionHistory, "account"),
+    # 보관/명세서 파일은 delete_segments/delete_statements 로 먼저 지움
+    (ArchiveSegment, "account"),
+    (Statement, "account"),
+    (DailyWithdrawal, "account"),
+)
+
+
+@transaction.atomic
+def schedule_account_purge(account):
+    # 계좌 뷰의 샤드 컨텍스트 안에서 호출됨 (원장 UPDATE 는 그 샤드로)
+    now = timezone.now()
+    Account.objects.filter(pk=account.pk).update(deleted_at=now)
+    return PurgeJob.objects.create(target_type="ACCOUNT", target_id=account.pk, shard=ledger_db())
+
+
+@transaction.atomic
+def schedule_user_purge(user):
+    from .shards import shard_for_user
+
+    now = timezone.now()
+    shard = shard_for_user(user.pk)
+    get_user_model().objects.filter(pk=user.pk).update(is_active=False, deleted_at=now)
+    with use_shard(shard):
+        Account.objects.filter(user_id=user.pk, deleted_at__isnull=True).update(deleted_at=now)
+    return PurgeJob.objects.create(target_type="USER", target_id=user.pk, shard=shard)
+
+
+def claim_jobs(*, worker_id, limit=10, now=None, lease=LEASE):
+    now = now or timezone.now()
+    with transaction.atomic():
+        ids = list(
+            PurgeJob.objects.select_for_update(skip_locked=True)
+            .filter(status__in=("PENDING", "RUNNING"))
+            .filter(Q(claimed_until__isnull=True) | Q(claimed_until__lt=now))
+            .order_by("created_at")
+            .values_list("id", flat=True)[:limit]
+        )
+        if ids:
+            PurgeJob.objects.filter(id__in=ids).update(
+                status="RUNNING", claimed_by=worker_id, claimed_until=now + lease
+            )
+    return ids
+
+
+def delete_batch(model, fk_name, value, batch_size):
+    """fk = value 인 행을 최대 batch_size 건 삭제. 반환: 삭제 건수"""
+    connection = connections[ledger_db()]
+    qn = connection.ops.quote_name
+    field = model._meta.get_field(fk_name)
+    table, pk = qn(model._meta.db_table), qn(model._meta.pk.column)
+    with connection.cursor() as cursor:
+        cursor.execute(
+            f"DELETE FROM {table} WHERE {pk} IN "
+            f"(SELECT {pk} FROM {table} WHERE {qn(field.column)} = %s LIMIT %s)",
+            [field.get_db_prep_value(value, connection), batch_size],
+        )
+        return cursor.rowcount
+
+
+class _Lost(Exception):
+    pass
+
+
+def run_job(job_id, worker_id, *, batch_size=5000, pause=0.0):
+    """결과: "done" | "lost"(lease 상실) | "error" """
+    job = PurgeJob.objects.filter(id=job_id, claimed_by=worker_id).first()
+    if job is None:
+        return "lost"
+    progress = dict(job.progress)
+
+    def heartbeat():
+        updated = PurgeJob.objects.filter(id=job.id, claimed_by=worker_id).update(
+            progress=progress, claimed_until=timezone.now() + LEASE, updated_at=timezone.now()
+        )
+        if not updated:
+            raise _Lost
+
+    try:
+        with use_shard(job.shard):
+            _purge_accounts(job, progress, heartbeat, batch_size, pause)
+
+        if job.target_type == "USER":
+            get_user_model().objects.filter(pk=job.target_id).delete()
+        PurgeJob.objects.filter(id=job.id, claimed_by=worker_id).update(
+            status="DONE", progress=progress, claimed_by=None, claimed_until=None,
+            finished_at=timezone.now(),
+        )
+        return "done"
+    except _Lost:
+        return "lost"
+    except Exception as e:
+        # lease 만료 후 다른 워커가 이어서 진행 (이미 지운 배치는 다시 지울 것이 없음)
+        logger.exception("purge job %s failed", job_id)
+        PurgeJob.objects.filter(id=job.id, claimed_by=worker_id).update(
+            last_error=str(e)[:255], progress=progress
+        )
+        return "error"
+
+
+def _purge_accounts(job, progress, heartbeat, batch_size, pause):
+    if job.target_type == "USER":
+        account_ids = list(
+            Account.objects.filter(user_id=job.target_id).values_list("id", flat=True)
+        )
+    else:
+        account_ids = [job.target_id]
+
+    for account_id in account_ids:
+        delete_segments(account_id)
+        delete_statements(account_id)
+        for model, fk_name in ACCOUNT_CHILDREN:
+            table = model._meta.db_table
+            while True:
+                deleted = delete_batch(model, fk_name, account_id, batch_size)
+                progress[table] = progress.get(table, 0) + deleted
+                heartbeat()
+                if deleted < batch_size:
+                    break
+                if pause:
+                    time.sleep(pause)   # 복제 지연/IO 여유
+        Account.objects.filter(pk=account_id).delete()
+        progress["accounts"] = progress.get("accounts", 0) + 1
+        heartbeat()
+
+
+def orphaned_accounts(*, batch_size=1000):
+    """현재 샤드에서 사용자가 default 에 없는 계좌 id 를 배치 단위로 yield"""
+    User = get_user_model()
+    last = None
+    while True:
+        qs = Account.objects.using(ledger_db()).order_by("pk").values_list("pk", "user_id")
+        if last is not None:
+            qs = qs.filter(pk__gt=last)
+        rows = list(qs[:batch_size])
+        if not rows:
+            return
+        # 복제본 지연으로 방금 가입한 사용자를 고아로 보지 않도록 primary 에서
+        owners = set(
+            User.objects.using(DEFAULT_DB_ALIAS).filter(pk__in={u for _, u in rows})
+            .values_list("pk", flat=True)
+        )
+        yield from (pk for pk, user_id in rows if user_id not in owners)
+        last = rows[-1][0]
@@ -0,0 +1,268 @@
+# apps/banking/query_plans.py
+"""
+거래내역 목록 필터의 실행 계획 점검 (인덱스 어드바이저)
+
+    report = inspect_shape(user, SHAPES["method"])
+    report.problems      # ["transaction_history: method 를 인덱스 밖에서 거름", ...]
+    report.suggestion    # models.Index(fields=["account", "method", ...], ...) 또는 None
+
+- TransactionViewSet.get_queryset 이 만드는 쿼리 그대로 EXPLAIN
+  PostgreSQL: EXPLAIN (FORMAT JSON) / SQLite(테스트): EXPLAIN QUERY PLAN
+- 문제로 보는 것: transaction_history 순차 스캔(인덱스 전체 훑기 포함),
+  인덱스 밖에서 거르는 필터 컬럼, 정렬
+- 제안: 계좌 + 같음(=) 필터 컬럼 + (금액 범위면 amount, 아니면 -created_at, -id) 복합 인덱스.
+  이미 같은 앞부분을 가진 인덱스가 있으면 제안하지 않음
+- 여러 계좌를 합치는 조회(account_id 없음)는 계좌별 인덱스 탐색 뒤 정렬이 남는 것이 정상
+  → 문제에서 제외
+- 실행: `manage.py explain_transaction_filters` (임시 데이터로 점검 후 롤백)
+  지원하지 않는 DB 면 CommandError
+"""
+import json
+import random
+import re
+from dataclasses import dataclass, field
+from datetime import timedelta
+from decimal import Decimal
+
+from django.contrib.auth import get_user_model
+from django.db import connections, models
+from django.utils import timezone
+from rest_framework.request import Request
+from rest_framework.test import APIRequestFactory
+
+from config.sharding import ledger_db
+
+from .models import TRANSACTION_IO, TRANSACTION_METHOD, Account, TransactionHistory
+
+TABLE = TransactionHistory._meta.db_table
+
+# 쿼리 파라미터 → (컬럼, 종류)
+FILTER_COLUMNS = {
+    "account_id": ("account_id", "eq"),
+    "io_type": ("io_type", "eq"),
+    "method": ("method", "eq"),
+    "min_amount": ("amount", "range"),
+    "max_amount": ("amount", "range"),
+    "from": ("created_at", "range"),
+    "to": ("created_at", "range"),
+}
+
+
+@dataclass(frozen=True)
+class Shape:
+    """
+    지원하는 필터 조합
+    account_id 는 점검 시 사용자의 계좌로, "-Nd" 는 점검 시각 N일 전으로 채움
+    """
+    name: str
+    params: tuple
+
+    @property
+    def keys(self):
+        return {k for k, _ in self.params}
+
+
+SHAPES = {
+    s.name: s for s in (
+        Shape("all", ()),
+        Shape("io_type", (("io_type", "WITHDRAW"),)),
+        Shape("method", (("method", "CARD"),)),
+        Shape("amount", (("min_amount", "90000"),)),
+        Shape("date", (("from", "-3d"),)),
+        Shape("account", (("account_id", None),)),
+        Shape("account_io_type", (("account_id", None), ("io_type", "WITHDRAW"))),
+        Shape("account_method", (("account_id", None), ("method", "CARD"))),
+        Shape("account_amount",
+              (("account_id", None), ("min_amount", "90000"), ("max_amount", "95000"))),
+        Shape("account_date", (("account_id", None), ("from", "-3d"), ("to", "-1d"))),
+    )
+}
+
+
+@dataclass
+class Step:
+    kind: str           # "search" | "scan" | "sort" | "other"
+    table: str = ""
+    index: str = ""
+    columns: tuple = ()   # 인덱스 조건에 쓰인 컬럼
+    residual: tuple = ()  # 인덱스 밖에서 거른 컬럼 (PostgreSQL Filter)
+    detail: str = ""
+
+
+@dataclass
+class Report:
+    shape: Shape
+    steps: list
+    problems: list = field(default_factory=list)
+    suggestion: object = None
+
+    @property
+    def indexes(self):
+        return {s.index for s in self.steps if s.table == TABLE and s.index}
+
+
+def transaction_queryset(user, params):
+    from .views_transactions import TransactionViewSet
+
+    view = TransactionViewSet()
+    view.request = Request(APIRequestFactory().get("/", dict(params)))
+    view.request.user = user
+    view.action = "list"
+    return view.get_queryset()
+
+
+# ---- EXPLAIN → Step ----
+
+SUPPORTED_VENDORS = ("postgresql", "sqlite")
+
+
+def supported(alias):
+    """이 DB 의 실행 계획을 읽을 수 있는지 (점검 전에 확인 — 임시 데이터를 만들기 전에)"""
+    return connections[alias].vendor in SUPPORTED_VENDORS
+
+
+def explain(queryset):
+    connection = connections[queryset.db]
+    sql, params = queryset.query.sql_with_params()
+    with connection.cursor() as cursor:
+        if connection.vendor == "postgresql":
+            cursor.execute("EXPLAIN (FORMAT JSON) " + sql, params)
+            plan = cursor.fetchone()[0]
+            if isinstance(plan, str):
+                plan = json.loads(plan)
+            return list(_pg_steps(plan[0]["Plan"]))
+        if connection.vendor == "sqlite":
+            cursor.execute("EXPLAIN QUERY PLAN " + sql, params)
+            return [_sqlite_step(row[3]) for row in cursor.fetchall()]
+    raise NotImplementedError(f"{connection.vendor} 는 지원하지 않습니다.")
+
+
+_SQLITE_SCAN = re.compile(
+    r"^(SEARCH|SCAN) (\w+)(?: AS \w+)?(?: USING (?:COVERING )?INDEX (\w+))?(?: \((.*)\))?"
+)
+
+
+def _sqlite_step(detail):
+    if "TEMP B-TREE" in detail:
+        return Step("sort", detail=detail)
+    m = _SQLITE_SCAN.match(detail)
+    if not m:
+        return Step("other", detail=detail)
+    op, table, index, cond = m.groups()
+    columns = tuple(re.findall(r"(\w+)[=<>]", cond or ""))
+    return Step("search" if op == "SEARCH" else "scan", table, index or "", columns, detail=detail)
+
+
+def _pg_steps(node):
+    kind = node["Node Type"]
+    table = node.get("Relation Name", "")
+    if kind in ("Sort", "Incremental Sort"):
+        yield Step("sort", detail=kind)
+    elif kind == "Seq Scan":
+        yield Step("scan", table, residual=_pg_columns(node.get("Filter")), detail=kind)
+    elif kind in ("Index Scan", "Index Only Scan", "Bitmap Index Scan"):
+        cond = node.get("Index Cond")
+        yield Step(
+            "search" if cond else "scan", table, node.get("Index Name", ""),
+            _pg_columns(cond), _pg_columns(node.get("Filter")), detail=kind,
+        )
+    elif kind == "Bitmap Heap Scan":
+        yield Step("other", table, residual=_pg_columns(node.get("Filter")), detail=kind)
+    for child in node.get("Plans", ()):
+        yield from _pg_steps(child)
+
+
+def _pg_columns(expr):
+    if not expr:
+        return ()
+    known = {col for col, _ in FILTER_COLUMNS.values()}
+    return tuple(sorted({c for c in re.findall(r"(\w+)\s*(?:=|<|>|~~)", expr) if c in known}))
+
+
+# ---- 점검 / 제안 ----
+
+def inspect(queryset, shape):
+    steps = explain(queryset)
+    report = Report(shape, steps)
+    indexes = {index.name for index in TransactionHistory._meta.indexes}
+    # PG Bitmap Index Scan 은 테이블명이 없음 → 인덱스 이름으로도 찾음
+    ours = [s for s in steps if s.table == TABLE or s.index in indexes]
+    wanted = {FILTER_COLUMNS[k][0] for k in shape.keys}
+
+    for step in ours:
+        if step.kind == "scan":
+            report.problems.append(f"{TABLE}: 순차 스캔 ({step.detail})")
+    used = {c for s in ours for c in s.columns}
+    residual = {c for s in ours for c in s.residual}
+    # SQLite 는 Filter 를 따로 보여주지 않음 → 인덱스 조건에 없는 필터 컬럼은 행을 읽고 거른 것
+    for column in sorted((wanted - used) | (residual & wanted)):
+        report.problems.append(f"{TABLE}: {column} 를 인덱스 밖에서 거름")
+    # 한 계좌 + 금액 범위가 아니면 (account, ..., -created_at, -id) 순서로 읽을 수 있어야 함
+    ordered = "account_id" in shape.keys and not {"min_amount", "max_amount"} & shape.keys
+    if ordered and any(s.kind == "sort" for s in steps):
+        report.problems.append("정렬(sort): 인덱스 순서로 읽지 못함")
+
+    if report.problems:
+        report.suggestion = suggest_index(shape)
+    return report
+
+
+def suggest_index(shape):
+    """이 조합에 맞는 복합 인덱스 (기존 인덱스가 이미 같은 앞부분이면 None)"""
+    eq = ["account"] + sorted(
+        FILTER_COLUMNS[k][0] for k in shape.keys
+        if FILTER_COLUMNS[k][1] == "eq" and k != "account_id"
+    )
+    amount = any(FILTER_COLUMNS[k][0] == "amount" for k in shape.keys)
+    fields = eq + (["amount"] if amount else ["-created_at", "-id"])
+    for index in TransactionHistory._meta.indexes:
+        if list(index.fields[:len(fields)]) == fields:
+            return None
+    short = {"account": "acct", "io_type": "io", "created_at": "created"}
+    name = "_".join(short.get(f.lstrip("-"), f.lstrip("-")) for f in fields if f != "-id")
+    return models.Index(fields=fields, name=f"idx_txn_{name}"[:30])
+
+
+def inspect_shape(user, shape, *, account_id=None, now=None):
+    now = now or timezone.now()
+    params = {}
+    for key, value in shape.params:
+        if key == "account_id":
+            value = str(account_id)
+        elif isinstance(value, str) and value.startswith("-") and value.endswith("d"):
+            value = (now - timedelta(days=int(value[1:-1]))).isoformat()
+        params[key] = value
+    return inspect(transaction_queryset(user, params), shape)
+
+
+def seed(*, users=50, accounts=3, rows=200, days=365, rng=None):
+    """
+    점검용 데이터 (사용자 × 계좌 × 거래) — 플래너가 "작은 테이블이라 그냥 스캔" 하지 않을 만큼.
+    호출한 쪽의 트랜잭션 안에서 만들고 롤백하는 용도. 반환: (첫 사용자, 그 사용자의 첫 계좌)
+    """
+    rng = rng or random.Random(0)
+    now = timezone.now()
+    tag = rng.getrandbits(32)
+    people = get_user_model().objects.bulk_create([
+        get_user_model()(email=f"plan-{tag}-{i}@example.invalid", password="!")
+        for i in range(users)
+    ])
+    accts = Account.objects.using(ledger_db()).bulk_create([
+        Account(user=u, bank_code="ETC", account_number=f"9{tag:010d}{i:03d}{j:02d}")
+        for i, u in enumerate(people) for j in range(accounts)
+    ])
+    ios, methods = [c for c, _ in TRANSACTION_IO], [c for c, _ in TRANSACTION_METHOD]
+    TransactionHistory.objects.using(ledger_db()).bulk_create([
+        TransactionHistory(
+            account=a,
+            amount=Decimal(rng.randint(100, 10_000_000)) / 100,
+            balance_after=Decimal("0.00"),
+            io_type=rng.choice(ios),
+            method=rng.choice(methods),
+            created_at=now - timedelta(seconds=rng.randint(0, days * 86400)),
+        )
+        for a in accts for _ in range(rows)
+    ], batch_size=5000)
+    with connections[ledger_db()].cursor() as cursor:
+        cursor.execute("ANALYZE")   # 통계 없이 세운 계획은 의미 없음
+    return people[0], accts[0]
@@ -1,6 +1,11 @@
 # apps/banking/serializers_accounts.py
+from django.db import transaction
 from rest_framework import serializers
-from .models import Account
+
+from config.sharding import ledger_db
+
+from .models import Account, Statement
+from .serializers_transactions import MoneyField
 
 
 class AccountSerializer(serializers.ModelSerializer):
@@ -9,6 +14,8 @@ class AccountSerializer(serializers.ModelSerializer):
     - 계좌의 식별/기본 정보는 모두 read-only
     - 어떤 경로로든 update()가 호출되면 막는다(이중 안전장치)
     """
+    balance = MoneyField("balance_minor")
+
     class Meta:
         model = Account
         fields = (
@@ -62,4 +69,18 @@ class AccountCreateSerializer(serializers.ModelSerializer):
     def create(self, validated_data):
         user = self.context["request"].user
         # body로 user가 와도 무시하고 현재 로그인 유저로 강제
-        return Account.objects.create(user=user, **validated_data)
+        # (atomic: 계좌 INSERT 와 outbox 이벤트(post_save)를 한 트랜잭션으로)
+        with transaction.atomic(using=ledger_db()):
+            return Account.objects.create(user=user, **validated_data)
+
+
+class StatementSerializer(serializers.ModelSerializer):
+    """월별 명세서 목록 (파일은 /accounts/{id}/statements/{YYYY-MM}/ 로 내려받기)"""
+    month = serializers.DateField(format="%Y-%m", read_only=True)
+
+    class Meta:
+        model = Statement
+        fields = (
+            "month", "opening_balance", "closing_balance", "totals", "line_count", "created_at",
+        )
+        read_only_fields = fields
@@ -0,0 +1,24 @@
+# apps/banking/serializers_dashboard.py
+from rest_framework import serializers
+
+from .serializers_accounts import AccountSerializer
+from .serializers_transactions import TransactionSerializer
+
+
+class DashboardAccountSerializer(AccountSerializer):
+    """계좌 + 최근 거래 K건 + 최근 30일 입/출금 합계 (뷰에서 annotate/prefetch 된 값 사용)"""
+    in_30d = serializers.DecimalField(max_digits=18, decimal_places=2, read_only=True)
+    out_30d = serializers.DecimalField(max_digits=18, decimal_places=2, read_only=True)
+    recent_transactions = TransactionSerializer(many=True, read_only=True)
+
+    class Meta(AccountSerializer.Meta):
+        fields = AccountSerializer.Meta.fields + ("in_30d", "out_30d", "recent_transactions")
+        read_only_fields = fields
+
+
+class DashboardSerializer(serializers.Serializer):
+    total_balance = serializers.DecimalField(max_digits=20, decimal_places=2)
+    in_30d = serializers.DecimalField(max_digits=20, decimal_places=2)
+    out_30d = serializers.DecimalField(max_digits=20, decimal_places=2)
+    since = serializers.DateTimeField()
+    accounts = DashboardAccountSerializer(many=True)
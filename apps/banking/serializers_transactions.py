@@ -1,6 +1,40 @@
 # apps/banking/serializers_transactions.py
 from rest_framework import serializers
-from .models import TransactionHistory, TRANSACTION_IO, TRANSACTION_METHOD
+from .models import PendingPosting, TransactionHistory, TRANSACTION_IO, TRANSACTION_METHOD
+from .money import format_minor, read_minor
+
+
+class _Minor(int):
+    """MoneyField.get_attribute → to_representation 사이에서 최소 단위 값임을 표시"""
+
+
+class MoneyField(serializers.DecimalField):
+    """
+    읽기 전용 금액 필드 (decimal_places=2)
+    - MONEY_STORAGE["MODE"] == "minor" 이고 minor_source 값이 있으면 정수 → 문자열
+      (Decimal 양자화 없음)
+    - 아니면 DecimalField 그대로 → 두 경우 출력 문자열이 같다
+    """
+
+    def __init__(self, minor_source, **kwargs):
+        kwargs.setdefault("max_digits", 18)
+        kwargs.setdefault("decimal_places", 2)
+        kwargs["read_only"] = True
+        self.minor_source = minor_source
+        super().__init__(**kwargs)
+
+    def get_attribute(self, instance):
+        if read_minor():
+            value = getattr(instance, self.minor_source, None)
+            if value is not None:
+                return _Minor(value)
+        return super().get_attribute(instance)
+
+    def to_representation(self, value):
+        if isinstance(value, _Minor):
+            return format_minor(value)
+        return super().to_representation(value)
+
 
 class TransactionCreateSerializer(serializers.Serializer):
     account_id = serializers.UUIDField()
@@ -17,6 +51,9 @@ class TransactionCreateSerializer(serializers.Serializer):
 
 class TransactionSerializer(serializers.ModelSerializer):
     """조회/상세 응답용 — 요구 4) 필드 포함"""
+    amount = MoneyField("amount_minor")
+    balance_after = MoneyField("balance_after_minor")
+
     class Meta:
         model = TransactionHistory
         fields = ("id", "account", "amount", "balance_after", "description",
@@ -34,3 +71,15 @@ class TransactionUpdateSerializer(serializers.ModelSerializer):
     class Meta:
         model = TransactionHistory
         fields = ("description", "method")
+
+
+class PostingSerializer(serializers.ModelSerializer):
+    """비동기 접수 상태 조회용 — 반영되면 transaction 에 거래 내역이 채워짐"""
+    account = serializers.UUIDField(source="account_id", read_only=True)
+    transaction = TransactionSerializer(source="transaction_history", read_only=True)
+
+    class Meta:
+        model = PendingPosting
+        fields = ("handle", "account", "amount", "io_type", "method", "description",
+                  "status", "error", "transaction", "created_at", "applied_at")
+        read_only_fields = fields
@@ -0,0 +1,254 @@
+# apps/banking/shards.py
+"""
+사용자 → 원장 샤드 결정 + 뷰 컨텍스트 + 온라인 이동
+
+- locate_user: UserShard(이동된 사용자) 조회 → 없으면 해시 링
+  프로세스 로컬 캐시(SHARD_DIRECTORY_TTL 초)
+  샤드가 하나뿐이면 조회 없이 default
+- ShardContextMixin: DRF 인증 직후 요청 사용자의 샤드를 현재 샤드로 지정
+  (이동 마무리 중이면 쓰기 503)
+- homed_here: 백그라운드 워커(예약 이체/비동기 접수)가 계좌를 잠근 뒤 디렉터리를 직접 확인
+  → 이동 중이거나 이미 다른 샤드로 옮겨진 사용자의 원본 행에는 쓰지 않음
+- move_user: 복사(온라인) → moving 표시 → 잠금 후 차이만 맞춤(대기 작업/미전달 outbox 포함)
+  → 디렉터리 전환 → 원본 삭제
+"""
+import threading
+import time
+
+from django.conf import settings
+from django.db import DEFAULT_DB_ALIAS, transaction
+from django.db.models import Min
+from rest_framework import status
+from rest_framework.exceptions import APIException
+from rest_framework.permissions import SAFE_METHODS
+
+from config.sharding import (
+    activate,
+    deactivate,
+    ledger_db,
+    ledger_shards,
+    ring,
+    sharding_enabled,
+    use_shard,
+)
+
+from .models import (
+    Account,
+    ArchiveSegment,
+    DailyWithdrawal,
+    OutboxConsumer,
+    OutboxEvent,
+    PendingPosting,
+    StandingOrder,
+    Statement,
+    TransactionHistory,
+    UserShard,
+)
+
+_directory = {}
+_directory_lock = threading.Lock()
+
+
+def _ttl():
+    return getattr(settings, "SHARD_DIRECTORY_TTL", 30)
+
+
+def locate_user(user_id, *, fresh=False):
+    """반환: (alias, moving)"""
+    if not sharding_enabled():
+        return DEFAULT_DB_ALIAS, False
+    key = str(user_id)
+    now = time.monotonic()
+    if not fresh:
+        hit = _directory.get(key)
+        if hit and hit[0] > now:
+            return hit[1]
+    row = UserShard.objects.filter(user_id=user_id).values_list("alias", "moving").first()
+    value = (row[0], row[1]) if row else (ring().shard_for(key), False)
+    with _directory_lock:
+        _directory[key] = (now + _ttl(), value)
+    return value
+
+
+def shard_for_user(user_id):
+    return locate_user(user_id)[0]
+
+
+def forget_user(user_id):
+    _directory.pop(str(user_id), None)
+
+
+def homed_here(user_id):
+    """
+    현재 샤드(ledger_db)가 사용자의 집이고 이동 중이 아닌지 (캐시 없이 디렉터리 조회)
+    계좌 행을 잠근 뒤 호출해야 의미가 있다: move_user 는 moving 표시 후 같은 잠금을 잡고 전환하므로
+    잠금을 얻은 시점에 True 면 이 트랜잭션이 끝날 때까지 전환되지 않는다.
+    """
+    alias, moving = locate_user(user_id, fresh=True)
+    return not moving and alias == ledger_db()
+
+
+class ShardMoving(APIException):
+    status_code = status.HTTP_503_SERVICE_UNAVAILABLE
+    default_detail = "계정 데이터 이동 중입니다. 잠시 후 다시 시도해 주세요."
+    default_code = "shard_moving"
+
+
+class ShardContextMixin:
+    """원장 뷰에 섞어 쓰는 샤드 컨텍스트 (인증 → 샤드 결정 → 핸들러 → 해제)"""
+
+    read_only_actions = ()   # POST 라도 조회만 하는 액션 (이동 중에도 허용)
+
+    def initial(self, request, *args, **kwargs):
+        super().initial(request, *args, **kwargs)
+        if sharding_enabled() and request.user.is_authenticated:
+            alias, moving = locate_user(request.user.pk)
+            action = getattr(self, "action", None)
+            writing = request.method not in SAFE_METHODS and action not in self.read_only_actions
+            if moving and writing:
+                raise ShardMoving
+            self._shard_token = activate(alias)
+
+    def finalize_response(self, request, response, *args, **kwargs):
+        token = getattr(self, "_shard_token", None)
+        if token is not None:
+            deactivate(token)
+            self._shard_token = None
+        return super().finalize_response(request, response, *args, **kwargs)
+
+
+# ---------- 이동 ----------
+def _copy(model, rows, target, *, update=False):
+    if not rows:
+        return 0
+    if update:
+        fields = [f.name for f in model._meta.concrete_fields if not f.primary_key]
+        model.objects.using(target).bulk_create(
+            rows, update_conflicts=True, unique_fields=[model._meta.pk.name], update_fields=fields
+        )
+    else:
+        model.objects.using(target).bulk_create(rows, ignore_conflicts=True)
+    return len(rows)
+
+
+def _copy_transactions(account_ids, source, target, batch_size):
+    """pk 키셋 순회로 거래내역 복사 (이미 있는 행은 건너뜀)"""
+    copied, last = 0, None
+    while True:
+        qs = (
+            TransactionHistory.objects.using(source)
+            .filter(account_id__in=account_ids).order_by("pk")
+        )
+        if last is not None:
+            qs = qs.filter(pk__gt=last)
+        rows = list(qs[:batch_size])
+        if not rows:
+            return copied
+        copied += _copy(TransactionHistory, rows, target)
+        last = rows[-1].pk
+
+
+def _reconcile_transactions(account_ids, source, target, batch_size):
+    """잠금 상태에서 원본과 대상의 차이(추가/삭제/수정된 설명·방법)만 맞춤"""
+    fields = ("pk", "description", "method")
+    src = {r[0]: r[1:] for r in TransactionHistory.objects.using(source)
+           .filter(account_id__in=account_ids).values_list(*fields).iterator(chunk_size=batch_size)}
+    dst = {r[0]: r[1:] for r in TransactionHistory.objects.using(target)
+           .filter(account_id__in=account_ids).values_list(*fields).iterator(chunk_size=batch_size)}
+
+    missing = [pk for pk in src if pk not in dst]
+    extra = [pk for pk in dst if pk not in src]
+    changed = [pk for pk in src if pk in dst and src[pk] != dst[pk]]
+    source_rows = TransactionHistory.objects.using(source)
+    target_rows = TransactionHistory.objects.using(target)
+    for i in range(0, len(missing), batch_size):
+        rows = list(source_rows.filter(pk__in=missing[i:i + batch_size]))
+        _copy(TransactionHistory, rows, target)
+    for i in range(0, len(extra), batch_size):
+        target_rows.filter(pk__in=extra[i:i + batch_size])._raw_delete(target)
+    for i in range(0, len(changed), batch_size):
+        rows = list(source_rows.filter(pk__in=changed[i:i + batch_size]))
+        target_rows.bulk_update(rows, ["description", "method"])
+    return len(missing), len(extra), len(changed)
+
+
+def _delete_source(account_ids, source, batch_size):
+    from .purge import ACCOUNT_CHILDREN, delete_batch
+
+    with use_shard(source):
+        for account_id in account_ids:
+            for model, fk_name in ACCOUNT_CHILDREN:
+                while delete_batch(model, fk_name, account_id, batch_size) == batch_size:
+                    pass
+        # 계좌 행도 원시 DELETE (이동이므로 account.deleted 이벤트를 내지 않음)
+        Account.objects.using(source).filter(pk__in=account_ids)._raw_delete(source)
+
+
+def _move_outbox(user_id, source, target):
+    """
+    원본 소비자들이 아직 지나가지 않은 사용자 이벤트를 대상 샤드 끝에 새 id 로 옮긴다.
+    (계좌 잠금 안에서 호출 → 이 사용자의 새 이벤트는 없음. 원본에서 이미 배치로 가져간 이벤트는
+    대상에서 한 번 더 전달될 수 있다 — outbox 는 원래 최소 1회 전달)
+    """
+    low_water = OutboxConsumer.objects.using(source).aggregate(m=Min("last_offset"))["m"] or 0
+    pending = OutboxEvent.objects.using(source).filter(user_id=user_id, id__gt=low_water)
+    rows = list(pending.order_by("id"))
+    for row in rows:
+        row.pk = None
+    OutboxEvent.objects.using(target).bulk_create(rows)
+    pending._raw_delete(source)
+    return len(rows)
+
+
+def move_user(user_id, target, *, batch_size=1000, log=lambda msg: None):
+    """사용자의 원장 데이터를 target 샤드로 옮긴다. 중간에 실패해도 다시 실행하면 이어서 맞춘다."""
+    if target not in ledger_shards():
+        raise ValueError(f"{target} 은 LEDGER_SHARDS 에 없습니다.")
+    source, _ = locate_user(user_id, fresh=True)
+    if source == target:
+        log("이미 대상 샤드에 있습니다.")
+        return
+    UserShard.objects.update_or_create(user_id=user_id, defaults={"alias": source, "moving": False})
+
+    # 1) 온라인 복사: 쓰기는 계속 원본으로
+    accounts = Account.objects.using(source)
+    account_ids = list(accounts.filter(user_id=user_id).values_list("pk", flat=True))
+    _copy(Account, list(accounts.filter(pk__in=account_ids)), target, update=True)
+    copied = _copy_transactions(account_ids, source, target, batch_size)
+    log(f"거래내역 {copied}건 복사 (온라인)")
+
+    # 2) 쓰기 차단: 모든 프로세스의 디렉터리 캐시가 moving 을 보게 될 때까지 대기
+    UserShard.objects.filter(user_id=user_id).update(moving=True)
+    time.sleep(_ttl())
+
+    # 3) 원본 계좌 잠금 → 차이만 맞추고 디렉터리 전환
+    with transaction.atomic(using=source), transaction.atomic(using=target):
+        account_ids = list(
+            accounts.select_for_update().filter(user_id=user_id).values_list("pk", flat=True)
+        )
+        _copy(Account, list(accounts.filter(pk__in=account_ids)), target, update=True)
+        missing, extra, changed = _reconcile_transactions(account_ids, source, target, batch_size)
+        for model in (PendingPosting, StandingOrder, ArchiveSegment, Statement, DailyWithdrawal):
+            model.objects.using(target).filter(account_id__in=account_ids)._raw_delete(target)
+            rows = list(
+                model.objects.using(source).filter(account_id__in=account_ids).order_by("pk")
+            )
+            if model._meta.pk.get_internal_type() == "BigAutoField":
+                # 자동 증가 키는 대상 샤드에서 새로 (샤드마다 시퀀스가 따로라 충돌)
+                for row in rows:
+                    row.pk = None
+            if model is StandingOrder:
+                # 원본 실행기의 lease 는 대상에서 의미 없음
+                for row in rows:
+                    row.claimed_by = row.claimed_until = None
+            _copy(model, rows, target)
+        events = _move_outbox(user_id, source, target)
+        log(f"마무리: 추가 {missing}, 삭제 {extra}, 수정 {changed}, 미전달 이벤트 {events}")
+    UserShard.objects.filter(user_id=user_id).update(alias=target, moving=False)
+    forget_user(user_id)
+
+    # 4) 오래된 캐시로 원본을 읽는 요청이 끝난 뒤 원본 삭제
+    time.sleep(_ttl())
+    _delete_source(account_ids, source, batch_size)
+    log(f"{source} → {target} 이동 완료 (계좌 {len(account_ids)}개)")
+
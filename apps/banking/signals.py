@@ -0,0 +1,20 @@
+# apps/banking/signals.py
+# 계좌 생성/삭제를 변경 피드(outbox)에 기록 — API/어드민/유저 삭제 CASCADE 어느 경로든 같은 트랜잭션
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from .live import notify
+from .models import Account, OutboxEvent
+
+
+@receiver(post_save, sender=Account)
+def record_account_created(sender, instance, created, raw=False, **kwargs):
+    if created and not raw:
+        OutboxEvent.for_account(instance, "account.created").save(using=kwargs.get("using"))
+        notify(instance.user_id, using=kwargs.get("using"))
+
+
+@receiver(post_delete, sender=Account)
+def record_account_deleted(sender, instance, **kwargs):
+    OutboxEvent.for_account(instance, "account.deleted").save(using=kwargs.get("using"))
+    notify(instance.user_id, using=kwargs.get("using"))
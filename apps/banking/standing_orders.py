@@ -0,0 +1,150 @@
+# apps/banking/standing_orders.py
+"""
+예약 이체(StandingOrder) 실행 엔진
+
+1) claim_due_orders: 실행할 회차를 SELECT ... FOR UPDATE SKIP LOCKED 로 배치 선점(lease)
+   → 여러 실행기가 동시에 돌아도 서로 잠긴 행은 건너뛰고, 선점된 행은 lease 만료 전까지 제외
+2) execute_order: 주문 1건을 한 트랜잭션에서 처리
+   (워커 프로세스에서 호출, shard: 주문이 있는 DB alias)
+   - 선점자(claimed_by) 확인 → 계좌 잠금 → 사용자가 이 샤드에 있는지(이동 중/이동 완료 아님) 확인
+     → Account.apply_transaction
+   - 성공: 다음 회차 예약
+   - 실패(잔액 부족 등): 백오프 후 재시도, max_attempts 초과 시 이번 회차 건너뜀
+   - 예상 못 한 예외(DB 오류 등)도 별도 트랜잭션으로 같은 실패 횟수/백오프 규칙 적용
+"""
+import logging
+from datetime import timedelta
+
+from django.core.exceptions import ValidationError
+from django.db import transaction
+from django.db.models import Q
+from django.utils import timezone
+
+from config.sharding import ledger_atomic, ledger_db, use_shard
+
+from .models import Account, StandingOrder
+from .shards import homed_here
+
+logger = logging.getLogger(__name__)
+
+LEASE = timedelta(minutes=5)
+RETRY_BACKOFF = timedelta(minutes=5)   # 1회 실패 5분, 2회 10분, 3회 20분 ...
+
+
+def claim_due_orders(*, executor_id, batch_size=100, now=None, lease=LEASE):
+    now = now or timezone.now()
+    with transaction.atomic(using=ledger_db()):
+        ids = list(
+            StandingOrder.objects.select_for_update(skip_locked=True)
+            .filter(status="ACTIVE", due_at__lte=now)
+            .filter(Q(claimed_until__isnull=True) | Q(claimed_until__lt=now))
+            .order_by("due_at")
+            .values_list("id", flat=True)[:batch_size]
+        )
+        if ids:
+            StandingOrder.objects.filter(id__in=ids).update(
+                claimed_by=executor_id, claimed_until=now + lease
+            )
+    return ids
+
+
+def execute_order(order_id, executor_id, shard=None):
+    """
+    결과: "posted" | "retry" | "skipped"(회차 포기) | "lost"(lease 상실)
+          | "moved"(샤드 이동) | "error"
+    """
+    try:
+        if shard is None:
+            return _execute_order(order_id, executor_id)
+        with use_shard(shard):
+            return _execute_order(order_id, executor_id)
+    except Exception as e:
+        # DB 오류 등: 실행 트랜잭션은 롤백 → 별도 트랜잭션으로 실패 횟수/백오프 기록 후 lease 해제
+        # (기록마저 실패하면 lease 만료 후 다른 실행기가 다시 선점)
+        logger.exception("standing order %s failed", order_id)
+        try:
+            if shard is None:
+                _record_error(order_id, executor_id, e)
+            else:
+                with use_shard(shard):
+                    _record_error(order_id, executor_id, e)
+        except Exception:
+            logger.exception("standing order %s: could not record failure", order_id)
+        return "error"
+
+
+@ledger_atomic
+def _record_error(order_id, executor_id, error):
+    order = (
+        StandingOrder.objects.select_for_update()
+        .filter(id=order_id, claimed_by=executor_id, status="ACTIVE")
+        .first()
+    )
+    if order is None:
+        return
+    _fail(order, timezone.now(), f"{type(error).__name__}: {error}")
+    _release(order)
+
+
+@ledger_atomic
+def _execute_order(order_id, executor_id):
+    now = timezone.now()
+    order = (
+        StandingOrder.objects.select_for_update()
+        .filter(id=order_id, claimed_by=executor_id, status="ACTIVE")
+        .first()
+    )
+    if order is None:
+        return "lost"
+    # 이동과 같은 계좌 잠금으로 직렬화: 잠금을 얻었는데 이동 중/완료면 대상 샤드의 사본이 실행한다
+    account = Account.objects.select_for_update().get(pk=order.account_id)
+    if not homed_here(account.user_id):
+        return "moved"
+
+    try:
+        with transaction.atomic(using=ledger_db()):
+            order.account.apply_transaction(
+                amount=order.amount,
+                io_type=order.io_type,
+                method=order.method,
+                description=order.description,
+                when=now,
+            )
+    except ValidationError as e:
+        outcome = _fail(order, now, "; ".join(e.messages))
+    else:
+        order.last_run_at = now
+        order.last_error = ""
+        _schedule_next(order)
+        outcome = "posted"
+
+    _release(order)
+    return outcome
+
+
+def _fail(order, now, message):
+    """실패 1회 기록: max_attempts 전이면 백오프 후 재시도, 아니면 이번 회차 건너뜀"""
+    order.attempts += 1
+    order.last_error = message[:255]
+    if order.attempts < order.max_attempts:
+        order.due_at = now + RETRY_BACKOFF * (2 ** (order.attempts - 1))
+        return "retry"
+    _schedule_next(order)
+    return "skipped"
+
+
+def _release(order):
+    order.claimed_by = None
+    order.claimed_until = None
+    order.save(update_fields=[
+        "next_run_at", "due_at", "status", "attempts", "last_error", "last_run_at",
+        "claimed_by", "claimed_until", "updated_at",
+    ])
+
+
+def _schedule_next(order):
+    order.next_run_at = order.following_run()
+    order.due_at = order.next_run_at
+    order.attempts = 0
+    if order.end_at and order.next_run_at > order.end_at:
+        order.status = "ENDED"
@@ -0,0 +1,186 @@
+# apps/banking/statements.py
+"""
+월별 거래명세서 + 잔액 체크포인트
+
+- build_statement: 끝난 달 하나의 명세서(시작/끝 잔액, io_type·method 별 합계, 거래 목록)를
+  JSON 파일로 저장하고 Statement 행을 기록. 이미 있으면 다시 만들지 않음(불변)
+  시작 잔액은 전월 명세서의 closing_balance → 이전 달 거래를 다시 훑지 않음
+- 거래 목록은 DB + 보관(archive) 세그먼트를 이어서
+- balance_at: 특정 시각의 잔액. (계좌, created_at) 인덱스로 직전 거래 1건
+  → 없으면 보관 세그먼트 → 명세서 체크포인트
+- generate_statements 커맨드가 워커 프로세스(config/process_pool)에서 계좌별로 호출
+"""
+import json
+import logging
+from collections import defaultdict
+from datetime import datetime, timedelta
+from decimal import Decimal
+
+from django.conf import settings
+from django.core.files.base import ContentFile
+from django.core.files.storage import storages
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db import IntegrityError
+from django.utils import timezone
+
+from config.sharding import ledger_db, use_shard
+
+from .archive import month_start, next_month, read_segment
+from .models import ArchiveSegment, Statement, TransactionHistory
+
+logger = logging.getLogger(__name__)
+
+ZERO = Decimal("0.00")
+
+
+def statement_storage():
+    return storages[getattr(settings, "STATEMENTS", {}).get("STORAGE", "statements")]
+
+
+def statement_path(account_id, month):
+    return f"statements/{account_id}/{month:%Y-%m}.json"
+
+
+def parse_month(value):
+    """"YYYY-MM" → 그 달 1일 0시 (현지 시각, aware)"""
+    return timezone.make_aware(datetime.strptime(value, "%Y-%m"))
+
+
+def last_closed_month(now=None):
+    return month_start(month_start(now or timezone.now()) - timedelta(days=1))
+
+
+# ---------- 잔액 ----------
+def balance_at(account_id, at):
+    """at 시각(포함)까지 반영된 잔액"""
+    last = (
+        TransactionHistory.objects.filter(account_id=account_id, created_at__lte=at)
+        .order_by("-created_at", "-id")
+        .values_list("balance_after", flat=True)
+        .first()
+    )
+    if last is not None:
+        return last
+
+    # DB 에 없으면 보관된 달: at 이전에 시작한 마지막 세그먼트 하나만 본다
+    segment = (
+        ArchiveSegment.objects.filter(account_id=account_id, min_created_at__lte=at)
+        .order_by("-month")
+        .first()
+    )
+    if segment is not None:
+        if segment.max_created_at <= at:
+            return segment.closing_balance
+        return [t for t in read_segment(segment) if t.created_at <= at][-1].balance_after
+
+    # 거래 파일까지 정리된 오래된 계좌: 명세서 체크포인트
+    checkpoint = (
+        Statement.objects.filter(account_id=account_id, month__lt=month_start(at).date())
+        .order_by("-month")
+        .values_list("closing_balance", flat=True)
+        .first()
+    )
+    return checkpoint if checkpoint is not None else ZERO
+
+
+def opening_balance(account_id, start):
+    """start(월 시작) 직전 잔액 — 전월 명세서가 있으면 그 closing_balance"""
+    prev = (
+        Statement.objects
+        .filter(account_id=account_id, month=month_start(start - timedelta(days=1)).date())
+        .values_list("closing_balance", flat=True)
+        .first()
+    )
+    if prev is not None:
+        return prev
+    return balance_at(account_id, start - timedelta(microseconds=1))
+
+
+# ---------- 명세서 ----------
+def month_lines(account_id, start, end):
+    """그 달 거래 (오래된 순) — DB 와 보관 세그먼트 양쪽"""
+    lines = list(
+        TransactionHistory.objects
+        .filter(account_id=account_id, created_at__gte=start, created_at__lt=end)
+        .order_by("created_at", "id")
+    )
+    segment = ArchiveSegment.objects.filter(account_id=account_id, month=start.date()).first()
+    if segment is not None:
+        lines = sorted(read_segment(segment) + lines, key=lambda t: (t.created_at, t.id))
+    return lines
+
+
+def _totals(lines):
+    by_io, by_method = defaultdict(lambda: ZERO), defaultdict(lambda: ZERO)
+    for t in lines:
+        by_io[t.io_type] += t.amount
+        by_method[t.method] += t.amount
+    return {"io_type": dict(by_io), "method": dict(by_method)}
+
+
+def build_statement(account_id, month, shard=None):
+    """워커 프로세스 진입점. month: "YYYY-MM". 결과: "created" | "exists" | "error" """
+    try:
+        with use_shard(shard or ledger_db()):
+            return _build_statement(account_id, parse_month(month))
+    except Exception:
+        logger.exception("statement %s %s failed", account_id, month)
+        return "error"
+
+
+def _build_statement(account_id, start):
+    month = start.date()
+    if Statement.objects.filter(account_id=account_id, month=month).exists():
+        return "exists"
+
+    lines = month_lines(account_id, start, next_month(start))
+    opening = opening_balance(account_id, start)
+    closing = lines[-1].balance_after if lines else opening
+    totals = _totals(lines)
+    document = {
+        "account": str(account_id),
+        "month": f"{start:%Y-%m}",
+        "opening_balance": opening,
+        "closing_balance": closing,
+        "totals": totals,
+        "lines": [
+            {
+                "id": str(t.id),
+                "created_at": t.created_at,
+                "io_type": t.io_type,
+                "method": t.method,
+                "amount": t.amount,
+                "balance_after": t.balance_after,
+                "description": t.description,
+            }
+            for t in lines
+        ],
+    }
+
+    # 파일 먼저 → 행 기록. 중간에 죽으면 다음 실행이 같은 경로에 다시 쓴다
+    storage = statement_storage()
+    path = statement_path(account_id, start)
+    if storage.exists(path):
+        storage.delete(path)
+    body = json.dumps(document, cls=DjangoJSONEncoder, ensure_ascii=False).encode()
+    path = storage.save(path, ContentFile(body))
+    try:
+        Statement.objects.create(
+            account_id=account_id,
+            month=month,
+            opening_balance=opening,
+            closing_balance=closing,
+            totals=totals,
+            line_count=len(lines),
+            path=path,
+        )
+    except IntegrityError:
+        return "exists"   # 다른 워커가 먼저 기록 (내용은 같음)
+    return "created"
+
+
+def delete_statements(account_id):
+    """계좌 삭제(purge) 시 명세서 파일 제거. 목록 행은 호출한 쪽이 지운다"""
+    storage = statement_storage()
+    for path in Statement.objects.filter(account_id=account_id).values_list("path", flat=True):
+        storage.delete(path)
@@ -1,15 +1,66 @@
 # apps/banking/tests.py
+import json
+import shutil
+import tempfile
+import threading
+import time
+import uuid
+from datetime import timedelta
 from decimal import Decimal
-from django.urls import reverse
+from io import StringIO
+from unittest import mock, skipUnless
+
+from asgiref.sync import sync_to_async
+from django.conf import settings
 from django.contrib.auth import get_user_model
-from rest_framework.test import APITestCase
+from django.core.cache import cache
+from django.core.management import call_command
+from django.core.management.base import CommandError
+from django.db import DatabaseError, connection, connections, migrations
+from django.db.migrations.loader import MigrationLoader
+from django.http import HttpResponse
+from django.test import RequestFactory, SimpleTestCase, TestCase, override_settings
+from django.urls import reverse
+from django.utils import timezone
 from rest_framework import status
+from rest_framework.request import Request
+from rest_framework.response import Response
+from rest_framework.test import APIRequestFactory, APITestCase
+
+from config import coalesce
+from config.db_router import PrimaryReplicaRouter, ReplicaRoutingMiddleware, replica_reads
+from config.ids import uuid7, uuid7_time
+from config.sharding import LEDGER_MODELS, ShardRing, shard_aliases, use_shard
+
+from .admin import TransactionHistoryAdmin
+from .archive import archive_account, archive_storage, month_start, read_segment
+from .live import Cursor, fetch_events, reset_frontiers
+from .models import (
+    Account,
+    ArchiveSegment,
+    DailyWithdrawal,
+    OutboxConsumer,
+    OutboxEvent,
+    PendingPosting,
+    PurgeJob,
+    StandingOrder,
+    Statement,
+    TransactionHistory,
+    UserShard,
+)
+from .outbox import LocalConsumer, ack, claim_batch, prune
+from .postings import drain_account
+from .query_plans import SHAPES, inspect_shape, seed
+from .shards import shard_for_user
+from .standing_orders import claim_due_orders, execute_order
+from .statements import balance_at, last_closed_month
 
 User = get_user_model()
 
 
 class BaseAPITest(APITestCase):
     def setUp(self):
+        cache.clear()  # throttle 카운터/인증 캐시 초기화
         # 테스트용 사용자 생성(+활성화)
         self.email = "me@example.com"
         self.password = "pass1234"
@@ -77,13 +128,14 @@ class AccountsCRUDTests(BaseAPITest):
         res = self.client.patch(detail_url, {"account_type": "SAVINGS"}, format="json")
         self.assertEqual(res.status_code, status.HTTP_405_METHOD_NOT_ALLOWED)
 
-        # Delete
+        # Delete → 202 (하위 데이터는 purge_deleted 워커가 정리)
         res = self.client.delete(detail_url)
-        self.assertIn(res.status_code, (status.HTTP_204_NO_CONTENT, status.HTTP_200_OK))
+        self.assertEqual(res.status_code, status.HTTP_202_ACCEPTED)
 
-        # 확인: 목록에서 사라짐
+        # 확인: 목록/상세에서 바로 사라짐
         res = self.client.get(self.accounts_list_url)
         self.assertFalse(any(a["id"] == acc_id for a in res.json()))
+        self.assertEqual(self.client.get(detail_url).status_code, status.HTTP_404_NOT_FOUND)
 
 
 class TransactionsCRUDTests(BaseAPITest):
@@ -145,6 +197,1120 @@ class TransactionsCRUDTests(BaseAPITest):
         # 확인: 목록에서 사라짐
         res = self.client.get(self.transactions_list_url)
         self.assertFalse(any(item["id"] == t2["id"] for item in res.json()))
-from django.test import TestCase
 
-# Create your tests here.
+
+class DashboardTests(BaseAPITest):
+    """
+    대시보드: 계좌 수와 무관하게 고정 쿼리 수로
+    계좌 + 최근 거래 K건 + 총 잔액 + 30일 입/출금 합계를 반환
+    """
+
+    def test_dashboard_returns_recent_activity_in_fixed_queries(self):
+        for number in ("111122223333", "444455556666", "777788889999"):
+            acc = Account.objects.get(id=self._create_account(account_number=number)["id"])
+            # 40일 전 입금은 잔액에는 포함, 30일 합계에서는 제외
+            acc.apply_transaction(amount=Decimal("1000.00"), io_type="DEPOSIT", method="CASH",
+                                  when=timezone.now() - timedelta(days=40))
+            for _ in range(6):
+                acc.apply_transaction(amount=Decimal("100.00"), io_type="DEPOSIT",
+                                      method="TRANSFER")
+            acc.apply_transaction(amount=Decimal("50.00"), io_type="WITHDRAW", method="CARD")
+
+        url = reverse("banking:dashboard")
+        # 계좌/집계 1 + 최근 거래 prefetch 1 (인증 사용자는 앞선 요청에서 캐시됨)
+        with self.assertNumQueries(2):
+            res = self.client.get(url)
+        self.assertEqual(res.status_code, status.HTTP_200_OK)
+
+        data = res.json()
+        self.assertEqual(len(data["accounts"]), 3)
+        self.assertEqual(data["total_balance"], "4650.00")
+        self.assertEqual(data["in_30d"], "1800.00")
+        self.assertEqual(data["out_30d"], "150.00")
+        for acc in data["accounts"]:
+            recent = acc["recent_transactions"]
+            self.assertEqual(len(recent), 5)
+            self.assertTrue(all(t["account"] == acc["id"] for t in recent))
+            self.assertEqual(recent[0]["io_type"], "WITHDRAW")  # 가장 최근 거래가 먼저
+            self.assertEqual(acc["in_30d"], "600.00")
+
+        res = self.client.get(url, {"recent": 2})
+        self.assertTrue(all(len(a["recent_transactions"]) == 2 for a in res.json()["accounts"]))
+
+
+class LargeTableAdminTests(BaseAPITest):
+    """어드민 대용량 모드: 키셋 페이징 + 접두사 검색"""
+
+    def setUp(self):
+        super().setUp()
+        self.admin_user = User.objects.create_superuser(email="admin@example.com",
+                                                        password="pass1234")
+        self.client.force_login(self.admin_user)
+
+    def test_transaction_changelist_pages_by_cursor(self):
+        acc = Account.objects.get(id=self._create_account()["id"])
+        for i in range(5):
+            acc.apply_transaction(amount=Decimal("10.00"), io_type="DEPOSIT", method="CASH",
+                                  when=timezone.now() - timedelta(minutes=i))
+
+        url = reverse("admin:banking_transactionhistory_changelist")
+        seen = []
+        with mock.patch.object(TransactionHistoryAdmin, "list_per_page", 2):
+            while url:
+                res = self.client.get(url)
+                self.assertEqual(res.status_code, status.HTTP_200_OK)
+                cl = res.context["cl"]
+                seen.extend(obj.pk for obj in cl.result_list)
+                url = cl.next_page_url and (
+                    reverse("admin:banking_transactionhistory_changelist") + cl.next_page_url
+                )
+
+        expected = list(
+            TransactionHistory.objects.order_by("-created_at", "-pk").values_list("pk", flat=True)
+        )
+        self.assertEqual(seen, expected)
+
+    def test_account_search_uses_prefix_lookup(self):
+        self._create_account(account_number="111122223333")
+        self._create_account(account_number="999911112222")
+        url = reverse("admin:banking_account_changelist")
+
+        res = self.client.get(url, {"q": "1111"})
+        self.assertEqual([a.account_number for a in res.context["cl"].result_list],
+                         ["111122223333"])
+
+
+class StandingOrderTests(BaseAPITest):
+    """예약 이체 실행기: 선점 → 실행 → 다음 회차 예약 / 실패 시 재시도"""
+
+    def setUp(self):
+        super().setUp()
+        self.account = Account.objects.get(id=self._create_account()["id"])
+        self.start = timezone.now() - timedelta(minutes=1)
+
+    def _order(self, **kwargs):
+        fields = {"amount": Decimal("1000.00"), "io_type": "DEPOSIT", "description": "급여",
+                  **kwargs}
+        return StandingOrder.objects.create(account=self.account, start_at=self.start, **fields)
+
+    def test_due_order_posts_once_and_schedules_next_month(self):
+        order = self._order()
+
+        call_command("run_standing_orders", workers=1, stdout=mock.MagicMock())
+        call_command("run_standing_orders", workers=1, stdout=mock.MagicMock())
+
+        txns = TransactionHistory.objects.filter(account=self.account)
+        self.assertEqual(txns.count(), 1)
+        self.assertEqual(txns.get().method, "AUTO")
+        order.refresh_from_db()
+        expected = StandingOrder(start_at=self.start, next_run_at=self.start,
+                                 interval="MONTHLY").following_run()
+        self.assertEqual(order.next_run_at, expected)
+        self.assertEqual(order.due_at, expected)
+        self.assertIsNone(order.claimed_by)
+
+    def test_claimed_order_is_not_taken_by_another_executor(self):
+        order = self._order()
+        first, second = uuid.uuid4(), uuid.uuid4()
+
+        self.assertEqual(claim_due_orders(executor_id=first), [order.id])
+        self.assertEqual(claim_due_orders(executor_id=second), [])
+        self.assertEqual(execute_order(order.id, second), "lost")
+        self.assertEqual(execute_order(order.id, first), "posted")
+        self.account.refresh_from_db()
+        self.assertEqual(self.account.balance, Decimal("1000.00"))
+
+    def test_failed_withdrawal_is_retried_with_backoff(self):
+        order = self._order(io_type="WITHDRAW", max_attempts=2)
+        executor = uuid.uuid4()
+
+        claim_due_orders(executor_id=executor)
+        self.assertEqual(execute_order(order.id, executor), "retry")
+        order.refresh_from_db()
+        self.assertEqual(order.attempts, 1)
+        self.assertGreater(order.due_at, timezone.now())
+        self.assertEqual(order.next_run_at, self.start)
+        self.assertEqual(claim_due_orders(executor_id=executor), [])
+
+        # 마지막 시도까지 실패하면 이번 회차는 건너뛰고 다음 회차로
+        StandingOrder.objects.filter(pk=order.pk).update(due_at=self.start)
+        claim_due_orders(executor_id=executor)
+        self.assertEqual(execute_order(order.id, executor), "skipped")
+        order.refresh_from_db()
+        self.assertEqual(order.attempts, 0)
+        self.assertGreater(order.next_run_at, self.start)
+        self.assertFalse(TransactionHistory.objects.filter(account=self.account).exists())
+
+
+    def test_unexpected_error_counts_as_an_attempt_and_releases_the_lease(self):
+        order = self._order(max_attempts=2)
+        executor = uuid.uuid4()
+
+        claim_due_orders(executor_id=executor)
+        with mock.patch.object(Account, "apply_transaction", side_effect=DatabaseError("boom")):
+            self.assertEqual(execute_order(order.id, executor), "error")
+        order.refresh_from_db()
+        self.assertEqual(order.attempts, 1)
+        self.assertEqual(order.last_error, "DatabaseError: boom")
+        self.assertGreater(order.due_at, timezone.now())
+        self.assertIsNone(order.claimed_by)
+
+        # 계속 실패하면 max_attempts 에서 이번 회차를 건너뜀 (무한 재시도 없음)
+        StandingOrder.objects.filter(pk=order.pk).update(due_at=self.start)
+        claim_due_orders(executor_id=executor)
+        with mock.patch.object(Account, "apply_transaction", side_effect=DatabaseError("boom")):
+            self.assertEqual(execute_order(order.id, executor), "error")
+        order.refresh_from_db()
+        self.assertEqual(order.attempts, 0)
+        self.assertGreater(order.next_run_at, self.start)
+
+@override_settings(BANKING_ASYNC_POSTINGS=True)
+class AsyncPostingTests(BaseAPITest):
+    """비동기 접수: 202 + 핸들 → applier가 계좌별로 순서대로 일괄 반영"""
+
+    def _enqueue(self, account_id, amount, io_type="DEPOSIT"):
+        res = self.client.post(self.transactions_list_url, {
+            "account_id": account_id, "amount": amount, "io_type": io_type, "method": "TRANSFER",
+        }, format="json")
+        self.assertEqual(res.status_code, status.HTTP_202_ACCEPTED, res.content)
+        return res.json()
+
+    def test_queued_postings_are_applied_in_order_under_one_lock(self):
+        acc_id = self._create_account()["id"]
+        handles = [
+            self._enqueue(acc_id, "100.00"),
+            self._enqueue(acc_id, "300.00", io_type="WITHDRAW"),   # 잔액 100 → 거절
+            self._enqueue(acc_id, "50.00", io_type="WITHDRAW"),
+            self._enqueue(acc_id, "20.00"),
+        ]
+        self.assertFalse(TransactionHistory.objects.exists())
+        pending = self.client.get(handles[0]["status_url"]).json()
+        self.assertEqual(pending["status"], "PENDING")
+
+        # SAVEPOINT/RELEASE + 계좌 잠금 + 대기열 조회 + 출금 누적 조회/INSERT + 거래 bulk INSERT
+        # + 잔액 UPDATE + outbox bulk INSERT + 상태 bulk UPDATE
+        with self.assertNumQueries(10):
+            self.assertEqual(drain_account(acc_id), (3, 1))
+
+        statuses = [self.client.get(h["status_url"]).json() for h in handles]
+        self.assertEqual([p["status"] for p in statuses],
+                         ["APPLIED", "REJECTED", "APPLIED", "APPLIED"])
+        self.assertEqual(statuses[1]["error"], "잔액 부족")
+        self.assertEqual(
+            [p["transaction"]["balance_after"] for p in (statuses[0], statuses[2], statuses[3])],
+            ["100.00", "50.00", "70.00"],
+        )
+
+        chain = list(
+            TransactionHistory.objects.order_by("created_at")
+            .values_list("balance_after", flat=True)
+        )
+        self.assertEqual(chain, [Decimal("100.00"), Decimal("50.00"), Decimal("70.00")])
+        self.assertEqual(Account.objects.get(id=acc_id).balance, Decimal("70.00"))
+        self.assertFalse(PendingPosting.objects.filter(status="PENDING").exists())
+
+    def test_posting_status_is_private(self):
+        handle = self._enqueue(self._create_account()["id"], "100.00")
+        other = User.objects.create_user(email="other@example.com", password="pass1234",
+                                         is_active=True)
+        self.client.force_authenticate(other)
+        self.assertEqual(self.client.get(handle["status_url"]).status_code,
+                         status.HTTP_404_NOT_FOUND)
+
+
+class OutboxTests(BaseAPITest):
+    """원장 변경 피드: 같은 트랜잭션 기록 + 소비자별 오프셋/lease/정리"""
+
+    def test_ledger_changes_are_delivered_once_per_consumer(self):
+        acc_id = self._create_account()["id"]
+        self._create_transaction(acc_id, amount="500.00")
+        self._create_transaction(acc_id, amount="200.00", io_type="WITHDRAW", method="CARD")
+        self.client.delete(reverse("banking:account-detail", args=[acc_id]))
+        call_command("purge_deleted", stdout=StringIO())
+
+        received = []
+        consumer = LocalConsumer("notifications", received.extend, batch_size=2)
+        self.assertEqual(consumer.drain(), 4)
+        self.assertEqual(consumer.drain(), 0)
+        self.assertEqual(
+            [e.event_type for e in received],
+            ["account.created", "transaction.posted", "transaction.posted", "account.deleted"],
+        )
+        self.assertEqual(received[2].payload["balance_after"], "300.00")
+        self.assertTrue(all(e.user_id == self.user.id for e in received))
+
+        # 다른 소비자는 자기 오프셋으로 처음부터
+        self.assertEqual(LocalConsumer("analytics", lambda events: None).drain(), 4)
+
+    def _event(self, **kwargs):
+        return OutboxEvent.objects.create(event_type="t", user_id=self.user.pk,
+                                          aggregate_id=uuid.uuid4(), payload={}, **kwargs)
+
+    def test_late_commit_below_offset_is_still_delivered(self):
+        first, late, last = self._event(), self._event(), self._event()
+        late_id = late.id
+        late.delete()   # 아직 커밋 안 된 낮은 id (오래 걸리는 트랜잭션)
+        received = []
+        consumer = LocalConsumer("notifications",
+                                 lambda events: received.extend(e.id for e in events))
+        self.assertEqual(consumer.drain(), 2)
+        self.assertEqual(OutboxConsumer.objects.get(name="notifications").last_offset, last.id)
+
+        self._event(id=late_id)   # 오프셋이 지나간 뒤 커밋
+        self.assertEqual(consumer.drain(), 1)
+        self.assertEqual(received, [first.id, last.id, late_id])
+        self.assertEqual(OutboxConsumer.objects.get(name="notifications").gaps, {})
+
+    def test_gaps_that_never_fill_expire(self):
+        self._event()
+        hole = self._event()
+        self._event()
+        hole_id = hole.id
+        hole.delete()   # 롤백으로 영영 비는 id
+        batch = claim_batch("notifications")
+        self.assertEqual(set(batch.gaps), {str(hole_id)})
+        ack(batch)
+        self.assertEqual(claim_batch("notifications", gap_timeout=timedelta(0)).events, [])
+        self.assertEqual(OutboxConsumer.objects.get(name="notifications").gaps, {})
+
+    def test_leased_consumer_is_skipped_and_acked_events_are_pruned(self):
+        self._create_account()
+        batch = claim_batch("notifications")
+        self.assertEqual(len(batch.events), 1)
+        # 같은 이름의 다른 인스턴스는 lease 가 풀릴 때까지 못 가져감
+        self.assertIsNone(claim_batch("notifications"))
+
+        LocalConsumer("analytics", lambda events: None).drain()
+        self.assertEqual(prune(keep=timedelta(0)), 0)      # notifications 가 아직 ack 전
+        ack(batch)
+        self.assertEqual(prune(keep=timedelta(0)), 1)
+        self.assertFalse(OutboxEvent.objects.exists())
+
+
+class ArchiveTests(BaseAPITest):
+    """오래된 거래는 월별 압축 파일로, 목록/내보내기는 최근 + 보관 구간을 이어서"""
+
+    def setUp(self):
+        super().setUp()
+        self.archive_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.archive_dir, ignore_errors=True)
+        storages = {**settings.STORAGES, "archive": {
+            "BACKEND": "django.core.files.storage.FileSystemStorage",
+            "OPTIONS": {"location": self.archive_dir},
+        }}
+        override = override_settings(STORAGES=storages)
+        override.enable()
+        self.addCleanup(override.disable)
+
+        self.acc = Account.objects.get(id=self._create_account()["id"])
+        base = month_start(timezone.now() - timedelta(days=500)) + timedelta(days=2)
+        rows = ((base, "10.00"), (base + timedelta(hours=1), "20.00"),
+                (base + timedelta(days=40), "30.00"))
+        for when, amount in rows:
+            self.acc.apply_transaction(amount=Decimal(amount), io_type="DEPOSIT", method="CASH",
+                                       when=when)
+        self._create_transaction(str(self.acc.id), amount="5.00")
+        call_command("archive_transactions", stdout=StringIO())
+
+    def test_old_months_move_to_segments(self):
+        self.assertEqual(TransactionHistory.objects.filter(account=self.acc).count(), 1)
+        segments = list(ArchiveSegment.objects.filter(account=self.acc).order_by("month"))
+        self.assertEqual([s.row_count for s in segments], [2, 1])
+        self.assertEqual([s.closing_balance for s in segments],
+                         [Decimal("30.00"), Decimal("60.00")])
+
+    def test_list_and_export_stitch_hot_and_archived(self):
+        rows = self.client.get(self.transactions_list_url).json()
+        self.assertEqual([r["balance_after"] for r in rows], ["65.00", "60.00", "30.00", "10.00"])
+
+        res = self.client.get(reverse("banking:transaction-export"))
+        lines = b"".join(res.streaming_content).decode().splitlines()
+        self.assertEqual(len(lines), 5)
+        self.assertIn(",65.00,", lines[1])
+        self.assertIn(",10.00,", lines[-1])
+
+    def test_rearchive_replaces_files_only_after_commit(self):
+        storage = archive_storage()
+        first = ArchiveSegment.objects.filter(account=self.acc).order_by("month").first()
+        late = first.min_created_at + timedelta(minutes=30)   # 이미 보관된 달에 늦게 들어온 거래
+        self.acc.apply_transaction(amount=Decimal("1.00"), io_type="DEPOSIT", method="CASH",
+                                   when=late)
+
+        # 기록 중 실패 → 롤백: 새 파일은 지우고, 기존 파일/행은 그대로
+        with mock.patch("apps.banking.archive.ArchiveSegment.objects.update_or_create",
+                        side_effect=DatabaseError("boom")), self.assertRaises(DatabaseError):
+            archive_account(self.acc.id)
+        self.assertEqual(ArchiveSegment.objects.get(pk=first.pk).path, first.path)
+        paths = ArchiveSegment.objects.filter(account=self.acc).values_list("path", flat=True)
+        self.assertEqual(sorted(storage.listdir(f"transactions/{self.acc.id}")[1]),
+                         sorted(p.rsplit("/", 1)[1] for p in paths))
+        self.assertTrue(
+            TransactionHistory.objects.filter(account=self.acc, created_at=late).exists()
+        )
+
+        with self.captureOnCommitCallbacks(execute=True):
+            archive_account(self.acc.id)
+        segment = ArchiveSegment.objects.get(pk=first.pk)
+        self.assertNotEqual(segment.path, first.path)
+        self.assertFalse(storage.exists(first.path))
+        self.assertEqual(segment.row_count, 3)
+        rows = self.client.get(self.transactions_list_url).json()
+        self.assertEqual(len(rows), 5)
+
+    def test_batch_finds_archived_transactions(self):
+        [segment, _] = ArchiveSegment.objects.filter(account=self.acc).order_by("month")
+        archived = read_segment(segment)[0]
+        hot = TransactionHistory.objects.get(account=self.acc)
+        unknown = str(uuid7())
+        res = self.client.post(reverse("banking:transaction-batch"),
+                               {"ids": [str(archived.id), unknown, str(hot.id)]}, format="json")
+        self.assertEqual(res.status_code, status.HTTP_200_OK, res.content)
+        self.assertEqual([t["id"] for t in res.json()["results"]], [str(archived.id), str(hot.id)])
+        self.assertEqual(res.json()["results"][0]["balance_after"], "10.00")
+        self.assertEqual(res.json()["missing"], [unknown])
+
+    def test_recent_range_never_opens_archive_files(self):
+        since = (timezone.now() - timedelta(days=1)).date().isoformat()
+        with mock.patch("apps.banking.archive.read_segment",
+                        side_effect=AssertionError("archive read")):
+            res = self.client.get(self.transactions_list_url, {"from": since})
+        self.assertEqual(res.status_code, status.HTTP_200_OK)
+        self.assertEqual(len(res.json()), 1)
+
+
+    def test_cursor_page_reads_only_the_archive_months_it_needs(self):
+        with mock.patch("apps.banking.archive.read_segment", wraps=read_segment) as read:
+            res = self.client.get(self.transactions_list_url, {"limit": 1})
+        self.assertEqual([r["balance_after"] for r in res.json()["results"]], ["65.00"])
+        self.assertEqual(read.call_count, 1)   # 최신 달 세그먼트만 (그보다 오래된 달은 열지 않음)
+
+    def test_export_opens_archive_months_lazily(self):
+        with mock.patch("apps.banking.archive.read_segment", wraps=read_segment) as read:
+            res = self.client.get(reverse("banking:transaction-export"))
+            self.assertEqual(read.call_count, 0)   # 응답 생성 시점에는 파일을 열지 않음
+            lines = b"".join(res.streaming_content).decode().splitlines()
+        self.assertEqual(read.call_count, 2)
+        self.assertEqual(len(lines), 5)
+
+
+class StatementTests(BaseAPITest):
+    """끝난 달 명세서는 한 번 만들어 파일로, 다음 달은 전월 closing_balance 에서 시작"""
+
+    def setUp(self):
+        super().setUp()
+        self.statement_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.statement_dir, ignore_errors=True)
+        storages = {**settings.STORAGES, "statements": {
+            "BACKEND": "django.core.files.storage.FileSystemStorage",
+            "OPTIONS": {"location": self.statement_dir},
+        }}
+        override = override_settings(STORAGES=storages)
+        override.enable()
+        self.addCleanup(override.disable)
+
+        self.acc = Account.objects.get(id=self._create_account()["id"])
+        self.month = last_closed_month()
+        Account.objects.filter(pk=self.acc.pk).update(created_at=self.month)
+        for day, amount, io_type in ((1, "100.00", "DEPOSIT"), (2, "30.00", "WITHDRAW")):
+            self.acc.apply_transaction(amount=Decimal(amount), io_type=io_type, method="CASH",
+                                       when=self.month + timedelta(days=day))
+        self._create_transaction(str(self.acc.id), amount="5.00")   # 이번 달 → 명세서에 없음
+
+    def test_generate_once_and_serve_file(self):
+        call_command("generate_statements", "--workers", "1", stdout=StringIO())
+        # 이미 있으면 건너뜀
+        call_command("generate_statements", "--workers", "1", stdout=StringIO())
+        statement = Statement.objects.get(account=self.acc)
+        self.assertEqual((statement.opening_balance, statement.closing_balance),
+                         (Decimal("0.00"), Decimal("70.00")))
+        self.assertEqual(statement.totals["io_type"], {"DEPOSIT": "100.00", "WITHDRAW": "30.00"})
+
+        url = reverse("banking:account-statements", args=[self.acc.id])
+        self.assertEqual(self.client.get(url).json()[0]["month"], f"{self.month:%Y-%m}")
+        res = self.client.get(reverse("banking:account-statement-file",
+                                      args=[self.acc.id, f"{self.month:%Y-%m}"]))
+        self.assertEqual(res.status_code, status.HTTP_200_OK)
+        document = json.loads(b"".join(res.streaming_content))
+        self.assertEqual([line["balance_after"] for line in document["lines"]], ["100.00", "70.00"])
+
+    def test_balance_at_and_checkpoint(self):
+        self.assertEqual(balance_at(self.acc.id, self.month), Decimal("0.00"))
+        self.assertEqual(balance_at(self.acc.id, self.month + timedelta(days=1, hours=12)),
+                         Decimal("100.00"))
+        self.assertEqual(balance_at(self.acc.id, timezone.now()), Decimal("75.00"))
+
+        # 전월 거래를 지워도 명세서 체크포인트로 시작 잔액 결정
+        call_command("generate_statements", "--workers", "1", stdout=StringIO())
+        TransactionHistory.objects.filter(account=self.acc,
+                                          created_at__lt=self.month + timedelta(days=3)).delete()
+        self.assertEqual(balance_at(self.acc.id, self.month + timedelta(days=40)), Decimal("70.00"))
+
+
+class MoneyMinorUnitsTests(BaseAPITest):
+    """금액 BIGINT(최소 단위) 저장: dual-write → backfill → minor 읽기, API 출력은 그대로"""
+
+    def test_backfill_then_minor_mode_keeps_json_identical(self):
+        acc = self._create_account()
+        self._create_transaction(acc["id"], amount="1234.50")
+        self._create_transaction(acc["id"], amount="0.05", io_type="WITHDRAW")
+        self.assertFalse(TransactionHistory.objects.filter(amount_minor__isnull=False).exists())
+
+        with override_settings(MONEY_STORAGE={"MODE": "dual"}):
+            self._create_transaction(acc["id"], amount="10.00")
+            call_command("backfill_minor_units", "--batch-size", "1", stdout=StringIO())
+            out = StringIO()
+            call_command("backfill_minor_units", "--check", stdout=out)
+            self.assertNotRegex(out.getvalue(), r"(missing|mismatch)': [1-9]")
+        self.assertEqual(Account.objects.get(id=acc["id"]).balance_minor, 124445)
+        self.assertEqual(
+            list(TransactionHistory.objects.order_by("created_at")
+                 .values_list("amount_minor", flat=True)),
+            [123450, 5, 1000],
+        )
+
+        urls = [self.transactions_list_url, self.accounts_list_url, reverse("banking:dashboard")]
+        decimal = [self.client.get(url).json() for url in urls]
+        with override_settings(MONEY_STORAGE={"MODE": "minor"}):
+            minor = [self.client.get(url).json() for url in urls]
+        for data in (decimal[2], minor[2]):
+            data.pop("since")   # 요청 시각 기준
+        self.assertEqual(minor, decimal)
+        self.assertEqual(minor[2]["in_30d"], "1244.50")
+
+
+class TimeOrderedIdTests(BaseAPITest):
+    """새 행은 UUIDv7 PK, 커서 페이지는 (created_at, id) 로 빠짐없이"""
+
+    def test_uuid7_is_time_ordered(self):
+        ids = [uuid7() for _ in range(5000)]
+        self.assertEqual(ids, sorted(ids))
+        self.assertEqual({u.version for u in ids}, {7})
+        self.assertLess(abs((uuid7_time(ids[0]) - timezone.now()).total_seconds()), 5)
+        self.assertIsNone(uuid7_time(uuid.uuid4()))
+
+    def test_cursor_pages_use_id_as_tie_breaker(self):
+        acc = self._create_account()
+        for i in range(5):
+            self._create_transaction(acc["id"], amount=f"{i + 1}.00")
+        self.assertEqual(uuid.UUID(acc["id"]).version, 7)
+        TransactionHistory.objects.update(created_at=timezone.now())   # 같은 시각 → id 로만 구분
+
+        seen, url, params = [], self.transactions_list_url, {"limit": 2}
+        while url:
+            res = self.client.get(url, params)
+            self.assertEqual(res.status_code, status.HTTP_200_OK)
+            seen += [row["id"] for row in res.json()["results"]]
+            url, params = res.json()["next"], None
+        self.assertEqual(seen,
+                         [row["id"] for row in self.client.get(self.transactions_list_url).json()])
+        self.assertEqual(len(set(seen)), 5)
+
+        res = self.client.get(self.transactions_list_url, {"cursor": "garbage"})
+        self.assertEqual(res.status_code, status.HTTP_400_BAD_REQUEST)
+
+
+@override_settings(WITHDRAWAL_LIMITS={"CASH": {"DAILY": "100.00", "PER_TRANSACTION": "60.00"}})
+class WithdrawalLimitTests(BaseAPITest):
+    """출금 한도: 잠금 안에서 (계좌, 오늘, 거래타입) 누적 행 하나로 검사"""
+
+    def _withdraw(self, acc_id, amount, method="CASH"):
+        return self.client.post(self.transactions_list_url, {
+            "account_id": acc_id, "amount": amount, "io_type": "WITHDRAW", "method": method,
+        }, format="json")
+
+    def test_daily_and_per_transaction_limits(self):
+        acc_id = self._create_account()["id"]
+        self._create_transaction(acc_id, amount="1000.00")
+        self.assertEqual(self._withdraw(acc_id, "50.00").status_code, status.HTTP_201_CREATED)
+        self.assertEqual(self._withdraw(acc_id, "50.00").status_code, status.HTTP_201_CREATED)
+
+        res = self._withdraw(acc_id, "10.00")
+        self.assertEqual(res.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertIn("일일 출금 한도 초과", str(res.json()))
+        self.assertIn("1회 출금 한도 초과", str(self._withdraw(acc_id, "70.00").json()))
+        self.assertEqual(self._withdraw(acc_id, "500.00", method="CARD").status_code,
+                         status.HTTP_201_CREATED)
+
+        counters = {c.method: (c.amount, c.count)
+                    for c in DailyWithdrawal.objects.filter(account_id=acc_id)}
+        self.assertEqual(counters, {"CASH": (Decimal("100.00"), 2), "CARD": (Decimal("500.00"), 1)})
+        self.assertEqual(Account.objects.get(id=acc_id).balance, Decimal("400.00"))
+
+    def test_rebuild_recomputes_counters_from_history(self):
+        acc_id = self._create_account()["id"]
+        self._create_transaction(acc_id, amount="1000.00")
+        self._withdraw(acc_id, "40.00")
+        self._withdraw(acc_id, "30.00", method="CARD")
+        DailyWithdrawal.objects.filter(method="CASH").update(amount=Decimal("99.00"), count=9)
+        DailyWithdrawal.objects.filter(method="CARD").delete()
+
+        call_command("rebuild_withdrawal_counters", stdout=StringIO())
+        counters = {c.method: (c.amount, c.count)
+                    for c in DailyWithdrawal.objects.filter(account_id=acc_id)}
+        self.assertEqual(counters, {"CASH": (Decimal("40.00"), 1), "CARD": (Decimal("30.00"), 1)})
+
+
+@override_settings(LIVE_EVENTS={"HEARTBEAT": 0.05, "MAX_AGE": 5, "POLL_INTERVAL": 0})
+class LiveEventsTests(BaseAPITest):
+    """SSE: 접속 시 잔액 스냅샷, 커밋되면 outbox 이벤트 푸시, Last-Event-ID 부터 이어받기"""
+
+    def setUp(self):
+        super().setUp()
+        reset_frontiers()   # 테스트마다 롤백되어 outbox id 가 다시 쓰임
+
+    def test_cursor_waits_for_late_commits_below_newer_events(self):
+        def event():
+            return OutboxEvent.objects.create(event_type="t", user_id=self.user.pk,
+                                              aggregate_id=uuid.uuid4(), payload={})
+        fetch_events("default", self.user.pk, 0)   # Frontier 시작 위치
+        first, late, last = event(), event(), event()
+        late_id = late.id
+        late.delete()   # 아직 커밋 안 됨
+
+        cursor = Cursor(0)
+        events, truncated, position = fetch_events("default", self.user.pk, cursor.watermark)
+        taken = cursor.take(events, truncated=truncated, frontier=position)
+        self.assertEqual([e.id for e in taken], [first.id, last.id])
+        self.assertEqual(cursor.watermark, first.id)   # 빈 id 아래에서 멈춤 (재접속도 여기부터)
+
+        OutboxEvent.objects.create(id=late_id, event_type="t", user_id=self.user.pk,
+                                   aggregate_id=uuid.uuid4(), payload={})
+        events, truncated, position = fetch_events("default", self.user.pk, cursor.watermark,
+                                                   exclude=cursor.sent)
+        taken = cursor.take(events, truncated=truncated, frontier=position)
+        self.assertEqual([e.id for e in taken], [late_id])
+        self.assertEqual(cursor.watermark, last.id)
+
+    async def _frames(self, response, count):
+        frames, buffer = [], ""
+        async for chunk in response.streaming_content:
+            buffer += chunk.decode() if isinstance(chunk, bytes) else chunk
+            while "\n\n" in buffer:
+                frame, buffer = buffer.split("\n\n", 1)
+                if frame.startswith("event:"):
+                    fields = dict(line.split(": ", 1) for line in frame.splitlines())
+                    frames.append((fields["event"], int(fields["id"]), json.loads(fields["data"])))
+            if len(frames) >= count:
+                return frames
+        return frames
+
+    async def test_snapshot_then_push_and_resume(self):
+        acc = await sync_to_async(self._create_account)()
+        self.async_client.cookies = self.client.cookies
+        url = reverse("banking:events")
+
+        res = await self.async_client.get(url)
+        self.assertEqual(res["Content-Type"], "text/event-stream")
+        stream = res.streaming_content
+        [(name, last_id, data)] = await self._frames(res, 1)
+        self.assertEqual(name, "snapshot")
+        self.assertEqual([a["id"] for a in data["accounts"]], [acc["id"]])
+
+        def deposit():
+            with self.captureOnCommitCallbacks(execute=True):
+                self._create_transaction(acc["id"], amount="70.00")
+        await sync_to_async(deposit)()
+        [(name, event_id, data)] = await self._frames(res, 1)
+        self.assertEqual((name, data["balance_after"]), ("transaction.posted", "70.00"))
+        self.assertGreater(event_id, last_id)
+        await stream.aclose()
+
+        # 재접속: Last-Event-ID 이후 이벤트만 (스냅샷 없이)
+        await sync_to_async(self._create_transaction)(acc["id"], amount="5.00")
+        res = await self.async_client.get(url, headers={"Last-Event-ID": str(event_id)})
+        [(name, _, data)] = await self._frames(res, 1)
+        self.assertEqual((name, data["balance_after"]), ("transaction.posted", "75.00"))
+        await res.streaming_content.aclose()
+
+    def test_event_ids_are_scoped_by_shard(self):
+        from .views_live import _event_id, _last_event_id
+
+        def resume(value, alias):
+            return _last_event_id(RequestFactory().get("/", HTTP_LAST_EVENT_ID=value), alias)
+
+        self.assertEqual((_event_id("default", 7), resume("7", "default")), ("7", 7))
+        with override_settings(LEDGER_SHARDS=["shard_1", "shard_2"]):
+            self.assertEqual(_event_id("shard_1", 7), "shard_1:7")
+            self.assertEqual(resume("shard_1:7", "shard_1"), 7)
+            # 다른 샤드의 id(이동 전 접속) 나 샤딩 전 형식이면 스냅샷부터
+            self.assertIsNone(resume("shard_1:7", "shard_2"))
+            self.assertIsNone(resume("7", "shard_1"))
+
+    async def test_requires_authentication(self):
+        res = await self.async_client.get(reverse("banking:events"))
+        self.assertEqual(res.status_code, status.HTTP_401_UNAUTHORIZED)
+
+
+class BatchRetrieveTests(BaseAPITest):
+    """id 목록 일괄 조회: 쿼리 한 번, 요청 순서 유지, 남의 것/없는 것은 구분 없이 missing"""
+
+    def setUp(self):
+        super().setUp()
+        self.a1 = self._create_account(account_number="100000000001")
+        self.a2 = self._create_account(account_number="100000000002")
+        other = User.objects.create_user(email="other@example.com", password="pass1234",
+                                         is_active=True)
+        self.foreign = Account.objects.create(user=other, bank_code="KB",
+                                              account_number="900000000001")
+
+    def test_accounts_keep_requested_order_and_hide_foreign_ids(self):
+        unknown = str(uuid7())
+        ids = [self.a2["id"], str(self.foreign.id), "not-a-uuid", unknown,
+               self.a1["id"], self.a2["id"]]
+        url = reverse("banking:account-batch")
+        with self.assertNumQueries(1):
+            res = self.client.get(url, {"ids": ",".join(ids)})
+        self.assertEqual(res.status_code, status.HTTP_200_OK, res.content)
+        self.assertEqual([a["id"] for a in res.json()["results"]], [self.a2["id"], self.a1["id"]])
+        self.assertEqual(res.json()["missing"], [str(self.foreign.id), "not-a-uuid", unknown])
+
+    def test_transactions_by_post_body(self):
+        t1 = self._create_transaction(self.a1["id"], amount="10.00")
+        t2 = self._create_transaction(self.a2["id"], amount="20.00")
+        foreign = TransactionHistory.objects.create(
+            account=self.foreign, amount=Decimal("5.00"), balance_after=Decimal("5.00"),
+            io_type="DEPOSIT", method="CASH",
+        )
+        url = reverse("banking:transaction-batch")
+        res = self.client.post(url, {"ids": [t2["id"], str(foreign.id), t1["id"]]}, format="json")
+        self.assertEqual(res.status_code, status.HTTP_200_OK, res.content)
+        self.assertEqual([t["id"] for t in res.json()["results"]], [t2["id"], t1["id"]])
+        self.assertEqual(res.json()["missing"], [str(foreign.id)])
+
+    def test_rejects_empty_or_oversized_requests(self):
+        url = reverse("banking:transaction-batch")
+        self.assertEqual(self.client.get(url).status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(self.client.post(url, {"ids": "x"}, format="json").status_code,
+                         status.HTTP_400_BAD_REQUEST)
+        res = self.client.get(url, {"ids": ",".join(str(uuid7()) for _ in range(201))})
+        self.assertEqual(res.status_code, status.HTTP_400_BAD_REQUEST)
+
+
+class PurgeTests(BaseAPITest):
+    """삭제 요청은 202 + 표시만, 하위 데이터는 워커가 배치 DELETE 로 정리"""
+
+    def _account_with_history(self, number, count):
+        acc = Account.objects.get(id=self._create_account(account_number=number)["id"])
+        for _ in range(count):
+            acc.apply_transaction(amount=Decimal("10.00"), io_type="DEPOSIT", method="CASH")
+        return acc
+
+    def test_account_delete_is_deferred_and_purged_in_batches(self):
+        acc = self._account_with_history("111122223333", 7)
+        keep = self._account_with_history("444455556666", 2)
+        res = self.client.delete(reverse("banking:account-detail", args=[acc.id]))
+        self.assertEqual(res.status_code, status.HTTP_202_ACCEPTED)
+        job_id = res.json()["job_id"]
+        # 요청 안에서는 지우지 않음
+        self.assertEqual(TransactionHistory.objects.filter(account=acc).count(), 7)
+        # 삭제 중인 계좌로는 거래 불가
+        res = self.client.post(self.transactions_list_url,
+                               {"account_id": str(acc.id), "amount": "1.00",
+                                "io_type": "DEPOSIT", "method": "CASH"}, format="json")
+        self.assertEqual(res.status_code, status.HTTP_404_NOT_FOUND)
+
+        call_command("purge_deleted", "--batch-size", "3", stdout=StringIO())
+        job = PurgeJob.objects.get(id=job_id)
+        self.assertEqual(job.status, "DONE")
+        self.assertEqual(job.progress["transaction_history"], 7)
+        self.assertFalse(Account.objects.filter(id=acc.id).exists())
+        self.assertEqual(TransactionHistory.objects.filter(account=keep).count(), 2)
+
+    def test_user_delete_deactivates_then_purges_everything(self):
+        self._account_with_history("111122223333", 3)
+        res = self.client.delete(reverse("users:me"))
+        self.assertEqual(res.status_code, status.HTTP_202_ACCEPTED)
+        self.user.refresh_from_db()
+        self.assertFalse(self.user.is_active)
+        self.assertEqual(self.client.get(self.accounts_list_url).status_code,
+                         status.HTTP_401_UNAUTHORIZED)
+
+        call_command("purge_deleted", stdout=StringIO())
+        self.assertFalse(User.objects.filter(pk=self.user.pk).exists())
+        self.assertFalse(TransactionHistory.objects.exists())
+        self.assertEqual(PurgeJob.objects.get(target_id=self.user.pk).progress["accounts"], 1)
+
+
+class ShardSchemaTests(TestCase):
+    """
+    샤드 DB 는 원장 테이블만 migrate
+    → 다른 DB(users) 를 가리키는 FK 제약이 있으면 PostgreSQL 에서 migrate 실패
+    (테스트 DB 생성 자체가 migrate 이므로
+    --ds=config.settings.dev + POSTGRES_SHARD_HOSTS 로 돌리면 PostgreSQL 에서 확인)
+    """
+    databases = {"default", *shard_aliases()}
+
+    def test_ledger_migrations_never_create_cross_database_fks(self):
+        # DB 와 무관하게: 샤드에서 실행될 원장 모델 마이그레이션이
+        # 한 번이라도 원장 밖 모델로 FK 제약을 만들면 실패
+        loader = MigrationLoader(None, ignore_no_migrations=True)
+        offending = []
+        for (app_label, name), migration in loader.disk_migrations.items():
+            for op in migration.operations:
+                if isinstance(op, migrations.CreateModel):
+                    model, fields = op.name, op.fields
+                elif isinstance(op, (migrations.AddField, migrations.AlterField)):
+                    model, fields = op.model_name, [(op.name, op.field)]
+                else:
+                    continue
+                if f"{app_label}.{model.lower()}" not in LEDGER_MODELS:
+                    continue
+                for field_name, field in fields:
+                    target = getattr(field.remote_field, "model", None)
+                    if target is None or not field.db_constraint:
+                        continue
+                    label = target.lower() if isinstance(target, str) else target._meta.label_lower
+                    if label not in LEDGER_MODELS:
+                        offending.append(f"{app_label}.{name}: {model}.{field_name} → {label}")
+        self.assertEqual(offending, [])
+
+    @skipUnless(shard_aliases() and shard_aliases() <= set(settings.DATABASES),
+                "원장 샤드 DB 가 설정되지 않음")
+    def test_shards_have_only_ledger_tables_and_no_user_fk(self):
+        for alias in sorted(shard_aliases()):
+            conn = connections[alias]
+            with self.subTest(alias=alias, vendor=conn.vendor), conn.cursor() as cursor:
+                tables = set(conn.introspection.table_names(cursor))
+                self.assertIn("accounts", tables)
+                self.assertNotIn("users", tables)
+                constraints = conn.introspection.get_constraints(cursor, "accounts")
+                fks = [c["foreign_key"] for c in constraints.values() if c["foreign_key"]]
+                self.assertEqual(fks, [])
+
+
+@skipUnless({"shard_1", "shard_2"} <= set(settings.DATABASES),
+            "원장 샤드 DB(shard_1, shard_2)가 설정되지 않음")
+@override_settings(LEDGER_SHARDS=["shard_1", "shard_2"], SHARD_DIRECTORY_TTL=0)
+class ShardingTests(BaseAPITest):
+    """사용자 id 해시로 원장 샤드 결정, 이동된 사용자는 user_shards 로 조회"""
+    databases = {"default", "shard_1", "shard_2"}
+
+    def _other(self, alias):
+        return "shard_2" if alias == "shard_1" else "shard_1"
+
+    def test_ring_spreads_keys_and_moves_only_to_new_shard(self):
+        keys = [str(uuid.uuid4()) for _ in range(2000)]
+        two = ShardRing(["shard_1", "shard_2"])
+        three = ShardRing(["shard_1", "shard_2", "shard_3"])
+        before = {k: two.shard_for(k) for k in keys}
+        self.assertGreater(sum(v == "shard_1" for v in before.values()), 600)
+        moved = [k for k in keys if three.shard_for(k) != before[k]]
+        self.assertTrue(all(three.shard_for(k) == "shard_3" for k in moved))
+        self.assertLess(len(moved), len(keys) / 2)
+
+    def test_ledger_rows_land_on_owner_shard(self):
+        home = shard_for_user(self.user.pk)
+        acc = self._create_account()
+        self._create_transaction(acc["id"])
+        self.assertTrue(TransactionHistory.objects.using(home).filter(account_id=acc["id"]).exists())
+        self.assertFalse(Account.objects.using(self._other(home)).exists())
+        self.assertFalse(Account.objects.using("default").exists())
+
+        self.assertEqual(len(self.client.get(self.transactions_list_url).json()), 1)
+        res = self.client.get(reverse("banking:dashboard"))
+        self.assertEqual(res.json()["total_balance"], "50000.00")
+
+    def test_move_user_copies_then_switches_directory(self):
+        home = shard_for_user(self.user.pk)
+        target = self._other(home)
+        acc = self._create_account()
+        for _ in range(3):
+            self._create_transaction(acc["id"], amount="10.00")
+
+        call_command("move_user_shard", str(self.user.pk), target, "--batch-size", "2",
+                     stdout=StringIO())
+        self.assertEqual(UserShard.objects.get(user_id=self.user.pk).alias, target)
+        self.assertEqual(
+            TransactionHistory.objects.using(target).filter(account_id=acc["id"]).count(), 3
+        )
+        self.assertFalse(Account.objects.using(home).exists())
+
+        # 이동 후에도 같은 API 로 조회/거래 (새 거래는 대상 샤드로)
+        self._create_transaction(acc["id"], amount="5.00")
+        self.assertEqual(len(self.client.get(self.transactions_list_url).json()), 4)
+        self.assertEqual(Account.objects.using(target).get(id=acc["id"]).balance, Decimal("35.00"))
+
+    def test_workers_leave_moving_users_alone(self):
+        home = shard_for_user(self.user.pk)
+        acc_id = self._create_account()["id"]
+        with use_shard(home):
+            account = Account.objects.get(id=acc_id)
+            StandingOrder.objects.create(account=account, amount=Decimal("10.00"),
+                                         io_type="DEPOSIT",
+                                         start_at=timezone.now() - timedelta(minutes=1))
+            PendingPosting.objects.create(account=account, amount=Decimal("5.00"),
+                                          io_type="DEPOSIT", method="CASH")
+        shard = UserShard.objects.create(user_id=self.user.pk, alias=home, moving=True)
+
+        # 이동 중(잠금 대기 후 전환된 경우 포함)이면 원본 샤드에 거래를 남기지 않음
+        for moving, alias in ((True, home), (False, self._other(home))):
+            UserShard.objects.filter(pk=shard.pk).update(moving=moving, alias=alias)
+            with use_shard(home):
+                executor = uuid.uuid4()
+                ids = claim_due_orders(executor_id=executor)
+                self.assertEqual([execute_order(i, executor, home) for i in ids], ["moved"])
+                StandingOrder.objects.update(claimed_by=None, claimed_until=None)
+                self.assertEqual(drain_account(acc_id), (0, 0))
+        self.assertFalse(TransactionHistory.objects.using(home).exists())
+        self.assertEqual(PendingPosting.objects.using(home).get().status, "PENDING")
+
+    def test_move_carries_pending_work_and_undelivered_events(self):
+        home = shard_for_user(self.user.pk)
+        target = self._other(home)
+        acc_id = self._create_account()["id"]
+        self._create_transaction(acc_id, amount="10.00")
+        with use_shard(home):
+            account = Account.objects.get(id=acc_id)
+            StandingOrder.objects.create(account=account, amount=Decimal("10.00"),
+                                         io_type="DEPOSIT",
+                                         start_at=timezone.now() - timedelta(minutes=1),
+                                         claimed_by=uuid.uuid4(),
+                                         claimed_until=timezone.now() + timedelta(minutes=5))
+            PendingPosting.objects.create(account=account, amount=Decimal("5.00"),
+                                          io_type="DEPOSIT", method="CASH")
+            events = OutboxEvent.objects.filter(user_id=self.user.pk).count()
+
+        call_command("move_user_shard", str(self.user.pk), target, stdout=StringIO())
+        self.assertFalse(OutboxEvent.objects.using(home).filter(user_id=self.user.pk).exists())
+        self.assertEqual(
+            OutboxEvent.objects.using(target).filter(user_id=self.user.pk).count(), events
+        )
+
+        # 대상 샤드의 워커가 바로 이어서 처리 (원본 실행기의 lease 는 넘어오지 않음)
+        with use_shard(target):
+            executor = uuid.uuid4()
+            ids = claim_due_orders(executor_id=executor)
+            self.assertEqual([execute_order(i, executor, target) for i in ids], ["posted"])
+            self.assertEqual(drain_account(acc_id), (1, 0))
+        self.assertEqual(Account.objects.using(target).get(id=acc_id).balance, Decimal("25.00"))
+
+    def test_account_owner_check_reports_orphans(self):
+        acc_id = self._create_account()["id"]
+        call_command("check_account_owners", stdout=StringIO())
+
+        # FK 제약이 없으므로 없는 사용자를 가리키는 계좌가 생길 수 있다 → 점검에서 실패
+        Account.objects.using(shard_for_user(self.user.pk)).filter(pk=acc_id).update(user_id=uuid.uuid4())
+        out = StringIO()
+        with self.assertRaises(CommandError):
+            call_command("check_account_owners", stdout=out)
+        self.assertIn(str(acc_id), out.getvalue())
+
+    def test_batch_lookup_is_allowed_while_moving(self):
+        acc = self._create_account()
+        UserShard.objects.create(user_id=self.user.pk, alias=shard_for_user(self.user.pk),
+                                 moving=True)
+        for url in (reverse("banking:account-batch"), reverse("banking:transaction-batch")):
+            res = self.client.post(url, {"ids": [acc["id"]]}, format="json")
+            self.assertEqual(res.status_code, status.HTTP_200_OK, res.content)
+        self.assertEqual(
+            self.client.post(self.accounts_list_url, {}, format="json").status_code,
+            status.HTTP_503_SERVICE_UNAVAILABLE,
+        )
+
+    def test_writes_are_refused_while_moving(self):
+        acc = self._create_account()
+        UserShard.objects.create(user_id=self.user.pk, alias=shard_for_user(self.user.pk),
+                                 moving=True)
+        res = self.client.post(self.transactions_list_url,
+                               {"account_id": acc["id"], "amount": "1.00",
+                                "io_type": "DEPOSIT", "method": "CASH"}, format="json")
+        self.assertEqual(res.status_code, status.HTTP_503_SERVICE_UNAVAILABLE)
+        self.assertEqual(self.client.get(self.accounts_list_url).status_code, status.HTTP_200_OK)
+
+
+@override_settings(DB_READ_REPLICAS=["replica"],
+                   DB_REPLICA_PIN={"COOKIE_NAME": "db_pin", "SECONDS": 5})
+@skipUnless(connection.vendor in ("sqlite", "postgresql"), "EXPLAIN 형식을 아는 DB 에서만")
+class QueryPlanTests(TestCase):
+    """
+    지원하는 거래내역 필터 조합은 인덱스로 찾고,
+    한 계좌 조회는 정렬 없이 인덱스 순서로 읽어야 함
+    """
+
+    EXPECTED_INDEX = {
+        "io_type": "idx_txn_acct_io",
+        "method": "idx_txn_acct_method_created",
+        "amount": "idx_txn_acct_amount",
+        "date": "idx_txn_acct_created",
+        "account": "idx_txn_acct_created",
+        "account_io_type": "idx_txn_acct_io",
+        "account_method": "idx_txn_acct_method_created",
+        "account_amount": "idx_txn_acct_amount",
+        "account_date": "idx_txn_acct_created",
+    }
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.user, cls.account = seed(users=30, accounts=3, rows=150)
+
+    def test_supported_shapes_use_an_index(self):
+        for shape in SHAPES.values():
+            with self.subTest(shape=shape.name):
+                report = inspect_shape(self.user, shape, account_id=self.account.id)
+                self.assertEqual(report.problems, [], [s.detail for s in report.steps])
+                self.assertTrue(report.indexes, [s.detail for s in report.steps])
+                if shape.name in self.EXPECTED_INDEX:
+                    self.assertIn(self.EXPECTED_INDEX[shape.name], report.indexes)
+
+    @skipUnless(connection.vendor == "sqlite", "SQLite 는 DDL 도 테스트 트랜잭션 안에서 롤백")
+    def test_advisor_flags_missing_index(self):
+        with connection.cursor() as cursor:
+            cursor.execute("DROP INDEX idx_txn_acct_method_created")
+        kept = [i for i in TransactionHistory._meta.indexes
+                if i.name != "idx_txn_acct_method_created"]
+        with mock.patch.object(TransactionHistory._meta, "indexes", kept):
+            report = inspect_shape(self.user, SHAPES["account_method"], account_id=self.account.id)
+        self.assertIn("transaction_history: method 를 인덱스 밖에서 거름", report.problems)
+        self.assertEqual(report.suggestion.fields, ["account", "method", "-created_at", "-id"])
+
+    def test_command_rejects_unsupported_vendor_before_seeding(self):
+        seed = "apps.banking.management.commands.explain_transaction_filters.seed"
+        with mock.patch.object(connection, "vendor", "oracle"), mock.patch(seed) as seeded:
+            with self.assertRaisesMessage(CommandError, "oracle"):
+                call_command("explain_transaction_filters", stdout=StringIO())
+        seeded.assert_not_called()
+
+
+class CoalescingTests(SimpleTestCase):
+    """
+    동일 조회 합치기: 실행 중인 leader 하나만 계산, 나머지는 결과 공유
+    시간 초과·실패 시 각자
+    """
+
+    def setUp(self):
+        cache.clear()
+        coalesce.reset_stats()
+
+    def _leader_then_followers(self, compute, started, followers):
+        """leader 가 compute 안에 들어간 뒤 followers 개를 동시에 보냄 → 모든 응답 (leader 먼저)"""
+        results = []
+
+        def call():
+            results.append(coalesce.single_flight("t", "key", compute))
+        leader = threading.Thread(target=call)
+        leader.start()
+        self.assertTrue(started.wait(2))
+        threads = [threading.Thread(target=call) for _ in range(followers)]
+        for t in threads:
+            t.start()
+        return [leader, *threads], results
+
+    def test_followers_share_the_leaders_result(self):
+        started, release, calls = threading.Event(), threading.Event(), []
+
+        def compute():
+            calls.append(1)
+            started.set()
+            release.wait(2)
+            return Response({"n": len(calls)})
+        threads, results = self._leader_then_followers(compute, started, 3)
+        time.sleep(0.2)   # follower 들이 대기에 들어갈 때까지
+        release.set()
+        for t in threads:
+            t.join()
+        self.assertEqual(len(calls), 1)
+        self.assertEqual([r.data for r in results], [{"n": 1}] * 4)
+        self.assertEqual(sum(r.has_header("X-Coalesced") for r in results), 3)
+        self.assertEqual(coalesce.stats(), {("t", "leader"): 1, ("t", "coalesced"): 3})
+
+    @override_settings(REQUEST_COALESCING={"WAIT": 0.5})
+    def test_followers_fall_back_after_timeout_or_error(self):
+        started, release, calls = threading.Event(), threading.Event(), []
+
+        def compute():
+            calls.append(1)
+            if len(calls) == 1:   # leader: 오래 걸리다 실패
+                started.set()
+                release.wait(2)
+                return Response({}, status=500)
+            return Response({"ok": True})
+
+        # 대기 시간 안에 leader 가 실패 → follower 는 각자 실행
+        threads, results = self._leader_then_followers(compute, started, 1)
+        time.sleep(0.1)
+        release.set()
+        for t in threads:
+            t.join()
+        self.assertEqual(sorted(r.status_code for r in results), [200, 500])
+
+        # leader 가 WAIT 를 넘김 → follower 는 기다리지 않고 각자 실행
+        calls.clear()
+        started.clear()
+        release.clear()
+        threads, results = self._leader_then_followers(compute, started, 1)
+        threads[1].join()
+        release.set()
+        threads[0].join()
+        self.assertEqual([r.status_code for r in results], [200, 500])
+        self.assertEqual(
+            coalesce.stats(), {("t", "leader"): 2, ("t", "fallback"): 1, ("t", "timeout"): 1},
+        )
+
+    @override_settings(DB_REPLICA_PIN={"COOKIE_NAME": "db_pin", "SECONDS": 5})
+    def test_requests_pinned_to_primary_are_not_coalesced(self):
+        class View:
+            @coalesce.coalesce("t")
+            def list(self, request):
+                return Response({"ok": True})
+
+        factory = APIRequestFactory()
+        with mock.patch.object(coalesce, "single_flight") as flight:
+            View().list(Request(factory.get("/")))
+            self.assertEqual(flight.call_count, 1)
+
+            # 방금 쓴 사용자: 다른 요청(복제본/쓰기 전 시작)의 결과를 받지 않고 직접 실행
+            pinned = factory.get("/")
+            pinned.COOKIES["db_pin"] = "1"
+            self.assertEqual(View().list(Request(pinned)).data, {"ok": True})
+            self.assertEqual(flight.call_count, 1)
+
+    @override_settings(REQUEST_COALESCING={"CROSS_PROCESS": True, "WAIT": 1})
+    def test_waits_for_another_workers_result_in_cache(self):
+        key = "key"
+        cache.add(f"{coalesce.KEY_PREFIX}lock:{key}", "other-worker", timeout=5)
+        cache.set(f"{coalesce.KEY_PREFIX}result:other-worker", ({"from": "other"}, 200), timeout=5)
+        response = coalesce.single_flight("t", key, lambda: self.fail("다른 워커가 실행 중"))
+        self.assertEqual(response.data, {"from": "other"})
+        self.assertEqual(coalesce.stats(), {("t", "coalesced"): 1})
+
+
+class ReplicaRoutingTests(SimpleTestCase):
+    """
+    Primary/Replica 라우팅
+    - 안전한 읽기만 복제본, 쓰기/잠금 읽기는 primary
+    - 쓰기 요청 후에는 고정 쿠키로 primary 읽기
+    """
+
+    def test_router_sends_only_safe_reads_to_replica(self):
+        router = PrimaryReplicaRouter()
+        self.assertIsNone(router.db_for_read(Account))
+
+        with replica_reads():
+            self.assertEqual(router.db_for_read(Account), "replica")
+            self.assertEqual(router.db_for_write(Account), "default")
+            # select_for_update 는 쓰기 라우팅을 따른다
+            self.assertEqual(Account.objects.select_for_update().db, "default")
+            self.assertEqual(Account.objects.all().db, "replica")
+
+    def test_middleware_pins_reads_to_primary_after_write(self):
+        seen = []
+
+        def view(request):
+            seen.append(PrimaryReplicaRouter().db_for_read(Account))
+            return HttpResponse()
+
+        mw = ReplicaRoutingMiddleware(view)
+        rf = RequestFactory()
+
+        mw(rf.get("/api/accounts/"))
+        self.assertEqual(seen[-1], "replica")
+
+        res = mw(rf.post("/api/transactions/"))
+        self.assertIsNone(seen[-1])
+        self.assertIn("db_pin", res.cookies)
+        self.assertEqual(res.cookies["db_pin"]["max-age"], 5)
+
+        pinned = rf.get("/api/accounts/")
+        pinned.COOKIES["db_pin"] = "1"
+        mw(pinned)
+        self.assertIsNone(seen[-1])
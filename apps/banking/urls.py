@@ -3,13 +3,19 @@ from django.urls import path, include
 from rest_framework.routers import DefaultRouter
 from .views_accounts import AccountViewSet
 from .views_transactions import TransactionViewSet
+from .views_dashboard import DashboardView
+from .views_postings import PostingViewSet
+from .views_live import live_events
 
 app_name = "banking"
 
 router = DefaultRouter()
 router.register(r"accounts", AccountViewSet, basename="account")
 router.register(r"transactions", TransactionViewSet, basename="transaction")
+router.register(r"postings", PostingViewSet, basename="posting")
 
 urlpatterns = [
+    path("dashboard/", DashboardView.as_view(), name="dashboard"),
+    path("events/", live_events, name="events"),   # SSE (ASGI)
     path("", include(router.urls)),
 ]
@@ -1,9 +1,18 @@
 # apps/banking/views_accounts.py
+from django.http import FileResponse
+from django.shortcuts import get_object_or_404
 from rest_framework import viewsets, permissions, mixins, status
+from rest_framework.decorators import action
 from rest_framework.response import Response
 
-from .models import Account
-from .serializers_accounts import AccountSerializer, AccountCreateSerializer
+from config.coalesce import coalesce
+
+from .batch import BatchRetrieveMixin
+from .models import Account, Statement
+from .purge import schedule_account_purge
+from .shards import ShardContextMixin
+from .serializers_accounts import AccountSerializer, AccountCreateSerializer, StatementSerializer
+from .statements import parse_month, statement_storage
 
 
 class IsOwnerOnly(permissions.BasePermission):
@@ -12,23 +21,35 @@ class IsOwnerOnly(permissions.BasePermission):
         return obj.user_id == request.user.id
 
 
-class AccountViewSet(mixins.CreateModelMixin,
+class AccountViewSet(ShardContextMixin,
+                     BatchRetrieveMixin,
+                     mixins.CreateModelMixin,
                      mixins.ListModelMixin,
                      mixins.RetrieveModelMixin,
                      mixins.DestroyModelMixin,   # 삭제 허용
                      viewsets.GenericViewSet):
     permission_classes = [permissions.IsAuthenticated, IsOwnerOnly]
-    queryset = Account.objects.select_related("user").all()
+    trust_token_claims = True  # 읽기는 request.user.pk 만 사용 (AUTH_USER_CACHE 참고)
+    read_only_actions = ShardContextMixin.read_only_actions + BatchRetrieveMixin.read_only_actions
+    queryset = Account.objects.all()  # user 는 다른 DB(default)일 수 있어 JOIN 하지 않음
     lookup_field = "id"
 
     def get_queryset(self):
         # 목록/조회 모두 내 계좌만
-        return self.queryset.filter(user=self.request.user).order_by("-created_at")
+        return (
+            self.queryset.filter(user=self.request.user, deleted_at__isnull=True)
+            .order_by("-created_at")
+        )
 
     def get_serializer_class(self):
         # 생성 시에는 작성용 시리얼라이저, 그 외는 조회용
         return AccountCreateSerializer if self.action == "create" else AccountSerializer
 
+    @coalesce("account_list")
+    def list(self, request, *args, **kwargs):
+        # 같은 사용자의 동시 새로고침은 한 번만 조회 (config/coalesce.py)
+        return super().list(request, *args, **kwargs)
+
     def create(self, request, *args, **kwargs):
         """
         생성은 AccountCreateSerializer로 검증/저장하고,
@@ -41,3 +62,34 @@ class AccountViewSet(mixins.CreateModelMixin,
         read_ser = AccountSerializer(account, context={"request": request})
         headers = self.get_success_headers(read_ser.data)
         return Response(read_ser.data, status=status.HTTP_201_CREATED, headers=headers)
+
+    def destroy(self, request, *args, **kwargs):
+        """
+        삭제는 표시(deleted_at)만 하고 202 반환.
+        거래내역 등 하위 데이터는 purge_deleted 워커가 배치로 삭제
+        """
+        account = self.get_object()
+        job = schedule_account_purge(account)
+        return Response(
+            {"detail": "삭제 요청이 접수되었습니다.", "job_id": str(job.id)},
+            status=status.HTTP_202_ACCEPTED,
+        )
+
+    @action(detail=True, methods=["get"])
+    def statements(self, request, id=None):
+        """생성된 월별 명세서 목록 (최근 달 먼저)"""
+        account = self.get_object()
+        statements = Statement.objects.filter(account=account)
+        return Response(StatementSerializer(statements, many=True).data)
+
+    @action(detail=True, methods=["get"], url_path=r"statements/(?P<month>\d{4}-\d{2})")
+    def statement_file(self, request, id=None, month=None):
+        """저장된 명세서 파일을 그대로 내려줌 (다시 조회/직렬화하지 않음)"""
+        account = self.get_object()
+        statement = get_object_or_404(Statement, account=account, month=parse_month(month).date())
+        return FileResponse(
+            statement_storage().open(statement.path, "rb"),
+            as_attachment=True,
+            filename=f"statement-{account.account_number}-{month}.json",
+            content_type="application/json",
+        )
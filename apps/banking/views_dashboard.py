@@ -0,0 +1,89 @@
+# apps/banking/views_dashboard.py
+from datetime import timedelta
+from decimal import Decimal
+
+from django.db.models import BigIntegerField, DecimalField, Prefetch, Q, Sum, Value
+from django.db.models.functions import Coalesce
+from django.utils import timezone
+from drf_spectacular.utils import OpenApiParameter, extend_schema
+from rest_framework import permissions, status
+from rest_framework.response import Response
+from rest_framework.views import APIView
+
+from .models import Account, TransactionHistory
+from .money import from_minor, read_minor
+from .serializers_dashboard import DashboardSerializer
+from .shards import ShardContextMixin
+
+RECENT_DEFAULT = 5
+RECENT_MAX = 20
+ACTIVITY_DAYS = 30
+
+MONEY = DecimalField(max_digits=18, decimal_places=2)
+
+
+def _sum_since(io_type, since, minor=False):
+    # minor: BIGINT 합계(정수 SUM) → 뷰에서 Decimal 로 변환
+    return Coalesce(
+        Sum(
+            "transactions__amount_minor" if minor else "transactions__amount",
+            filter=Q(transactions__io_type=io_type, transactions__created_at__gte=since),
+        ),
+        Value(0) if minor else Value(Decimal("0.00")),
+        output_field=BigIntegerField() if minor else MONEY,
+    )
+
+
+@extend_schema(
+    summary="홈 대시보드",
+    description=(
+        "내 계좌 전체 + 계좌별 최근 거래 K건 + 총 잔액 + 최근 30일 입/출금 합계를 "
+        "한 번에 반환합니다. "
+        "계좌 수와 관계없이 쿼리 2번(계좌+집계, 최근 거래)으로 처리합니다."
+    ),
+    parameters=[OpenApiParameter(
+        "recent", int,
+        description=f"계좌별 최근 거래 수 (기본 {RECENT_DEFAULT}, 최대 {RECENT_MAX})",
+    )],
+    responses={200: DashboardSerializer},
+)
+class DashboardView(ShardContextMixin, APIView):
+    permission_classes = [permissions.IsAuthenticated]
+    trust_token_claims = True  # 읽기는 request.user.pk 만 사용 (AUTH_USER_CACHE 참고)
+
+    def get(self, request):
+        try:
+            recent = int(request.query_params.get("recent", RECENT_DEFAULT))
+        except ValueError:
+            return Response(
+                {"detail": "recent는 정수여야 합니다."}, status=status.HTTP_400_BAD_REQUEST
+            )
+        recent = max(0, min(recent, RECENT_MAX))
+        since = timezone.now() - timedelta(days=ACTIVITY_DAYS)
+
+        # 계좌별 top-K: 슬라이스된 Prefetch → ROW_NUMBER() OVER (PARTITION BY account_id ...) 한 번
+        minor = read_minor()
+        recent_qs = TransactionHistory.objects.order_by("-created_at", "-id")[:recent]
+        accounts = list(
+            Account.objects.filter(user=request.user, deleted_at__isnull=True)
+            .annotate(
+                in_30d=_sum_since("DEPOSIT", since, minor),
+                out_30d=_sum_since("WITHDRAW", since, minor),
+            )
+            .prefetch_related(
+                Prefetch("transactions", queryset=recent_qs, to_attr="recent_transactions")
+            )
+            .order_by("-created_at")
+        )
+        if minor:
+            for a in accounts:
+                a.in_30d, a.out_30d = from_minor(a.in_30d), from_minor(a.out_30d)
+
+        data = DashboardSerializer({
+            "total_balance": sum((a.balance for a in accounts), Decimal("0.00")),
+            "in_30d": sum((a.in_30d for a in accounts), Decimal("0.00")),
+            "out_30d": sum((a.out_30d for a in accounts), Decimal("0.00")),
+            "since": since,
+            "accounts": accounts,
+        }).data
+        return Response(data, status=status.HTTP_200_OK)
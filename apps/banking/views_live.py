@@ -0,0 +1,124 @@
+# apps/banking/views_live.py
+"""
+GET /api/events/ — 내 거래/잔액 변경을 Server-Sent Events 로 (ASGI 서버에서 실행)
+
+    retry: 3000
+    event: snapshot            (Last-Event-ID 없이 접속했을 때: 현재 잔액 + 시작 위치)
+    id: 41
+    data: {"accounts": [...]}
+
+    event: transaction.posted  (outbox 이벤트 그대로)
+                               (id = 재접속 위치: 여기까지의 outbox id 는 모두 전달됨)
+    id: 42
+    data: {"account_id": ..., "balance_after": ..., ...}
+
+- 폴링 대신: 새 이벤트가 없으면 DB 조회도 없음 (깨우는 건 apps/banking/live.py 의 broker)
+- HEARTBEAT 마다 주석 줄 + 재조회 (알림이 빠져도 늦게라도 전달), MAX_AGE 가 지나면 끊음
+  → 클라이언트(EventSource)는 retry 뒤 Last-Event-ID 를 붙여 자동 재접속
+- outbox id 는 샤드마다 따로 증가 → 샤딩 중에는 id 를 "alias:outbox id" 로 보냄
+  재접속한 샤드와 alias 가 다르면(사용자 이동 등) 이어받지 않고 스냅샷부터 다시
+"""
+import asyncio
+import json
+
+from asgiref.sync import sync_to_async
+from django.core.serializers.json import DjangoJSONEncoder
+from django.http import JsonResponse, StreamingHttpResponse
+from django.views.decorators.http import require_GET
+from rest_framework import exceptions
+from rest_framework.request import Request
+from rest_framework.settings import api_settings
+
+from config.sharding import sharding_enabled
+
+from .live import Cursor, broker, ensure_bridge, fetch_events, live_settings, snapshot
+from .shards import locate_user
+
+
+def _authenticate(request):
+    """DRF 인증 클래스(쿠키/헤더 JWT) 그대로 → (user, 오류 응답)"""
+    authenticators = [cls() for cls in api_settings.DEFAULT_AUTHENTICATION_CLASSES]
+    drf_request = Request(request, authenticators=authenticators)
+    try:
+        user = drf_request.user
+    except exceptions.APIException as e:
+        return None, JsonResponse({"detail": str(e.detail)}, status=e.status_code)
+    if not user or not user.is_authenticated:
+        error = exceptions.NotAuthenticated
+        return None, JsonResponse({"detail": str(error.default_detail)}, status=error.status_code)
+    return user, None
+
+
+def _event_id(alias, outbox_id):
+    return f"{alias}:{outbox_id}" if sharding_enabled() else str(outbox_id)
+
+
+def _last_event_id(request, alias):
+    """이 샤드에서 이어받을 outbox id (없거나 다른 샤드의 id 면 None → 스냅샷)"""
+    value = request.headers.get("Last-Event-ID") or request.GET.get("last_event_id")
+    if value is None:
+        return None
+    if sharding_enabled():
+        scope, _, value = value.rpartition(":")
+        if scope != alias:
+            return None
+    try:
+        return max(int(value), 0)
+    except ValueError:
+        return None
+
+
+def _frame(event, event_id, data):
+    body = json.dumps(data, cls=DjangoJSONEncoder, ensure_ascii=False)
+    return f"event: {event}\nid: {event_id}\ndata: {body}\n\n"
+
+
+async def _stream(user_id, alias, last_id):
+    cfg = live_settings()
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + cfg["MAX_AGE"]
+    _, wakeup = sub = broker.subscribe(user_id)
+    try:
+        yield f"retry: {cfg['RETRY_MS']}\n\n"
+        if last_id is None:
+            last_id, accounts, seen = await sync_to_async(snapshot)(alias, user_id)
+            cursor = Cursor(last_id, seen)
+            yield _frame("snapshot", _event_id(alias, last_id), {"accounts": accounts})
+        else:
+            cursor = Cursor(last_id)
+
+        while True:
+            wakeup.clear()   # 조회 전에 내림 → 조회 중 도착한 알림은 다음 대기에서 바로 깸
+            events, truncated, position = await sync_to_async(fetch_events)(
+                alias, user_id, cursor.watermark, exclude=cursor.sent
+            )
+            # id 는 재접속 위치(watermark): 그 위에서 보낸 이벤트는 재접속 때 다시 올 수 있음
+            # (빈 id 가 있을 때만)
+            for event in cursor.take(events, truncated=truncated, frontier=position):
+                yield _frame(event.event_type, _event_id(alias, cursor.watermark), event.payload)
+
+            remaining = deadline - loop.time()
+            if remaining <= 0:
+                return
+            try:
+                await asyncio.wait_for(wakeup.wait(), timeout=min(cfg["HEARTBEAT"], remaining))
+            except asyncio.TimeoutError:   # 3.10 에서는 내장 TimeoutError 와 다른 클래스
+                yield ": ping\n\n"
+    finally:
+        broker.unsubscribe(user_id, sub)
+
+
+@require_GET
+async def live_events(request):
+    user, error = await sync_to_async(_authenticate)(request)
+    if error is not None:
+        return error
+    alias, _ = await sync_to_async(locate_user)(user.pk)
+    ensure_bridge()
+
+    response = StreamingHttpResponse(
+        _stream(user.pk, alias, _last_event_id(request, alias)), content_type="text/event-stream"
+    )
+    response["Cache-Control"] = "no-cache"
+    response["X-Accel-Buffering"] = "no"   # nginx 버퍼링 끔
+    return response
@@ -0,0 +1,25 @@
+# apps/banking/views_postings.py
+from rest_framework import mixins, permissions, viewsets
+
+from .models import PendingPosting
+from .serializers_transactions import PostingSerializer
+from .shards import ShardContextMixin
+
+
+class PostingViewSet(ShardContextMixin, mixins.RetrieveModelMixin, viewsets.GenericViewSet):
+    """
+    비동기 접수 상태 조회: GET /api/postings/{handle}/
+    - 대기(롱 폴링)는 하지 않음: 요청 스레드를 붙잡지 않도록 즉시 현재 상태만 응답
+      반영 알림은 SSE(GET /api/events/ 의 transaction.posted)로 받고,
+      거절 여부는 이 URL 을 다시 조회
+    """
+    permission_classes = [permissions.IsAuthenticated]
+    trust_token_claims = True  # 읽기는 request.user.pk 만 사용 (AUTH_USER_CACHE 참고)
+    serializer_class = PostingSerializer
+    queryset = PendingPosting.objects.select_related("transaction_history").all()
+    lookup_field = "handle"
+
+    def get_queryset(self):
+        return self.queryset.filter(
+            account__user=self.request.user, account__deleted_at__isnull=True
+        )
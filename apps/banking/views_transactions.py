@@ -1,10 +1,30 @@
 # apps/banking/views_transactions.py
+import csv
+from datetime import datetime, time
+from decimal import Decimal, InvalidOperation
+from itertools import islice
+
 from rest_framework import permissions, status, mixins, viewsets
+from rest_framework.decorators import action
+from rest_framework.exceptions import ValidationError
 from rest_framework.response import Response
+from rest_framework.utils.urls import replace_query_param
+from django.conf import settings
+from django.core.exceptions import ValidationError as DjangoValidationError
+from django.http import StreamingHttpResponse
 from django.shortcuts import get_object_or_404
-from django.utils.dateparse import parse_datetime
-from django.db.models import Q
+from django.urls import reverse
+from django.utils import timezone
+from django.utils.dateparse import parse_date, parse_datetime
+from config.coalesce import coalesce
+from config.sharding import ledger_db
+from config.throttling import TransactionCreateThrottle, shed_load
+from .archive import archived_by_id, archived_transactions, stitch
+from .batch import BatchRetrieveMixin
 from .models import Account, TransactionHistory
+from .pagination import before_cursor, decode_cursor, encode_cursor, page_limit
+from .postings import enqueue
+from .shards import ShardContextMixin
 from .serializers_transactions import (
     TransactionCreateSerializer,
     TransactionSerializer,
@@ -12,19 +32,48 @@ from .serializers_transactions import (
 )
 from rest_framework.request import Request
 
+def _as_datetime(value):
+    """ISO 일시 또는 날짜(그날 0시) → aware datetime, 해석 불가면 None"""
+    dt = parse_datetime(value)
+    if dt is None:
+        d = parse_date(value)
+        dt = datetime.combine(d, time.min) if d else None
+    if dt is not None and timezone.is_naive(dt):
+        dt = timezone.make_aware(dt)
+    return dt
+
+
+def _as_decimal(value):
+    try:
+        return Decimal(value)
+    except (InvalidOperation, TypeError):
+        return None
+
+
+class _Echo:
+    """csv.writer 가 쓴 줄을 그대로 돌려주는 버퍼 (스트리밍 응답용)"""
+
+    def write(self, value):
+        return value
+
+
 class IsOwnerOnly(permissions.BasePermission):
     def has_object_permission(self, request, view, obj):
         # TransactionHistory의 소유자는 account.user
         return getattr(obj, "account", None) and obj.account.user_id == request.user.id
 
 
-class TransactionViewSet(mixins.CreateModelMixin,
+class TransactionViewSet(ShardContextMixin,
+                         BatchRetrieveMixin,
+                         mixins.CreateModelMixin,
                          mixins.ListModelMixin,
                          mixins.RetrieveModelMixin,
                          mixins.UpdateModelMixin,
                          mixins.DestroyModelMixin,
                          viewsets.GenericViewSet):
     permission_classes = [permissions.IsAuthenticated, IsOwnerOnly]
+    trust_token_claims = True  # 읽기는 request.user.pk 만 사용 (AUTH_USER_CACHE 참고)
+    read_only_actions = ShardContextMixin.read_only_actions + BatchRetrieveMixin.read_only_actions
     queryset = TransactionHistory.objects.select_related("account").all()
     lookup_field = "id"
     request: Request
@@ -32,7 +81,10 @@ class TransactionViewSet(mixins.CreateModelMixin,
     def get_queryset(self):
 
         user = self.request.user
-        qs = self.queryset.filter(account__user=user).order_by("-created_at")
+        qs = (
+            self.queryset.filter(account__user=user, account__deleted_at__isnull=True)
+            .order_by("-created_at", "-id")
+        )
 
 
         # -------- 필터링 --------
@@ -55,14 +107,110 @@ class TransactionViewSet(mixins.CreateModelMixin,
         if max_amount:
             qs = qs.filter(amount__lte=max_amount)
         if date_from:
-            dt = parse_datetime(date_from) or date_from
+            dt = _as_datetime(date_from) or date_from
             qs = qs.filter(created_at__gte=dt)
         if date_to:
-            dt = parse_datetime(date_to) or date_to
+            dt = _as_datetime(date_to) or date_to
             qs = qs.filter(created_at__lte=dt)
 
         return qs
 
+    def archived(self, since=None, until=None):
+        """
+        보관(cold storage) 구간에서 같은 조건의 거래 — 조건과 겹치는 세그먼트 파일만 읽음
+        since/until: 필터 기간을 더 좁힘 (커서 페이지에서 이미 채운 범위 제외)
+        """
+        params = self.request.query_params
+        accounts = Account.objects.filter(user=self.request.user, deleted_at__isnull=True)
+        if params.get("account_id"):
+            accounts = accounts.filter(id=params["account_id"])
+        date_from = _as_datetime(params["from"]) if params.get("from") else None
+        date_to = _as_datetime(params["to"]) if params.get("to") else None
+        if since is not None:
+            date_from = max(date_from, since) if date_from else since
+        if until is not None:
+            date_to = min(date_to, until) if date_to else until
+        return archived_transactions(
+            accounts.values("id"),
+            io_type=params.get("io_type"),
+            method=params.get("method"),
+            min_amount=_as_decimal(params.get("min_amount")),
+            max_amount=_as_decimal(params.get("max_amount")),
+            date_from=date_from,
+            date_to=date_to,
+        )
+
+    def batch_fallback(self, pks):
+        """일괄 조회에서 DB 에 없는 id 는 보관 파일에서 (내 계좌의 세그먼트만)"""
+        accounts = Account.objects.filter(user=self.request.user, deleted_at__isnull=True)
+        return archived_by_id(accounts.values("id"), pks)
+
+    @coalesce("transaction_list")
+    def list(self, request, *args, **kwargs):
+        # ?limit= 또는 ?cursor= 가 있으면 커서 페이지, 없으면 기존처럼 전체 목록
+        if "limit" in request.query_params or "cursor" in request.query_params:
+            return self.cursor_page(request)
+        rows = stitch(self.get_queryset(), self.archived())
+        return Response(TransactionSerializer(rows, many=True).data)
+
+    def cursor_page(self, request):
+        """(created_at, id) 키셋 페이지: {"next": url|null, "results": [...]}"""
+        limit = page_limit(request.query_params)
+        raw_cursor = request.query_params.get("cursor")
+        cursor = decode_cursor(raw_cursor) if raw_cursor else None
+        qs = self.get_queryset()
+        if cursor:
+            qs = qs.filter(before_cursor(*cursor))
+        recent = list(qs[:limit + 1])
+
+        # 최근 구간만으로 페이지가 차면 그보다 오래된 보관 세그먼트는 열지 않음
+        # 모자라면 보관 구간을 최신 달부터 한 달씩, 페이지가 찰 때까지만 읽음
+        archived = self.archived(
+            since=recent[-1].created_at if len(recent) > limit else None,
+            until=cursor[0] if cursor else None,
+        )
+        if cursor:
+            archived = (t for t in archived if (t.created_at, t.id) < cursor)
+
+        rows = list(islice(stitch(recent, archived), limit + 1))
+        next_url = None
+        if len(rows) > limit:
+            rows = rows[:limit]
+            next_url = replace_query_param(
+                request.build_absolute_uri(), "cursor", encode_cursor(rows[-1])
+            )
+        return Response({"next": next_url, "results": TransactionSerializer(rows, many=True).data})
+
+    @action(detail=False, methods=["get"])
+    def export(self, request):
+        """
+        CSV 내보내기 — 목록과 같은 필터, 최근 + 보관 구간을 이어서 최신순으로 스트리밍
+        보관 구간은 세그먼트 목록만 미리 조회하고 파일은 한 달씩 풀어서 씀
+        """
+        # 스트리밍은 응답 반환 후(샤드 컨텍스트 해제 후)에 돌므로 DB alias 를 쿼리에 고정
+        recent = self.get_queryset().using(ledger_db()).iterator(chunk_size=2000)
+        rows = stitch(recent, self.archived())
+        fields = TransactionSerializer.Meta.fields
+        writer = csv.writer(_Echo())
+
+        def lines():
+            yield writer.writerow(fields)
+            for t in rows:
+                yield writer.writerow([
+                    t.id, t.account_id, t.amount, t.balance_after, t.description,
+                    t.io_type, t.method, t.created_at.isoformat(),
+                ])
+
+        response = StreamingHttpResponse(lines(), content_type="text/csv; charset=utf-8")
+        response["Content-Disposition"] = 'attachment; filename="transactions.csv"'
+        return response
+
+    def get_throttles(self):
+        # 생성(잔액 잠금 + 쓰기)만 제한, 조회는 제한하지 않음
+        if self.action == "create":
+            return [TransactionCreateThrottle()]
+        return super().get_throttles()
+
     def get_serializer_class(self):
         if self.action == "create":
             return TransactionCreateSerializer
@@ -70,20 +218,42 @@ class TransactionViewSet(mixins.CreateModelMixin,
             return TransactionUpdateSerializer
         return TransactionSerializer
 
+    @shed_load("transaction_create")
     def create(self, request, *args, **kwargs):
         s = TransactionCreateSerializer(data=request.data)
         s.is_valid(raise_exception=True)
         data = s.validated_data
 
         # 소유권 검증
-        account = get_object_or_404(Account, id=data["account_id"], user=request.user)
+        account = get_object_or_404(
+            Account, id=data["account_id"], user=request.user, deleted_at__isnull=True
+        )
+
+        # 비동기 접수 모드: 큐에 넣고 202 + 조회 핸들 반환 (반영은 apply_postings 워커)
+        if settings.BANKING_ASYNC_POSTINGS:
+            posting = enqueue(
+                account,
+                amount=data["amount"],
+                io_type=data["io_type"],
+                method=data["method"],
+                description=data.get("description", ""),
+            )
+            status_url = reverse("banking:posting-detail", args=[posting.handle])
+            return Response(
+                {"handle": str(posting.handle), "status": posting.status, "status_url": status_url},
+                status=status.HTTP_202_ACCEPTED,
+                headers={"Location": status_url},
+            )
 
         # 모델 메서드로 안전 처리(잔액 업데이트 + 거래 생성)
-        txn = account.apply_transaction(
-            amount=data["amount"],
-            io_type=data["io_type"],
-            method=data["method"],
-            description=data.get("description", ""),
-        )
+        try:
+            txn = account.apply_transaction(
+                amount=data["amount"],
+                io_type=data["io_type"],
+                method=data["method"],
+                description=data.get("description", ""),
+            )
+        except DjangoValidationError as e:   # 잔액 부족 / 출금 한도 초과 → 400
+            raise ValidationError({"detail": e.messages}) from e
         out = TransactionSerializer(txn)
         return Response(out.data, status=status.HTTP_201_CREATED)
@@ -1,7 +1,9 @@
 # apps/users/admin.py
-from django.contrib import admin
+from django.contrib import admin, messages
 from django.contrib.auth.admin import UserAdmin as BaseUserAdmin
-from .models import User
+from .models import EmailOutbox, User
+from .revocation import revoke_users
+from .user_cache import invalidate_user
 
 
 @admin.register(User)
@@ -36,3 +38,37 @@ class UserAdmin(BaseUserAdmin):
     )
 
     # 이메일을 사용자명 필드로 쓰는 BaseUserAdmin 기본 동작을 그대로 사용
+
+    actions = ("logout_everywhere",)
+
+    @admin.action(description="선택한 사용자 모든 기기 로그아웃 (refresh 토큰 일괄 회수)")
+    def logout_everywhere(self, request, queryset):
+        # "전체 선택"으로 수만 명을 골라도 INSERT … SELECT 한 문장으로 처리
+        revoked = revoke_users(queryset)
+        self.message_user(request, f"refresh 토큰 {revoked}개를 회수했습니다.", messages.SUCCESS)
+
+    # 인증 사용자 캐시 무효화 (권한/활성 여부 변경이 바로 반영되도록)
+    def save_model(self, request, obj, form, change):
+        super().save_model(request, obj, form, change)
+        invalidate_user(obj.pk)
+
+    def delete_model(self, request, obj):
+        user_id = obj.pk
+        super().delete_model(request, obj)
+        invalidate_user(user_id)
+
+    def delete_queryset(self, request, queryset):
+        user_ids = list(queryset.values_list("pk", flat=True))
+        super().delete_queryset(request, queryset)
+        for user_id in user_ids:
+            invalidate_user(user_id)
+
+
+@admin.register(EmailOutbox)
+class EmailOutboxAdmin(admin.ModelAdmin):
+    list_display = (
+        "id", "to", "subject", "status", "attempts", "next_attempt_at", "last_error", "sent_at",
+    )
+    list_filter = ("status",)
+    search_fields = ("to__exact",)
+    show_full_result_count = False
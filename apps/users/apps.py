@@ -4,3 +4,8 @@ from django.apps import AppConfig
 class UsersConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = "apps.users"
+
+    def ready(self):
+        from . import jwt_keys
+
+        jwt_keys.install()  # RS256/EdDSA 모드면 simplejwt 토큰 백엔드를 키 링으로 교체
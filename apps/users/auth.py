@@ -1,13 +1,22 @@
 # apps/users/auth.py
+from rest_framework.permissions import SAFE_METHODS
 from rest_framework_simplejwt.authentication import JWTAuthentication
+from rest_framework_simplejwt.exceptions import AuthenticationFailed, InvalidToken
+from rest_framework_simplejwt.settings import api_settings
 from django.conf import settings
 
+from . import user_cache
+
 class CookieJWTAuthentication(JWTAuthentication):
     """
     1) Authorization 헤더 Bearer 우선
     2) 없으면 access_token 쿠키에서 읽음
+    3) 사용자 조회는 AUTH_USER_CACHE 설정에 따라 캐시 사용
+       - TRUST_CLAIMS_FOR_READS + 뷰의 trust_token_claims=True + 안전한 메서드
+         → DB/캐시 없이 토큰의 user_id 만으로 사용자 구성
     """
     def authenticate(self, request):
+        self.request = request  # get_user 에서 클레임 신뢰 모드 판단용 (인증 객체는 요청마다 생성)
         header = self.get_header(request)
         if header is not None:
             return super().authenticate(request)
@@ -20,3 +29,31 @@ class CookieJWTAuthentication(JWTAuthentication):
 
         validated_token = self.get_validated_token(raw_token)
         return self.get_user(validated_token), validated_token
+
+    def get_user(self, validated_token):
+        cfg = settings.AUTH_USER_CACHE
+        if not cfg["ENABLED"]:
+            return super().get_user(validated_token)
+
+        try:
+            user_id = validated_token[api_settings.USER_ID_CLAIM]
+        except KeyError as e:
+            raise InvalidToken("Token contained no recognizable user identification") from e
+
+        if cfg.get("TRUST_CLAIMS_FOR_READS") and self._view_trusts_claims():
+            return user_cache.from_claims(user_id)
+
+        user = user_cache.get_cached_user(user_id)
+        if user is None:
+            user = super().get_user(validated_token)  # DB 조회 + 비활성 사용자 거부
+            user_cache.remember(user)
+        elif api_settings.CHECK_USER_IS_ACTIVE and not user.is_active:
+            raise AuthenticationFailed("User is inactive", code="user_inactive")
+        return user
+
+    def _view_trusts_claims(self):
+        request = getattr(self, "request", None)
+        if request is None or request.method not in SAFE_METHODS:
+            return False
+        view = (getattr(request, "parser_context", None) or {}).get("view")
+        return getattr(view, "trust_token_claims", False)
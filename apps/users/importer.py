@@ -0,0 +1,178 @@
+# apps/users/importer.py
+"""
+레거시 사용자 대량 이관 (manage.py import_users)
+
+- read_records: CSV / JSONL 을 한 줄씩 스트리밍 (파일 전체를 메모리에 올리지 않음)
+- 청크 단위 처리: 이메일 정규화 → 파일 내 중복 / DB 기존 사용자 제거
+  (대소문자 무시, lower(email) 인덱스로 IN 조회 1번)
+  → 비밀번호 해시(프로세스 풀) 또는 해시값 그대로 사용 → bulk_create (청크당 트랜잭션 1개)
+- 거절 건은 리포트 CSV 로 (줄 번호, 이메일, 사유)
+- 체크포인트 파일에 완료한 청크 수를 기록 → 재실행 시 그 다음 청크부터
+"""
+import csv
+import json
+from dataclasses import dataclass, field
+from itertools import islice
+from pathlib import Path
+
+from django.contrib.auth import get_user_model
+from django.contrib.auth.hashers import identify_hasher, make_password
+from django.core.exceptions import ValidationError
+from django.core.validators import validate_email
+from django.db import IntegrityError, transaction
+from django.db.models.functions import Lower
+
+User = get_user_model()
+
+PROFILE_FIELDS = ("nickname", "name", "phone")
+TRUE_VALUES = {"1", "true", "t", "yes", "y"}
+
+
+def read_records(path, fmt=None):
+    """(줄 번호, dict) 를 하나씩 yield"""
+    path = Path(path)
+    fmt = fmt or ("jsonl" if path.suffix in (".jsonl", ".ndjson") else "csv")
+    with path.open(encoding="utf-8", newline="") as f:
+        if fmt == "csv":
+            for lineno, row in enumerate(csv.DictReader(f), start=2):
+                yield lineno, row
+        else:
+            for lineno, line in enumerate(f, start=1):
+                if not line.strip():
+                    continue
+                try:
+                    yield lineno, json.loads(line)
+                except json.JSONDecodeError:
+                    yield lineno, None
+
+
+def chunked(iterable, size):
+    it = iter(iterable)
+    while chunk := list(islice(it, size)):
+        yield chunk
+
+
+def hash_password(raw):
+    """워커 프로세스에서 실행 (raw 가 비어 있으면 사용 불가 비밀번호)"""
+    return make_password(raw or None)
+
+
+@dataclass
+class ChunkResult:
+    created: int = 0
+    rejects: list = field(default_factory=list)   # (줄 번호, 이메일, 사유)
+
+
+class UserImporter:
+    def __init__(self, pool, *, batch_size=1000, default_active=True):
+        self.pool = pool
+        self.batch_size = batch_size
+        self.default_active = default_active
+        self.seen = set()   # 파일 전체에서 본 이메일(소문자) — 파일 내 중복 제거용
+
+    def import_chunk(self, records):
+        result = ChunkResult()
+        candidates = []
+        for lineno, rec in records:
+            if not isinstance(rec, dict):
+                result.rejects.append((lineno, "", "형식 오류"))
+                continue
+            email = User.objects.normalize_email((rec.get("email") or "").strip())
+            try:
+                validate_email(email)
+            except ValidationError:
+                result.rejects.append((lineno, email, "이메일 형식 오류"))
+                continue
+            if email.lower() in self.seen:
+                result.rejects.append((lineno, email, "파일 내 중복"))
+                continue
+            self.seen.add(email.lower())
+            candidates.append((lineno, email, rec))
+
+        candidates = self._drop_existing(candidates, result)
+        if not candidates:
+            return result
+
+        # 해시값이 온 경우 그대로, 아니면 평문을 워커 풀에서 해시
+        to_hash = [
+            (i, c[2].get("password") or "")
+            for i, c in enumerate(candidates) if not c[2].get("password_hash")
+        ]
+        hashed = dict(zip(
+            (i for i, _ in to_hash),
+            self.pool.map(hash_password, [raw for _, raw in to_hash], chunksize=64),
+            strict=True,
+        ))
+
+        users = []
+        for i, (lineno, email, rec) in enumerate(candidates):
+            password = rec.get("password_hash") or hashed[i]
+            try:
+                identify_hasher(password)
+            except ValueError:
+                if not password.startswith("!"):  # "!" 로 시작: 사용 불가 비밀번호
+                    result.rejects.append((lineno, email, "알 수 없는 비밀번호 해시 형식"))
+                    continue
+            users.append(self._build_user(email, password, rec))
+
+        result.created = self._bulk_create(users, result)
+        return result
+
+    def _drop_existing(self, candidates, result):
+        # 파일 내 중복(seen)과 같은 기준: 소문자로 비교
+        emails = [email.lower() for _, email, _ in candidates]
+        existing = set(
+            User.objects.annotate(email_lower=Lower("email"))
+            .filter(email_lower__in=emails).values_list("email_lower", flat=True)
+        )
+        kept = []
+        for lineno, email, rec in candidates:
+            if email.lower() in existing:
+                result.rejects.append((lineno, email, "이미 가입된 이메일"))
+            else:
+                kept.append((lineno, email, rec))
+        return kept
+
+    def _build_user(self, email, password, rec):
+        is_active = rec.get("is_active")
+        if is_active in (None, ""):
+            is_active = self.default_active
+        elif isinstance(is_active, str):
+            is_active = is_active.strip().lower() in TRUE_VALUES
+        return User(
+            email=email,
+            password=password,
+            is_active=bool(is_active),
+            **{f: (rec.get(f) or None) for f in PROFILE_FIELDS},
+        )
+
+    def _bulk_create(self, users, result):
+        try:
+            with transaction.atomic():
+                User.objects.bulk_create(users, batch_size=self.batch_size)
+            return len(users)
+        except IntegrityError:
+            # 처리 중 다른 경로로 같은 이메일이 가입된 경우: 다시 걸러서 한 번 더
+            existing = set(
+                User.objects.filter(email__in=[u.email for u in users])
+                .values_list("email", flat=True)
+            )
+            result.rejects.extend((None, email, "이미 가입된 이메일") for email in sorted(existing))
+            users = [u for u in users if u.email not in existing]
+            with transaction.atomic():
+                User.objects.bulk_create(users, batch_size=self.batch_size)
+            return len(users)
+
+
+def load_checkpoint(path):
+    path = Path(path)
+    if not path.exists():
+        return 0
+    return int(json.loads(path.read_text())["chunks_done"])
+
+
+def save_checkpoint(path, chunks_done):
+    path = Path(path)
+    tmp = path.with_suffix(path.suffix + ".tmp")
+    tmp.write_text(json.dumps({"chunks_done": chunks_done}))
+    tmp.replace(path)   # 원자적 교체 (중간에 죽어도 이전 값 유지)
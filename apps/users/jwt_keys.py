@@ -0,0 +1,152 @@
+# apps/users/jwt_keys.py
+"""
+비대칭 JWT 서명 키 링 (RS256 / EdDSA) + JWKS
+
+- JWT_KEYS["DIR"] 의 PEM 파일을 kid 별로 한 번만 파싱해 보관 (요청마다 PEM 파싱하지 않음)
+  <kid>.pem      : 개인키 (서명 + 검증)
+  <kid>.pub.pem  : 공개키만 (교체 후 이전 키 — 남은 토큰 만료 전까지 검증용)
+- 발급 토큰 헤더에 kid 를 넣고, 검증 시 kid 로 공개키 선택
+- 모르는 kid 가 오면 디렉터리를 다시 읽음
+  (다른 인스턴스가 먼저 교체한 경우, RELOAD_INTERVAL 초에 한 번)
+- /.well-known/jwks.json : 공개키 목록 — 다른 서비스가 DB/이 앱 호출 없이 로컬 검증
+- ALGORITHM 이 HS* 면 아무것도 하지 않음 (기존 SIMPLE_JWT SIGNING_KEY 사용)
+
+키 교체: generate_jwt_key 로 새 키 생성 → JWT_ACTIVE_KID 변경 후 재시작
+        → 이전 키는 <kid>.pub.pem 만 남겨 두었다가 REFRESH_TOKEN_LIFETIME 이후 삭제
+"""
+import threading
+import time
+from pathlib import Path
+
+import jwt
+from django.conf import settings
+from django.core.exceptions import ImproperlyConfigured
+from django.utils.translation import gettext_lazy as _
+from rest_framework_simplejwt.backends import TokenBackend
+from rest_framework_simplejwt.exceptions import TokenBackendError
+from rest_framework_simplejwt.settings import api_settings
+
+
+def _config():
+    return settings.JWT_KEYS
+
+
+def is_asymmetric():
+    return not _config()["ALGORITHM"].startswith("HS")
+
+
+class KeyRing:
+    def __init__(self, directory, algorithm, active_kid):
+        self.directory = Path(directory)
+        self.algorithm = algorithm
+        self.active_kid = active_kid
+        self._lock = threading.Lock()
+        self._loaded_at = 0.0
+        self.load()
+        if active_kid not in self.private_keys:
+            raise ImproperlyConfigured(
+                f"JWT 서명 키 {active_kid!r} 의 개인키({active_kid}.pem)가 없습니다."
+            )
+
+    def load(self):
+        from cryptography.hazmat.primitives.serialization import (
+            load_pem_private_key,
+            load_pem_public_key,
+        )
+
+        private_keys, public_keys = {}, {}
+        for path in sorted(self.directory.glob("*.pem")):
+            if path.name.endswith(".pub.pem"):
+                kid = path.name[: -len(".pub.pem")]
+                public_keys[kid] = load_pem_public_key(path.read_bytes())
+            else:
+                kid = path.stem
+                private_keys[kid] = load_pem_private_key(path.read_bytes(), password=None)
+                public_keys[kid] = private_keys[kid].public_key()
+        with self._lock:
+            self.private_keys, self.public_keys = private_keys, public_keys
+            self._jwks = None
+            self._loaded_at = time.monotonic()
+
+    def signing_key(self):
+        return self.private_keys[self.active_kid]
+
+    def verifying_key(self, kid):
+        key = self.public_keys.get(kid)
+        if key is None and time.monotonic() - self._loaded_at > _config()["RELOAD_INTERVAL"]:
+            self.load()
+            key = self.public_keys.get(kid)
+        return key
+
+    def jwks(self):
+        """공개키 JWK 목록 (키 목록이 바뀔 때까지 한 번만 계산)"""
+        if self._jwks is None:
+            keys = []
+            for kid, key in self.public_keys.items():
+                algo = jwt.get_algorithm_by_name(self.algorithm)
+                jwk = algo.to_jwk(key, as_dict=True)
+                jwk.update(kid=kid, use="sig", alg=self.algorithm)
+                keys.append(jwk)
+            self._jwks = {"keys": keys}
+        return self._jwks
+
+
+class KeyRingTokenBackend(TokenBackend):
+    """kid 헤더로 키를 고르는 simplejwt TokenBackend"""
+
+    def __init__(self, key_ring, **kwargs):
+        super().__init__(key_ring.algorithm, **kwargs)
+        self.key_ring = key_ring
+
+    def encode(self, payload):
+        jwt_payload = payload.copy()
+        if self.audience is not None:
+            jwt_payload["aud"] = self.audience
+        if self.issuer is not None:
+            jwt_payload["iss"] = self.issuer
+        return jwt.encode(
+            jwt_payload,
+            self.key_ring.signing_key(),
+            algorithm=self.algorithm,
+            headers={"kid": self.key_ring.active_kid},
+            json_encoder=self.json_encoder,
+        )
+
+    def get_verifying_key(self, token):
+        try:
+            kid = jwt.get_unverified_header(token).get("kid")
+        except jwt.InvalidTokenError as e:
+            raise TokenBackendError(_("Token is invalid")) from e
+        key = self.key_ring.verifying_key(kid) if kid else None
+        if key is None:
+            raise TokenBackendError(_("Token is invalid"))
+        return key
+
+
+_key_ring = None
+
+
+def get_key_ring():
+    return _key_ring
+
+
+def install():
+    """AppConfig.ready 에서 호출: 비대칭 모드면 simplejwt 의 token_backend 를 키 링 백엔드로 교체"""
+    global _key_ring
+    if not is_asymmetric():
+        return
+    cfg = _config()
+    if not cfg["DIR"] or not cfg["ACTIVE_KID"]:
+        raise ImproperlyConfigured("JWT_KEYS_DIR / JWT_ACTIVE_KID 를 설정해야 합니다.")
+    _key_ring = KeyRing(cfg["DIR"], cfg["ALGORITHM"], cfg["ACTIVE_KID"])
+
+    from rest_framework_simplejwt import state
+
+    # Token 은 rest_framework_simplejwt.state.token_backend 를 import_string 으로 찾는다
+    state.token_backend = KeyRingTokenBackend(
+        _key_ring,
+        audience=api_settings.AUDIENCE,
+        issuer=api_settings.ISSUER,
+        leeway=api_settings.LEEWAY,
+        json_encoder=api_settings.JSON_ENCODER,
+    )
@@ -0,0 +1,110 @@
+# apps/users/mailer.py
+"""
+메일 발송 큐 (EmailOutbox)
+
+- enqueue_email: 요청 트랜잭션 안에서 INSERT 만 (SMTP 지연/장애가 요청 응답에 영향 없음)
+- claim_batch: 발송할 메일을 SELECT ... FOR UPDATE SKIP LOCKED 로 선점(lease) → 워커 여러 개 가능
+- send_batch: 연결 하나(get_connection)를 열어 배치 전체를 보내고, 실패 건은 백오프 후 재시도
+  RATE_PER_MINUTE 로 발송 간격 조절 (SMTP 서버/제공자 한도 대응)
+  → 배치 크기는 lease 절반 안에 다 보낼 수 있는 만큼으로 제한
+    (lease 가 끝나 다른 워커가 다시 선점하면 중복 발송)
+  연결 자체가 실패하면(SMTP 장애) 배치 전체를 시도 횟수 증가 없이 RETRY_BACKOFF 뒤로 미루고
+  lease 해제
+"""
+import logging
+import time
+from datetime import timedelta
+
+from django.conf import settings
+from django.core.mail import EmailMessage, get_connection
+from django.db import transaction
+from django.db.models import Q
+from django.utils import timezone
+
+from .models import EmailOutbox
+
+logger = logging.getLogger(__name__)
+
+LEASE = timedelta(minutes=5)
+
+
+def _config():
+    return settings.EMAIL_OUTBOX
+
+
+def enqueue_email(to, subject, body):
+    return EmailOutbox.objects.create(
+        to=to, subject=subject, body=body, max_attempts=_config()["MAX_ATTEMPTS"]
+    )
+
+
+def claim_batch(*, batch_size=100, now=None, lease=LEASE):
+    now = now or timezone.now()
+    with transaction.atomic():
+        rows = list(
+            EmailOutbox.objects.select_for_update(skip_locked=True)
+            .filter(status="PENDING", next_attempt_at__lte=now)
+            .filter(Q(claimed_until__isnull=True) | Q(claimed_until__lt=now))
+            .order_by("next_attempt_at", "id")[:batch_size]
+        )
+        if rows:
+            EmailOutbox.objects.filter(id__in=[r.id for r in rows]).update(
+                claimed_until=now + lease
+            )
+    return rows
+
+
+def send_batch(*, batch_size=100, rate_per_minute=None, connection=None):
+    """선점한 배치를 연결 하나로 발송. 반환: (발송, 재시도 예약, 최종 실패) 건수"""
+    rate = rate_per_minute if rate_per_minute is not None else _config()["RATE_PER_MINUTE"]
+    gap = 60.0 / rate if rate else 0.0
+    if rate:
+        batch_size = min(batch_size, max(1, int(rate * LEASE.total_seconds() / 60 / 2)))
+    rows = claim_batch(batch_size=batch_size)
+    if not rows:
+        return 0, 0, 0
+
+    backoff = timedelta(seconds=_config()["RETRY_BACKOFF"])
+    sent = retried = failed = 0
+
+    connection = connection or get_connection()
+    try:
+        opened = connection.open()   # 이미 열려 있으면 False → 닫지 않음
+    except Exception as e:
+        logger.exception("email connection failed, postponing %d messages", len(rows))
+        EmailOutbox.objects.filter(id__in=[r.id for r in rows]).update(
+            claimed_until=None, next_attempt_at=timezone.now() + backoff, last_error=str(e)[:255]
+        )
+        return 0, len(rows), 0
+    try:
+        for i, row in enumerate(rows):
+            if gap and i:
+                time.sleep(gap)
+            message = EmailMessage(row.subject, row.body, to=[row.to], connection=connection)
+            try:
+                connection.send_messages([message])
+            except Exception as e:
+                logger.warning("email %s send failed: %s", row.id, e)
+                row.attempts += 1
+                row.last_error = str(e)[:255]
+                row.claimed_until = None
+                if row.attempts < row.max_attempts:
+                    row.next_attempt_at = timezone.now() + backoff * (2 ** (row.attempts - 1))
+                    retried += 1
+                else:
+                    row.status = "FAILED"
+                    failed += 1
+                row.save(update_fields=[
+                    "attempts", "last_error", "claimed_until", "next_attempt_at", "status",
+                ])
+                continue
+            row.status = "SENT"
+            row.sent_at = timezone.now()
+            row.attempts += 1
+            row.claimed_until = None
+            row.save(update_fields=["status", "sent_at", "attempts", "claimed_until"])
+            sent += 1
+    finally:
+        if opened:
+            connection.close()
+    return sent, retried, failed
@@ -0,0 +1,57 @@
+# apps/users/management/commands/bench_jwt.py
+import time
+import uuid
+from functools import partial
+
+import jwt
+from django.core.management.base import BaseCommand
+
+
+class Command(BaseCommand):
+    help = "JWT 서명/검증 처리량 비교 (HS256 / RS256 / EdDSA, PEM 매번 파싱 vs 파싱된 키 재사용)"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--iterations", type=int, default=2000)
+
+    def handle(self, *args, iterations, **options):
+        from cryptography.hazmat.primitives import serialization
+        from cryptography.hazmat.primitives.asymmetric import ed25519, rsa
+
+        payload = {
+            "token_type": "access", "user_id": str(uuid.uuid4()), "exp": int(time.time()) + 1800,
+        }
+        rsa_key = rsa.generate_private_key(public_exponent=65537, key_size=2048)
+        ed_key = ed25519.Ed25519PrivateKey.generate()
+
+        def public_pem(key):
+            return key.public_key().public_bytes(
+                serialization.Encoding.PEM, serialization.PublicFormat.SubjectPublicKeyInfo
+            )
+
+        cases = [
+            ("HS256", "x" * 64, "x" * 64, None),
+            ("RS256", rsa_key, rsa_key.public_key(), public_pem(rsa_key)),
+            ("EdDSA", ed_key, ed_key.public_key(), public_pem(ed_key)),
+        ]
+        self.stdout.write(f"{'알고리즘':<8}{'서명/s':>12}{'검증/s':>12}{'검증(PEM 파싱)/s':>20}")
+        for algorithm, signing_key, verifying_key, pem in cases:
+            token = jwt.encode(payload, signing_key, algorithm=algorithm)
+            sign = partial(jwt.encode, payload, signing_key, algorithm=algorithm)
+            verify = partial(jwt.decode, token, verifying_key, algorithms=[algorithm])
+            sign_rate = self._rate(iterations, sign)
+            verify_rate = self._rate(iterations, verify)
+            pem_rate = (
+                self._rate(iterations, partial(jwt.decode, token, pem, algorithms=[algorithm]))
+                if pem else None
+            )
+            self.stdout.write(
+                f"{algorithm:<8}{sign_rate:>12,.0f}{verify_rate:>12,.0f}"
+                f"{(f'{pem_rate:,.0f}' if pem_rate else '-'):>20}"
+            )
+
+    @staticmethod
+    def _rate(iterations, fn):
+        start = time.perf_counter()
+        for _ in range(iterations):
+            fn()
+        return iterations / (time.perf_counter() - start)
@@ -0,0 +1,44 @@
+# apps/users/management/commands/generate_jwt_key.py
+from datetime import datetime
+from pathlib import Path
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+
+
+class Command(BaseCommand):
+    help = "JWT 서명용 개인키(<kid>.pem)를 생성합니다. 적용은 JWT_ACTIVE_KID 변경 후 재시작."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--algorithm", choices=("RS256", "EdDSA"), default=None,
+                            help="기본: JWT_KEYS['ALGORITHM']")
+        parser.add_argument("--kid", default=None, help="기본: 현재 시각 (예: 20250101T000000)")
+        parser.add_argument("--dir", default=None, help="기본: JWT_KEYS['DIR']")
+
+    def handle(self, *args, algorithm, kid, dir, **options):
+        from cryptography.hazmat.primitives import serialization
+        from cryptography.hazmat.primitives.asymmetric import ed25519, rsa
+
+        algorithm = algorithm or settings.JWT_KEYS["ALGORITHM"]
+        directory = Path(dir or settings.JWT_KEYS["DIR"] or "")
+        if not str(directory) or not directory.is_dir():
+            raise CommandError("키 디렉터리(--dir 또는 JWT_KEYS_DIR)가 없습니다.")
+        kid = kid or datetime.now().strftime("%Y%m%dT%H%M%S")
+        path = directory / f"{kid}.pem"
+        if path.exists():
+            raise CommandError(f"{path} 가 이미 있습니다.")
+
+        if algorithm == "EdDSA":
+            key = ed25519.Ed25519PrivateKey.generate()
+        elif algorithm == "RS256":
+            key = rsa.generate_private_key(public_exponent=65537, key_size=2048)
+        else:
+            raise CommandError(f"지원하지 않는 알고리즘: {algorithm}")
+
+        path.write_bytes(key.private_bytes(
+            serialization.Encoding.PEM,
+            serialization.PrivateFormat.PKCS8,
+            serialization.NoEncryption(),
+        ))
+        path.chmod(0o600)
+        self.stdout.write(self.style.SUCCESS(f"{algorithm} 키 생성: {path} (kid={kid})"))
@@ -0,0 +1,72 @@
+# apps/users/management/commands/import_users.py
+import csv
+from collections import Counter
+from itertools import islice
+
+from django.core.management.base import BaseCommand, CommandError
+
+from config.process_pool import worker_pool
+
+from ...importer import UserImporter, chunked, load_checkpoint, read_records, save_checkpoint
+
+
+class Command(BaseCommand):
+    help = (
+        "CSV/JSONL 파일에서 사용자를 대량 생성합니다. "
+        "컬럼: email, password | password_hash, nickname, name, phone, is_active"
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("path")
+        parser.add_argument("--format", choices=("csv", "jsonl"), default=None,
+                            help="기본: 확장자로 판단")
+        parser.add_argument("--chunk-size", type=int, default=5000,
+                            help="청크(트랜잭션/체크포인트) 단위 행 수")
+        parser.add_argument("--batch-size", type=int, default=1000,
+                            help="bulk_create INSERT 당 행 수")
+        parser.add_argument("--workers", type=int, default=4,
+                            help="해시 워커 프로세스 수 (1 이하: 현재 프로세스)")
+        parser.add_argument("--inactive", action="store_true",
+                            help="is_active 컬럼이 없을 때 비활성으로 생성")
+        parser.add_argument("--report", default=None,
+                            help="거절 리포트 CSV (기본: <path>.rejects.csv)")
+        parser.add_argument("--checkpoint", default=None,
+                            help="체크포인트 파일 (기본: <path>.checkpoint)")
+        parser.add_argument("--restart", action="store_true", help="체크포인트를 무시하고 처음부터")
+
+    def handle(self, *args, path, format, chunk_size, batch_size, workers, inactive, report,
+               checkpoint, restart, **options):
+        if chunk_size <= 0:
+            raise CommandError("--chunk-size 는 1 이상이어야 합니다.")
+        report = report or f"{path}.rejects.csv"
+        checkpoint = checkpoint or f"{path}.checkpoint"
+        done = 0 if restart else load_checkpoint(checkpoint)
+        if done:
+            self.stdout.write(f"체크포인트: 청크 {done}개 완료 → 이어서 진행")
+
+        totals = Counter()
+        chunks = chunked(read_records(path, format), chunk_size)
+        mode = "a" if done else "w"
+        with worker_pool(workers) as pool, open(report, mode, newline="", encoding="utf-8") as rf:
+            writer = csv.writer(rf)
+            if not done:
+                writer.writerow(["line", "email", "reason"])
+            importer = UserImporter(pool, batch_size=batch_size, default_active=not inactive)
+
+            # 완료된 청크의 이메일도 파일 내 중복 판정에 포함
+            for records in islice(chunks, done):
+                importer.seen.update(
+                    str(rec.get("email", "")).strip().lower()
+                    for _, rec in records if isinstance(rec, dict)
+                )
+
+            for index, records in enumerate(chunks, start=done + 1):
+                result = importer.import_chunk(records)
+                writer.writerows(result.rejects)
+                rf.flush()
+                save_checkpoint(checkpoint, index)
+                rejected = len(result.rejects)
+                totals.update(created=result.created, rejected=rejected)
+                self.stdout.write(f"청크 {index}: 생성 {result.created}, 거절 {rejected}")
+
+        self.stdout.write(self.style.SUCCESS(f"완료: {dict(totals)} (거절 리포트: {report})"))
@@ -0,0 +1,15 @@
+# apps/users/management/commands/prune_tokens.py
+from django.core.management.base import BaseCommand
+
+from ...revocation import prune_expired
+
+
+class Command(BaseCommand):
+    help = "만료된 JWT outstanding/blacklisted 토큰을 배치 단위로 삭제합니다. (주기 실행용)"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--batch-size", type=int, default=5000)
+
+    def handle(self, *args, batch_size, **options):
+        deleted = prune_expired(batch_size=batch_size)
+        self.stdout.write(self.style.SUCCESS(f"만료 토큰 {deleted}건 삭제"))
@@ -0,0 +1,33 @@
+# apps/users/management/commands/send_queued_emails.py
+import time
+from collections import Counter
+
+from django.core.management.base import BaseCommand
+from django.db import close_old_connections
+
+from ...mailer import send_batch
+
+
+class Command(BaseCommand):
+    help = "EmailOutbox 에 쌓인 메일을 연결 하나로 배치 발송합니다. (실패 건은 백오프 후 재시도)"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--batch-size", type=int, default=100)
+        parser.add_argument("--rate", type=int, default=None,
+                            help="분당 최대 발송 수 (기본: EMAIL_OUTBOX 설정)")
+        parser.add_argument("--loop", action="store_true", help="종료하지 않고 계속 폴링")
+        parser.add_argument("--interval", type=float, default=2.0,
+                            help="대기 시간(초), --loop 일 때")
+
+    def handle(self, *args, batch_size, rate, loop, interval, **options):
+        totals = Counter()
+        while True:
+            sent, retried, failed = send_batch(batch_size=batch_size, rate_per_minute=rate)
+            totals.update(sent=sent, retried=retried, failed=failed)
+            if sent or retried or failed:
+                continue
+            if not loop:
+                break
+            close_old_connections()
+            time.sleep(interval)
+        self.stdout.write(self.style.SUCCESS(f"완료: {dict(totals)}"))
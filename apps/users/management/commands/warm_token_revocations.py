@@ -0,0 +1,20 @@
+# apps/users/management/commands/warm_token_revocations.py
+from django.core.management.base import BaseCommand
+
+from ...revocation import shared_cache, warm
+
+
+class Command(BaseCommand):
+    help = ("만료 전 블랙리스트 jti 를 공유 캐시에 적재합니다. "
+            "(배포 직후 + WARM_TTL 보다 짧은 주기로 실행)")
+
+    def add_arguments(self, parser):
+        parser.add_argument("--chunk-size", type=int, default=2000)
+
+    def handle(self, *args, chunk_size, **options):
+        if not shared_cache():
+            self.stdout.write(self.style.WARNING(
+                "프로세스 로컬 캐시: warm 마커를 신뢰하지 않으므로 확인은 계속 DB 로 합니다."
+            ))
+        loaded = warm(chunk_size=chunk_size)
+        self.stdout.write(self.style.SUCCESS(f"회수 토큰 {loaded}건 적재"))
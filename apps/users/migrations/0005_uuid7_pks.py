@@ -0,0 +1,19 @@
+# Generated by Django 5.2.7 on 2026-10-19 14:54
+
+import config.ids
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('users', '0004_user_deleted_at'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='user',
+            name='id',
+            field=models.UUIDField(default=config.ids.uuid7, editable=False, primary_key=True, serialize=False),
+        ),
+    ]
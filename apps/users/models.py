@@ -1,8 +1,10 @@
-import uuid
 from django.contrib.auth.models import AbstractBaseUser, PermissionsMixin, BaseUserManager
 from django.db import models
+from django.db.models.functions import Lower
 from django.utils import timezone
 
+from config.ids import uuid7
+
 class UserManager(BaseUserManager):
     def create_user(self, email, password=None, **extra):
         if not email:
@@ -25,7 +27,7 @@ class UserManager(BaseUserManager):
         return self.create_user(email, password, **extra)
 
 class User(AbstractBaseUser, PermissionsMixin):
-    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    id = models.UUIDField(primary_key=True, default=uuid7, editable=False)
     email = models.EmailField(unique=True, max_length=254)
     password = models.CharField(max_length=128)
     nickname = models.CharField(max_length=50, blank=True, null=True)
@@ -37,6 +39,11 @@ class User(AbstractBaseUser, PermissionsMixin):
     is_active = models.BooleanField(default=True)
     last_login = models.DateTimeField(blank=True, null=True)
     date_joined = models.DateTimeField(default=timezone.now)
+    # 탈퇴 요청 시각: is_active=False 와 함께 설정, 실제 삭제는 purge_deleted 워커
+    deleted_at = models.DateTimeField(blank=True, null=True)
+    # 모든 기기 로그아웃 시각: 이 시각(초) 이전에 발급된 refresh 토큰 거부
+    # (apps/users/revocation.py)
+    tokens_valid_after = models.DateTimeField(blank=True, null=True)
 
     USERNAME_FIELD = "email"
     REQUIRED_FIELDS: list[str] = []
@@ -45,3 +52,43 @@ class User(AbstractBaseUser, PermissionsMixin):
 
     class Meta:
         db_table = "users"
+        indexes = [
+            # 대소문자 무시 이메일 조회 (import_users 의 기존 가입자 확인)
+            models.Index(Lower("email"), name="idx_users_email_lower"),
+        ]
+
+
+EMAIL_OUTBOX_STATUS = (
+    ("PENDING", "발송 대기"),
+    ("SENT", "발송 완료"),
+    ("FAILED", "발송 실패"),   # max_attempts 초과
+)
+
+
+class EmailOutbox(models.Model):
+    """
+    발송 대기 메일 (DB 큐). 요청 트랜잭션 안에서 INSERT 만 하고,
+    실제 SMTP 발송은 `manage.py send_queued_emails` 워커가 담당.
+    """
+    id = models.BigAutoField(primary_key=True)
+    to = models.EmailField(max_length=254)
+    subject = models.CharField(max_length=255)
+    body = models.TextField()
+    status = models.CharField(max_length=10, choices=EMAIL_OUTBOX_STATUS, default="PENDING")
+    attempts = models.PositiveSmallIntegerField(default=0)
+    max_attempts = models.PositiveSmallIntegerField(default=5)
+    next_attempt_at = models.DateTimeField(default=timezone.now)
+    claimed_until = models.DateTimeField(null=True, blank=True)
+    last_error = models.CharField(max_length=255, blank=True, default="")
+    created_at = models.DateTimeField(auto_now_add=True)
+    sent_at = models.DateTimeField(null=True, blank=True)
+
+    class Meta:
+        db_table = "email_outbox"
+        ordering = ["id"]
+        indexes = [
+            models.Index(fields=["status", "next_attempt_at"], name="idx_email_status_next"),
+        ]
+
+    def __str__(self):
+        return f"{self.to} [{self.status}] {self.subject}"
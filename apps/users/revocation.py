@@ -0,0 +1,281 @@
+# apps/users/revocation.py
+"""
+JWT refresh 토큰 회수(블랙리스트) 빠른 확인 계층
+
+- 진실 원천은 DB(token_blacklist 앱). 여기서는 조회만 빠르게 한다.
+- 확인 순서: 프로세스 로컬 집합 → 캐시 키(jti 별) → DB
+  (로컬 캐시 모드에서는 사용자 컷오프와 jti 블랙리스트를 한 쿼리로 확인)
+- warm(`manage.py warm_token_revocations`): 만료 전 블랙리스트 jti 전체를 캐시에 적재하고
+  마커를 남김
+  → 공유 캐시(Redis 등)일 때만 마커가 살아 있는 동안 "캐시에 없음 = 회수 안 됨" 으로 판단하고
+    DB 를 건너뜀
+  → 프로세스 로컬 캐시(locmem)는 다른 워커의 회수를 못 보므로 캐시에 없으면 항상 DB 확인
+- 블랙리스트 등록은 INSERT … SELECT … ON CONFLICT DO NOTHING 한 문장
+  (get + get_or_create 3왕복 대신)
+- 사용자 단위 일괄 회수(모든 기기 로그아웃)도 한 문장 + 사용자별 "이 시각 이전 발급분 회수" 컷오프를
+  users.tokens_valid_after 에 저장 (캐시는 공유 캐시일 때만 읽기 경유용)
+- 만료 토큰 정리는 `manage.py prune_tokens`
+"""
+import threading
+import time
+
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.db import connection
+from django.db.models import Exists
+from django.utils import timezone
+from rest_framework_simplejwt.exceptions import TokenError
+from rest_framework_simplejwt.settings import api_settings
+from rest_framework_simplejwt.token_blacklist.models import BlacklistedToken, OutstandingToken
+from rest_framework_simplejwt.tokens import RefreshToken
+
+from .user_cache import invalidate_users
+
+
+def _config():
+    return settings.JWT_REVOCATION
+
+
+def _key(jti):
+    return f"{_config()['CACHE_PREFIX']}{jti}"
+
+
+def _user_key(user_id):
+    return f"{_config()['CACHE_PREFIX']}user:{user_id}"
+
+
+def _warm_key():
+    return f"{_config()['CACHE_PREFIX']}__warm__"
+
+
+class _LocalRevoked:
+    """jti → exp(epoch). 커지면 만료된 항목부터 정리"""
+
+    def __init__(self):
+        self._data = {}
+        self._lock = threading.Lock()
+
+    def __contains__(self, jti):
+        return jti in self._data
+
+    def add(self, jti, exp):
+        with self._lock:
+            self._data[jti] = exp
+            if len(self._data) > _config()["LOCAL_MAX"]:
+                now = time.time()
+                self._data = {k: v for k, v in self._data.items() if v > now}
+
+    def clear(self):
+        with self._lock:
+            self._data.clear()
+
+
+_local = _LocalRevoked()
+
+
+def _remember(jti, exp):
+    _local.add(jti, exp)
+    ttl = int(exp - time.time())
+    if ttl > 0:
+        cache.set(_key(jti), 1, ttl)
+
+
+LOCAL_BACKENDS = (
+    "django.core.cache.backends.locmem.LocMemCache",
+    "django.core.cache.backends.dummy.DummyCache",
+)
+
+
+def shared_cache():
+    """
+    모든 워커가 같은 캐시를 보는지
+    JWT_REVOCATION["SHARED_CACHE"] 가 없으면 CACHES 백엔드로 판단
+    """
+    shared = _config().get("SHARED_CACHE")
+    if shared is None:
+        shared = settings.CACHES["default"]["BACKEND"] not in LOCAL_BACKENDS
+    return shared
+
+
+def warm(*, chunk_size=2000):
+    """
+    만료 전 블랙리스트 jti 를 캐시에 적재하고 warm 마커를 남김
+    (배포 직후/주기 실행, 요청 안에서 부르지 않음).
+    키는 청크에서 가장 늦게 만료되는 토큰까지 유지
+    → 마커가 살아 있는 동안 회수 키가 먼저 사라지지 않음
+    반환: 적재한 jti 수
+    """
+    rows = (
+        BlacklistedToken.objects.filter(token__expires_at__gt=timezone.now())
+        .values_list("token__jti", "token__expires_at")
+        .iterator(chunk_size=chunk_size)
+    )
+    loaded, chunk, latest = 0, {}, 0.0
+    for jti, expires_at in rows:
+        chunk[_key(jti)] = 1
+        latest = max(latest, expires_at.timestamp())
+        if len(chunk) >= chunk_size:
+            loaded += _store(chunk, latest)
+            chunk, latest = {}, 0.0
+    loaded += _store(chunk, latest)
+    cache.set(_warm_key(), 1, _config()["WARM_TTL"])
+    return loaded
+
+
+def _store(chunk, latest):
+    ttl = int(latest - time.time()) + 1
+    if chunk and ttl > 0:
+        cache.set_many(chunk, ttl)
+    return len(chunk)
+
+
+def is_revoked(jti, exp, user_id=None, iat=None):
+    if jti in _local:
+        return True
+    if cache.get(_key(jti)):
+        _local.add(jti, exp)
+        return True
+    check_user = user_id is not None and iat is not None
+    if shared_cache():
+        if check_user and iat < user_cutoff(user_id):
+            return True
+        if cache.get(_warm_key()):
+            return False
+        revoked = BlacklistedToken.objects.filter(token__jti=jti).exists()
+    elif check_user:
+        cutoff, revoked = _cutoff_and_blacklisted(user_id, jti)
+        if iat < cutoff:
+            return True
+    else:
+        revoked = BlacklistedToken.objects.filter(token__jti=jti).exists()
+    if revoked:
+        _remember(jti, exp)
+    return revoked
+
+
+def user_cutoff(user_id):
+    """
+    모든 기기 로그아웃 컷오프(epoch 초, 없으면 0). iat < 컷오프 만 회수
+    → 로그아웃 직후 같은 초에 다시 로그인해 받은 토큰은 살아 있음
+      (그 초에 로그아웃 전에 발급된 토큰은 revoke_users 가 jti 로 이미 블랙리스트에 넣음)
+    공유 캐시면 캐시 경유, 아니면 DB (다른 워커가 기록한 컷오프를 놓치지 않게)
+    """
+    shared = shared_cache()
+    if shared:
+        cached = cache.get(_user_key(user_id))
+        if cached is not None:
+            return cached
+    value = (
+        get_user_model().objects.filter(pk=user_id)
+        .values_list("tokens_valid_after", flat=True).first()
+    )
+    cutoff = int(value.timestamp()) if value else 0
+    if shared:
+        # add: 그 사이 revoke_users 가 기록한 값을 덮어쓰지 않음
+        ttl = int(api_settings.REFRESH_TOKEN_LIFETIME.total_seconds())
+        cache.add(_user_key(user_id), cutoff, ttl)
+    return cutoff
+
+
+def _cutoff_and_blacklisted(user_id, jti):
+    """로컬 캐시 모드: 컷오프와 jti 블랙리스트 여부를 한 쿼리로 (사용자 행 + EXISTS 서브쿼리)"""
+    row = (
+        get_user_model().objects.filter(pk=user_id)
+        .annotate(blacklisted=Exists(BlacklistedToken.objects.filter(token__jti=jti)))
+        .values_list("tokens_valid_after", "blacklisted")
+        .first()
+    )
+    if row is None:  # 사용자 행이 없으면 컷오프도 없음
+        return 0, BlacklistedToken.objects.filter(token__jti=jti).exists()
+    value, blacklisted = row
+    return (int(value.timestamp()) if value else 0), blacklisted
+
+
+def blacklist_jti(jti):
+    """DB 블랙리스트 등록(멱등, 한 문장). 반환: 새로 등록됐으면 True"""
+    qn = connection.ops.quote_name
+    blacklisted = BlacklistedToken._meta.db_table
+    outstanding = OutstandingToken._meta.db_table
+    with connection.cursor() as cursor:
+        cursor.execute(
+            f"INSERT INTO {qn(blacklisted)} ({qn('token_id')}, {qn('blacklisted_at')}) "
+            f"SELECT {qn('id')}, %s FROM {qn(outstanding)} WHERE {qn('jti')} = %s "
+            f"ON CONFLICT ({qn('token_id')}) DO NOTHING",
+            [timezone.now(), jti],
+        )
+        return cursor.rowcount > 0
+
+
+def revoke(token):
+    jti = token[api_settings.JTI_CLAIM]
+    created = blacklist_jti(jti)
+    _remember(jti, token["exp"])
+    return created
+
+
+def revoke_users(users, *, chunk_size=1000):
+    """
+    users(사용자 QuerySet)의 만료 전·미회수 refresh 토큰을 한 문장으로 블랙리스트 등록.
+    사용자별 컷오프(tokens_valid_after)를 저장하고 캐시 사본/인증 사용자 캐시를 갱신한다.
+    반환: 등록 건수
+    """
+    qn = connection.ops.quote_name
+    blacklisted = qn(BlacklistedToken._meta.db_table)
+    outstanding = qn(OutstandingToken._meta.db_table)
+    user_sql, user_params = users.order_by().values("pk").query.sql_with_params()
+    now = timezone.now()
+    with connection.cursor() as cursor:
+        cursor.execute(
+            f"INSERT INTO {blacklisted} ({qn('token_id')}, {qn('blacklisted_at')}) "
+            f"SELECT o.{qn('id')}, %s FROM {outstanding} o "
+            f"WHERE o.{qn('user_id')} IN ({user_sql}) AND o.{qn('expires_at')} > %s "
+            f"AND NOT EXISTS (SELECT 1 FROM {blacklisted} b "
+            f"WHERE b.{qn('token_id')} = o.{qn('id')}) "
+            f"ON CONFLICT ({qn('token_id')}) DO NOTHING",
+            [now, *user_params, now],
+        )
+        revoked = cursor.rowcount
+    users.model.objects.filter(pk__in=users.order_by().values("pk")).update(tokens_valid_after=now)
+
+    cutoff = int(now.timestamp())
+    ttl = int(api_settings.REFRESH_TOKEN_LIFETIME.total_seconds())
+    user_ids = [str(pk) for pk in users.order_by().values_list("pk", flat=True)]
+    for i in range(0, len(user_ids), chunk_size):
+        chunk = user_ids[i:i + chunk_size]
+        cache.set_many({_user_key(pk): cutoff for pk in chunk}, ttl)
+        invalidate_users(chunk)
+    return revoked
+
+
+def prune_expired(*, batch_size=5000):
+    """만료된 outstanding/blacklisted 토큰을 배치 단위로 삭제. 반환: 삭제한 outstanding 건수"""
+    now = timezone.now()
+    deleted = 0
+    while True:
+        ids = list(
+            OutstandingToken.objects.filter(expires_at__lt=now)
+            .order_by("id")
+            .values_list("id", flat=True)[:batch_size]
+        )
+        if not ids:
+            return deleted
+        BlacklistedToken.objects.filter(token_id__in=ids).delete()
+        deleted += OutstandingToken.objects.filter(id__in=ids).delete()[0]
+
+
+def clear_local():
+    _local.clear()
+
+
+class FastRefreshToken(RefreshToken):
+    """블랙리스트 확인/등록을 이 모듈의 빠른 경로로 처리하는 RefreshToken"""
+
+    def check_blacklist(self):
+        payload = self.payload
+        if is_revoked(payload[api_settings.JTI_CLAIM], payload["exp"],
+                      payload.get(api_settings.USER_ID_CLAIM), payload.get("iat")):
+            raise TokenError("Token is blacklisted")
+
+    def blacklist(self):
+        return revoke(self)
@@ -2,8 +2,8 @@ from django.contrib.auth import get_user_model
 from django.contrib.auth.password_validation import validate_password
 from django.utils.encoding import force_bytes
 from django.utils.http import urlsafe_base64_encode
-from django.core.mail import send_mail
 from rest_framework import serializers
+from .mailer import enqueue_email
 from .tokens import email_verification_token
 
 User = get_user_model()
@@ -23,15 +23,14 @@ class RegisterSerializer(serializers.ModelSerializer):
         user.save()
         return user
 
-    def send_verification_email(self, user, request):
+    def queue_verification_email(self, user, request):
+        """인증 메일을 발송 큐(EmailOutbox)에 적재. 실제 발송은 send_queued_emails 워커"""
         uid = urlsafe_base64_encode(force_bytes(user.pk))
         token = email_verification_token.make_token(user)
         verify_path = f"/api/auth/verify-email/?uid={uid}&token={token}"
         verify_url = request.build_absolute_uri(verify_path)
-        send_mail(
+        return enqueue_email(
+            to=user.email,
             subject="[Django Mini Project] 이메일 인증을 완료해 주세요",
-            message=f"아래 링크를 클릭해서 이메일 인증을 완료하세요:\n{verify_url}",
-            from_email=None,
-            recipient_list=[user.email],
-            fail_silently=False,
+            body=f"아래 링크를 클릭해서 이메일 인증을 완료하세요:\n{verify_url}",
         )
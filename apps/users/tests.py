@@ -1,3 +1,348 @@
-from django.test import TestCase
+# apps/users/tests.py
+import csv
+import json
+import tempfile
+from datetime import datetime, timedelta, timezone as dt_timezone
+from io import StringIO
+from pathlib import Path
+from unittest import mock
 
-# Create your tests here.
+import jwt as pyjwt
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.contrib.auth.hashers import make_password
+from django.core import mail
+from django.core.cache import cache
+from django.core.management import call_command
+from django.test import override_settings
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework.test import APITestCase
+from rest_framework_simplejwt import state
+from rest_framework_simplejwt.exceptions import TokenError
+from rest_framework_simplejwt.token_blacklist.models import BlacklistedToken, OutstandingToken
+from rest_framework_simplejwt.tokens import RefreshToken
+
+from config import throttling
+
+from . import jwt_keys, revocation, user_cache
+from .mailer import enqueue_email, send_batch
+from .models import EmailOutbox
+from .revocation import FastRefreshToken
+
+User = get_user_model()
+
+
+class AuthUserCacheTests(APITestCase):
+    def setUp(self):
+        user_cache.clear()
+        cache.clear()
+        self.user = User.objects.create_user(
+            email="cache@example.com", password="pass1234!", nickname="before"
+        )
+        credentials = {"email": "cache@example.com", "password": "pass1234!"}
+        res = self.client.post(reverse("users:login"), credentials, format="json")
+        self.assertEqual(res.status_code, 200)
+        self.auth = {"HTTP_AUTHORIZATION": f"Bearer {self.client.cookies['access_token'].value}"}
+        self.client.cookies.clear()
+
+    def test_second_request_resolves_user_from_cache(self):
+        self.client.get(reverse("users:me"), **self.auth)
+        with self.assertNumQueries(0):
+            res = self.client.get(reverse("users:me"), **self.auth)
+        self.assertEqual(res.data["nickname"], "before")
+
+    def test_profile_update_invalidates_cache(self):
+        self.client.get(reverse("users:me"), **self.auth)
+        res = self.client.patch(
+            reverse("users:me"), {"nickname": "after"}, format="json", **self.auth
+        )
+        self.assertEqual(res.status_code, 200)
+        self.assertEqual(User.objects.get(pk=self.user.pk).nickname, "after")
+        res = self.client.get(reverse("users:me"), **self.auth)
+        self.assertEqual(res.data["nickname"], "after")
+
+    def test_deactivated_user_is_rejected_after_invalidation(self):
+        self.client.get(reverse("users:me"), **self.auth)
+        User.objects.filter(pk=self.user.pk).update(is_active=False)
+        user_cache.invalidate_user(self.user.pk)
+        self.assertEqual(self.client.get(reverse("users:me"), **self.auth).status_code, 401)
+
+    def test_trusted_claims_skip_user_lookup_on_reads(self):
+        cfg = {"ENABLED": True, "TTL": 10, "MAX_SIZE": 100, "SHARED": False, "SHARED_TTL": 60,
+               "TRUST_CLAIMS_FOR_READS": True}
+        with override_settings(AUTH_USER_CACHE=cfg):
+            with self.assertNumQueries(1):  # 계좌 목록 SELECT 만
+                res = self.client.get("/api/accounts/", **self.auth)
+        self.assertEqual(res.status_code, 200)
+
+
+class TokenRevocationTests(APITestCase):
+    def setUp(self):
+        revocation.clear_local()
+        cache.clear()
+        self.user = User.objects.create_user(email="rev@example.com", password="pass1234!")
+        credentials = {"email": "rev@example.com", "password": "pass1234!"}
+        res = self.client.post(reverse("users:login"), credentials, format="json")
+        self.assertEqual(res.status_code, 200)
+        self.refresh = self.client.cookies["refresh_token"].value
+
+    def test_rotated_refresh_token_cannot_be_reused(self):
+        res = self.client.post(reverse("users:refresh"), {"refresh": self.refresh}, format="json")
+        self.assertEqual(res.status_code, 200)
+        res = self.client.post(reverse("users:refresh"), {"refresh": self.refresh}, format="json")
+        self.assertEqual(res.status_code, 401)
+        jti = RefreshToken(self.refresh, verify=False)["jti"]
+        self.assertTrue(BlacklistedToken.objects.filter(token__jti=jti).exists())
+
+    def test_check_uses_cache_once_warm(self):
+        config = {**settings.JWT_REVOCATION, "SHARED_CACHE": True}
+        with override_settings(JWT_REVOCATION=config):
+            # warm 전 → 컷오프 + jti 를 DB 로 (요청 안에서 warm 하지 않음)
+            with self.assertNumQueries(2):
+                token = FastRefreshToken(self.refresh)
+            call_command("warm_token_revocations", stdout=StringIO())
+            with self.assertNumQueries(0):
+                FastRefreshToken(self.refresh)
+            revocation.revoke(token)
+            revocation.clear_local()  # 다른 워커 관점: 공유 캐시 키로 확인
+            with self.assertNumQueries(0), self.assertRaises(TokenError):
+                FastRefreshToken(self.refresh)
+
+    def test_local_cache_never_trusts_a_miss(self):
+        token = FastRefreshToken(self.refresh)
+        revocation.warm()
+        revocation.revoke(token)
+        # 다른 워커: 로컬 집합/locmem 캐시 모두 비어 있음 → warm 마커가 있어도 DB 로 확인
+        revocation.clear_local()
+        cache.delete(f"{settings.JWT_REVOCATION['CACHE_PREFIX']}{token['jti']}")
+        with self.assertNumQueries(1), self.assertRaises(TokenError):   # 컷오프 + jti 한 쿼리
+            FastRefreshToken(self.refresh)
+
+    def test_local_cache_refresh_checks_cutoff_and_jti_in_one_query(self):
+        FastRefreshToken(self.refresh)
+        revocation.clear_local()
+        with self.assertNumQueries(1):   # 회수 안 된 토큰도 사용자 행 + EXISTS 한 번
+            FastRefreshToken(self.refresh)
+
+    def test_prune_deletes_expired_tokens(self):
+        token = FastRefreshToken(self.refresh)
+        revocation.revoke(token)
+        OutstandingToken.objects.update(expires_at=timezone.now() - timedelta(seconds=1))
+        call_command("prune_tokens", "--batch-size", "1", stdout=StringIO())
+        self.assertFalse(OutstandingToken.objects.exists())
+        self.assertFalse(BlacklistedToken.objects.exists())
+
+    def test_logout_all_revokes_every_session_in_one_statement(self):
+        other_sessions = [FastRefreshToken.for_user(self.user) for _ in range(5)]
+        access = self.client.cookies["access_token"].value
+        res = self.client.post(reverse("users:logout-all"), HTTP_AUTHORIZATION=f"Bearer {access}")
+        self.assertEqual(res.status_code, 200)
+        self.assertEqual(res.data["revoked"], 6)
+        self.assertEqual(BlacklistedToken.objects.filter(token__user=self.user).count(), 6)
+        revocation.clear_local()
+        cache.clear()
+        # 컷오프 이전 발급분은 컷오프로, 같은 초 발급분은 jti 블랙리스트로
+        with self.assertRaises(TokenError):
+            FastRefreshToken(str(other_sessions[0]))
+
+    def test_logout_all_cutoff_is_persisted_for_other_workers(self):
+        stale = FastRefreshToken.for_user(self.user)
+        cutoff = timezone.now() + timedelta(seconds=5)
+        User.objects.filter(pk=self.user.pk).update(tokens_valid_after=cutoff)
+        revocation.clear_local()
+        cache.clear()   # 다른 워커의 locmem: 컷오프 사본 없음 → DB 컬럼으로 판단
+        with self.assertRaises(TokenError):
+            FastRefreshToken(str(stale))
+        self.assertTrue(revocation.user_cutoff(self.user.pk))
+
+    def test_login_right_after_logout_all_is_not_revoked(self):
+        revocation.revoke_users(User.objects.filter(pk=self.user.pk))
+        fresh = FastRefreshToken.for_user(self.user)   # 다시 로그인
+        # 로그아웃 시각이 새 토큰과 같은 초(iat 는 초 단위)였던 경우
+        same_second = datetime.fromtimestamp(fresh["iat"] + 0.9, tz=dt_timezone.utc)
+        User.objects.filter(pk=self.user.pk).update(tokens_valid_after=same_second)
+        revocation.clear_local()
+        cache.clear()
+        FastRefreshToken(str(fresh))   # 거부되지 않음
+
+    def test_bulk_revoke_covers_many_users_and_is_idempotent(self):
+        other = User.objects.create_user(email="rev2@example.com", password="pass1234!")
+        FastRefreshToken.for_user(other)
+        revoked = revocation.revoke_users(User.objects.filter(email__startswith="rev"))
+        self.assertEqual(revoked, 2)
+        self.assertEqual(revocation.revoke_users(User.objects.all()), 0)
+
+
+class ThrottlingTests(APITestCase):
+    def setUp(self):
+        cache.clear()
+
+    def test_login_is_limited_per_email_with_retry_after(self):
+        url = reverse("users:login")
+        for _ in range(5):
+            res = self.client.post(url, {"email": "Victim@example.com", "password": "wrong"},
+                                   format="json")
+            self.assertEqual(res.status_code, 401)
+        res = self.client.post(url, {"email": "victim@example.com", "password": "wrong"},
+                               format="json")
+        self.assertEqual(res.status_code, 429)
+        self.assertIn("Retry-After", res)
+        # 다른 이메일은 IP 한도 안에서 계속 허용
+        res = self.client.post(url, {"email": "other@example.com", "password": "wrong"},
+                               format="json")
+        self.assertEqual(res.status_code, 401)
+
+    def test_login_sheds_load_when_concurrency_limit_is_reached(self):
+        sem = throttling._semaphore("login")
+        with mock.patch.object(sem, "acquire", return_value=False):
+            res = self.client.post(reverse("users:login"),
+                                   {"email": "a@example.com", "password": "x"}, format="json")
+        self.assertEqual(res.status_code, 503)
+        self.assertEqual(res["Retry-After"], "2")
+
+
+class EmailOutboxTests(APITestCase):
+    def setUp(self):
+        cache.clear()
+
+    def test_register_queues_email_instead_of_sending(self):
+        payload = {"email": "new@example.com", "password": "Str0ng!pass#1", "nickname": "new"}
+        res = self.client.post(reverse("users:register"), payload, format="json")
+        self.assertEqual(res.status_code, 201)
+        self.assertEqual(len(mail.outbox), 0)
+        queued = EmailOutbox.objects.get(to="new@example.com")
+        self.assertIn("verify-email", queued.body)
+
+        call_command("send_queued_emails", "--rate", "0", stdout=StringIO())
+        self.assertEqual(len(mail.outbox), 1)
+        queued.refresh_from_db()
+        self.assertEqual(queued.status, "SENT")
+
+    def test_failed_send_is_retried_with_backoff_then_marked_failed(self):
+        row = enqueue_email("x@example.com", "s", "b")
+        EmailOutbox.objects.filter(pk=row.pk).update(max_attempts=2)
+        with mock.patch("django.core.mail.backends.locmem.EmailBackend.send_messages",
+                        side_effect=OSError("smtp down")):
+            self.assertEqual(send_batch(rate_per_minute=0), (0, 1, 0))
+            row.refresh_from_db()
+            self.assertGreater(row.next_attempt_at, timezone.now())
+            EmailOutbox.objects.filter(pk=row.pk).update(next_attempt_at=timezone.now())
+            self.assertEqual(send_batch(rate_per_minute=0), (0, 0, 1))
+        row.refresh_from_db()
+        self.assertEqual((row.status, row.attempts, row.last_error), ("FAILED", 2, "smtp down"))
+
+    def test_connection_failure_postpones_batch_without_raising(self):
+        row = enqueue_email("x@example.com", "s", "b")
+        with mock.patch("django.core.mail.backends.locmem.EmailBackend.open",
+                        side_effect=OSError("refused")):
+            self.assertEqual(send_batch(rate_per_minute=0), (0, 1, 0))
+        row.refresh_from_db()
+        self.assertEqual((row.status, row.attempts, row.claimed_until, row.last_error),
+                         ("PENDING", 0, None, "refused"))
+        self.assertGreater(row.next_attempt_at, timezone.now())
+
+    def test_slow_rate_limits_batch_to_what_fits_in_the_lease(self):
+        for i in range(12):
+            enqueue_email(f"u{i}@example.com", "s", "b")
+        # 분당 2통, lease 5분 → 절반(2.5분) 안에 5통
+        with mock.patch("apps.users.mailer.time.sleep"):
+            self.assertEqual(send_batch(batch_size=100, rate_per_minute=2), (5, 0, 0))
+        waiting = EmailOutbox.objects.filter(status="PENDING", claimed_until__isnull=True)
+        self.assertEqual(waiting.count(), 7)
+
+
+class ImportUsersTests(APITestCase):
+    def setUp(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.dir = Path(tmp.name)
+        User.objects.create_user(email="exists@example.com", password="pass1234!")
+
+    def _write_csv(self, name, rows):
+        path = self.dir / name
+        with path.open("w", newline="", encoding="utf-8") as f:
+            writer = csv.writer(f)
+            writer.writerow(["email", "password", "password_hash", "nickname"])
+            writer.writerows(rows)
+        return path
+
+    def test_import_dedupes_hashes_and_reports_rejects(self):
+        path = self._write_csv("users.csv", [
+            ["a@Example.com", "pw-a", "", "a"],
+            ["b@example.com", "", make_password("pw-b"), "b"],
+            ["A@example.com", "pw-dup", "", ""],      # 파일 내 중복(대소문자 무시)
+            ["Exists@example.com", "pw", "", ""],     # 기존 사용자(대소문자만 다름)
+            ["not-an-email", "pw", "", ""],
+            ["c@example.com", "", "plaintext", ""],   # 해시 형식 아님
+        ])
+        call_command("import_users", str(path), "--workers", "1", "--chunk-size", "2",
+                     stdout=StringIO())
+
+        self.assertTrue(User.objects.get(email="a@example.com").check_password("pw-a"))
+        self.assertTrue(User.objects.get(email="b@example.com").check_password("pw-b"))
+        self.assertEqual(User.objects.count(), 3)
+        with open(f"{path}.rejects.csv", encoding="utf-8") as f:
+            reasons = [row["reason"] for row in csv.DictReader(f)]
+        self.assertEqual(len(reasons), 4)
+        self.assertIn("이미 가입된 이메일", reasons)
+
+    def test_rerun_resumes_after_last_completed_chunk(self):
+        path = self._write_csv("users.csv", [[f"u{i}@example.com", "pw", "", ""] for i in range(5)])
+        (self.dir / "users.csv.checkpoint").write_text('{"chunks_done": 2}')
+        call_command("import_users", str(path), "--workers", "1", "--chunk-size", "2",
+                     stdout=StringIO())
+        emails = User.objects.filter(email__startswith="u").values_list("email", flat=True)
+        self.assertEqual(list(emails), ["u4@example.com"])
+        checkpoint = json.loads((self.dir / "users.csv.checkpoint").read_text())
+        self.assertEqual(checkpoint, {"chunks_done": 3})
+
+
+class AsymmetricJWTTests(APITestCase):
+    def setUp(self):
+        cache.clear()
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.keys_dir = tmp.name
+        self.addCleanup(setattr, state, "token_backend", state.token_backend)
+        self.addCleanup(setattr, jwt_keys, "_key_ring", None)
+        User.objects.create_user(email="rs@example.com", password="pass1234!")
+
+    def _install(self, active_kid):
+        cfg = {"ALGORITHM": "EdDSA", "DIR": self.keys_dir, "ACTIVE_KID": active_kid,
+               "JWKS_MAX_AGE": 300, "RELOAD_INTERVAL": 0}
+        with override_settings(JWT_KEYS=cfg):
+            jwt_keys.install()
+
+    def _generate(self, kid):
+        call_command("generate_jwt_key", "--algorithm", "EdDSA", "--kid", kid,
+                     "--dir", self.keys_dir, stdout=StringIO())
+
+    def _login(self):
+        credentials = {"email": "rs@example.com", "password": "pass1234!"}
+        res = self.client.post(reverse("users:login"), credentials, format="json")
+        self.assertEqual(res.status_code, 200)
+        return self.client.cookies["access_token"].value
+
+    def test_tokens_are_signed_with_active_kid_and_verifiable_from_jwks(self):
+        self._generate("k1")
+        self._install("k1")
+        access = self._login()
+        self.assertEqual(pyjwt.get_unverified_header(access)["kid"], "k1")
+
+        res = self.client.get(reverse("jwks"))
+        self.assertIn("max-age=300", res["Cache-Control"])
+        jwk = res.json()["keys"][0]
+        public_key = pyjwt.PyJWK(jwk).key
+        self.assertIn("user_id", pyjwt.decode(access, public_key, algorithms=["EdDSA"]))
+
+    def test_rotation_keeps_verifying_tokens_signed_with_previous_key(self):
+        self._generate("k1")
+        self._install("k1")
+        old_access = self._login()
+
+        self._generate("k2")
+        self._install("k2")
+        res = self.client.get(reverse("users:me"), HTTP_AUTHORIZATION=f"Bearer {old_access}")
+        self.assertEqual(res.status_code, 200)
+        self.assertEqual(pyjwt.get_unverified_header(self._login())["kid"], "k2")
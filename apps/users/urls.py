@@ -1,7 +1,7 @@
 # apps/users/urls.py
 from django.urls import path
 from .views import RegisterView, VerifyEmailView
-from .views_auth import LoginView, RefreshView, LogoutView
+from .views_auth import LoginView, RefreshView, LogoutView, LogoutAllView
 from .views_profile import MeView
 
 app_name = "users"
@@ -13,6 +13,7 @@ urlpatterns = [
     path("login/", LoginView.as_view(), name="login"),
     path("refresh/", RefreshView.as_view(), name="refresh"),
     path("logout/", LogoutView.as_view(), name="logout"),
+    path("logout-all/", LogoutAllView.as_view(), name="logout-all"),
     # 내 프로필
     path("me/", MeView.as_view(), name="me"),
 ]
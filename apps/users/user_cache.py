@@ -0,0 +1,119 @@
+# apps/users/user_cache.py
+"""
+인증 사용자 캐시 (CookieJWTAuthentication.get_user 의 users SELECT 줄이기)
+
+- 1차: 프로세스 로컬 LRU (짧은 TTL) / 2차(선택): Django cache 공유 계층(SHARED=True)
+- 저장 값은 슬림 스냅샷(dict) — 비밀번호 해시는 담지 않음
+- 스냅샷으로 만든 User 는 나머지 필드가 deferred: 접근할 때만 DB 조회, save() 는 로드된 필드만 저장
+- 프로필 수정/삭제, 이메일 인증(is_active), 어드민 수정 시 invalidate_user() 호출
+  (다른 워커의 로컬 계층은 TTL 안에 자연 만료 → TTL 을 짧게 유지)
+"""
+import threading
+import time
+from collections import OrderedDict
+from uuid import UUID
+
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.db import DEFAULT_DB_ALIAS
+
+SNAPSHOT_FIELDS = (
+    "id", "email", "nickname", "name", "phone",
+    "is_active", "is_staff", "is_superuser", "last_login", "date_joined",
+)
+SHARED_KEY = "auth:user:{}"
+
+
+def _config():
+    return settings.AUTH_USER_CACHE
+
+
+class _LocalLRU:
+    def __init__(self):
+        self._data = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        with self._lock:
+            item = self._data.get(key)
+            if item is None:
+                return None
+            expires_at, value = item
+            if expires_at < time.monotonic():
+                del self._data[key]
+                return None
+            self._data.move_to_end(key)
+            return value
+
+    def set(self, key, value, ttl, max_size):
+        with self._lock:
+            self._data[key] = (time.monotonic() + ttl, value)
+            self._data.move_to_end(key)
+            while len(self._data) > max_size:
+                self._data.popitem(last=False)
+
+    def delete(self, key):
+        with self._lock:
+            self._data.pop(key, None)
+
+    def clear(self):
+        with self._lock:
+            self._data.clear()
+
+
+_local = _LocalLRU()
+
+
+def snapshot(user):
+    return {f: getattr(user, f) for f in SNAPSHOT_FIELDS}
+
+
+def from_snapshot(data):
+    User = get_user_model()
+    # from_db 는 값이 concrete field 순서라고 가정한다
+    names = [f.attname for f in User._meta.concrete_fields if f.attname in data]
+    return User.from_db(DEFAULT_DB_ALIAS, names, [data[n] for n in names])
+
+
+def from_claims(user_id):
+    """서명된 토큰의 user_id 만으로 만든 사용자 (id 외 모든 필드 deferred)"""
+    User = get_user_model()
+    return User.from_db(DEFAULT_DB_ALIAS, ["id"], [UUID(str(user_id))])
+
+
+def get_cached_user(user_id):
+    key = str(user_id)
+    data = _local.get(key)
+    if data is None and _config().get("SHARED"):
+        data = cache.get(SHARED_KEY.format(key))
+        if data is not None:
+            _local.set(key, data, _config()["TTL"], _config()["MAX_SIZE"])
+    return from_snapshot(data) if data is not None else None
+
+
+def remember(user):
+    key = str(user.pk)
+    data = snapshot(user)
+    _local.set(key, data, _config()["TTL"], _config()["MAX_SIZE"])
+    if _config().get("SHARED"):
+        cache.set(SHARED_KEY.format(key), data, _config()["SHARED_TTL"])
+
+
+def invalidate_user(user_id):
+    key = str(user_id)
+    _local.delete(key)
+    if _config().get("SHARED"):
+        cache.delete(SHARED_KEY.format(key))
+
+
+def invalidate_users(user_ids):
+    keys = [str(pk) for pk in user_ids]
+    for key in keys:
+        _local.delete(key)
+    if _config().get("SHARED"):
+        cache.delete_many([SHARED_KEY.format(key) for key in keys])
+
+
+def clear():
+    _local.clear()
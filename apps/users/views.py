@@ -1,22 +1,29 @@
 from django.contrib.auth import get_user_model
+from django.db import transaction
 from django.utils.encoding import force_str
 from django.utils.http import urlsafe_base64_decode
 from rest_framework import permissions, status
 from rest_framework.response import Response
 from rest_framework.views import APIView
+from config.throttling import RegisterThrottle, shed_load
 from .serializers import RegisterSerializer
 from .tokens import email_verification_token
+from .user_cache import invalidate_user
 
 User = get_user_model()
 
 class RegisterView(APIView):
     permission_classes = [permissions.AllowAny]
+    throttle_classes = [RegisterThrottle]
 
+    @shed_load("register")
     def post(self, request):
         s = RegisterSerializer(data=request.data)
         s.is_valid(raise_exception=True)
-        user = s.save()
-        s.send_verification_email(user, request)
+        # 사용자 + 인증 메일 큐를 한 트랜잭션으로 (SMTP 는 워커가 비동기 발송)
+        with transaction.atomic():
+            user = s.save()
+            s.queue_verification_email(user, request)
         return Response({"detail": "회원가입 완료. 이메일 인증 링크를 확인하세요."}, status=status.HTTP_201_CREATED)
 
 class VerifyEmailView(APIView):
@@ -32,9 +39,12 @@ class VerifyEmailView(APIView):
             user = User.objects.get(pk=uid)
         except Exception:
             return Response({"detail": "유효하지 않은 uid"}, status=400)
+        if user.deleted_at is not None:
+            return Response({"detail": "탈퇴 처리 중인 계정입니다."}, status=400)
         if email_verification_token.check_token(user, token):
             if not user.is_active:
                 user.is_active = True
                 user.save(update_fields=["is_active"])
+                invalidate_user(user.pk)
             return Response({"detail": "이메일 인증이 완료되었습니다."}, status=200)
         return Response({"detail": "토큰이 유효하지 않거나 만료되었습니다."}, status=400)
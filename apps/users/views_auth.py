@@ -7,7 +7,9 @@ from rest_framework import status, permissions
 
 from rest_framework_simplejwt.tokens import RefreshToken
 from rest_framework_simplejwt.exceptions import InvalidToken, TokenError
-from rest_framework_simplejwt.token_blacklist.models import BlacklistedToken, OutstandingToken
+
+from config.throttling import LoginThrottle, RefreshThrottle, shed_load
+from .revocation import FastRefreshToken, revoke, revoke_users
 
 # drf-spectacular (Swagger 문서에 입력 폼/응답 스키마가 보이도록)
 from drf_spectacular.utils import (
@@ -103,7 +105,9 @@ def _clear_token_cookies(response):
 )
 class LoginView(APIView):
     permission_classes = [permissions.AllowAny]
+    throttle_classes = [LoginThrottle]
 
+    @shed_load("login")  # 비밀번호 해시(PBKDF2) 전에 동시 실행 수 제한
     def post(self, request):
         email = request.data.get("email")
         password = request.data.get("password")
@@ -167,6 +171,7 @@ class LoginView(APIView):
 )
 class RefreshView(APIView):
     permission_classes = [permissions.AllowAny]
+    throttle_classes = [RefreshThrottle]
 
     def post(self, request):
         cfg = settings.JWT_AUTH
@@ -175,26 +180,20 @@ class RefreshView(APIView):
             return Response({"detail": "리프레시 토큰이 없습니다."}, status=400)
 
         try:
-            # 기존 refresh 파싱
-            old_refresh = RefreshToken(token_str)
+            # 기존 refresh 파싱 (블랙리스트 확인은 로컬/캐시 우선, DB는 진실 원천)
+            old_refresh = FastRefreshToken(token_str)
             user_id = old_refresh["user_id"]
             user = User.objects.get(id=user_id)
 
             # 새 refresh 발급(회전 시나리오)
-            new_refresh = RefreshToken.for_user(user)
+            new_refresh = FastRefreshToken.for_user(user)
 
-            # 회전 설정 + 블랙리스트 앱이 있으면 이전 refresh를 블랙리스트 등록
+            # 회전 설정 + 블랙리스트 앱이 있으면 이전 refresh를 블랙리스트 등록 (한 문장, 멱등)
             if (
                 settings.SIMPLE_JWT.get("BLACKLIST_AFTER_ROTATION")
                 and "rest_framework_simplejwt.token_blacklist" in settings.INSTALLED_APPS
             ):
-                try:
-                    jti = old_refresh["jti"]
-                    ot = OutstandingToken.objects.get(jti=jti)
-                    BlacklistedToken.objects.get_or_create(token=ot)
-                except OutstandingToken.DoesNotExist:
-                    # 이미 만료/회수됐을 수 있음 → 무시
-                    pass
+                revoke(old_refresh)
 
         except (TokenError, InvalidToken) as e:
             return Response({"detail": f"유효하지 않은 토큰: {e}"}, status=401)
@@ -231,20 +230,43 @@ class LogoutView(APIView):
         # 2) 블랙리스트 활성화되어 있으면 현재 refresh를 블랙리스트에 추가
         if "rest_framework_simplejwt.token_blacklist" in settings.INSTALLED_APPS and raw_refresh:
             try:
-                refresh = RefreshToken(raw_refresh)
-                jti = refresh["jti"]
-                ot = OutstandingToken.objects.get(jti=jti)
-                BlacklistedToken.objects.get_or_create(token=ot)
-            except (OutstandingToken.DoesNotExist, TokenError, InvalidToken):
+                revoke(FastRefreshToken(raw_refresh))
+            except (TokenError, InvalidToken):
                 # 이미 만료/회수/형식 오류 → 무시하고 진행
                 pass
 
-        # (선택) 이 사용자의 다른 모든 refresh도 무효화하려면 주석 해제
-        # if "rest_framework_simplejwt.token_blacklist" in settings.INSTALLED_APPS:
-        #     for t in OutstandingToken.objects.filter(user=request.user):
-        #         BlacklistedToken.objects.get_or_create(token=t)
+        # (다른 기기 세션까지 모두 끊으려면 LogoutAllView 사용)
 
         # 3) 쿠키 삭제
         resp = Response({"detail": "로그아웃 완료"}, status=status.HTTP_200_OK)
         _clear_token_cookies(resp)
         return resp
+
+
+# ---------- 모든 기기 로그아웃 ----------
+@extend_schema(
+    summary="모든 기기에서 로그아웃",
+    description=(
+        "이 사용자의 만료 전 refresh 토큰을 한 번에 블랙리스트에 등록하고, "
+        "access/refresh 쿠키를 제거합니다."
+    ),
+    request=None,
+    responses={
+        200: OpenApiResponse(
+            response=inline_serializer(
+                name="LogoutAllResponse",
+                fields={"detail": serializers.CharField(), "revoked": serializers.IntegerField()},
+            )
+        )
+    },
+)
+class LogoutAllView(APIView):
+    permission_classes = [permissions.IsAuthenticated]
+
+    def post(self, request):
+        revoked = revoke_users(User.objects.filter(pk=request.user.pk))
+        resp = Response(
+            {"detail": "모든 기기에서 로그아웃 완료", "revoked": revoked}, status=status.HTTP_200_OK
+        )
+        _clear_token_cookies(resp)
+        return resp
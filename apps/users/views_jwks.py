@@ -0,0 +1,32 @@
+# apps/users/views_jwks.py
+from django.conf import settings
+from django.http import Http404
+from django.utils.cache import patch_cache_control
+from drf_spectacular.utils import OpenApiResponse, extend_schema
+from rest_framework import permissions
+from rest_framework.response import Response
+from rest_framework.views import APIView
+
+from .jwt_keys import get_key_ring
+
+
+@extend_schema(
+    summary="JWT 공개키 (JWKS)",
+    description=(
+        "access/refresh 토큰 검증용 공개키 목록. 토큰 헤더의 kid 로 키를 고릅니다. "
+        "(RS256/EdDSA 모드에서만)"
+    ),
+    responses={200: OpenApiResponse(description='{"keys": [...]}')},
+)
+class JWKSView(APIView):
+    permission_classes = [permissions.AllowAny]
+    authentication_classes = []
+    throttle_classes = []
+
+    def get(self, request):
+        key_ring = get_key_ring()
+        if key_ring is None:
+            raise Http404
+        resp = Response(key_ring.jwks())
+        patch_cache_control(resp, public=True, max_age=settings.JWT_KEYS["JWKS_MAX_AGE"])
+        return resp
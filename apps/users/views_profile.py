@@ -2,8 +2,17 @@
 from rest_framework import permissions, status
 from rest_framework.response import Response
 from rest_framework.views import APIView
+from django.contrib.auth import get_user_model
 
+from apps.banking.purge import schedule_user_purge
+
+from .revocation import revoke_users
 from .serializers_profile import UserProfileSerializer
+from .user_cache import invalidate_user
+from .views_auth import _clear_token_cookies
+
+User = get_user_model()
+
 
 class MeView(APIView):
     permission_classes = [permissions.IsAuthenticated]
@@ -25,6 +34,7 @@ class MeView(APIView):
         serializer = UserProfileSerializer(user, data=request.data, partial=False)
         serializer.is_valid(raise_exception=True)
         serializer.save()
+        invalidate_user(user.pk)
         return Response(serializer.data, status=status.HTTP_200_OK)
 
     def patch(self, request):
@@ -35,9 +45,20 @@ class MeView(APIView):
         serializer = UserProfileSerializer(user, data=request.data, partial=True)
         serializer.is_valid(raise_exception=True)
         serializer.save()
+        invalidate_user(user.pk)
         return Response(serializer.data, status=status.HTTP_200_OK)
 
     def delete(self, request):
+        """
+        DELETE: 탈퇴 요청. 계정은 즉시 비활성(+토큰 회수)되고 202 반환.
+        계좌/거래내역 등은 purge_deleted 워커가 배치로 삭제
+        """
         user = self.get_object(request)
-        user.delete()
-        return Response({"detail": "Deleted successfully"}, status=status.HTTP_200_OK)
+        job = schedule_user_purge(user)
+        revoke_users(User.objects.filter(pk=user.pk))   # 인증 사용자 캐시도 함께 무효화
+        resp = Response(
+            {"detail": "탈퇴 요청이 접수되었습니다.", "job_id": str(job.id)},
+            status=status.HTTP_202_ACCEPTED,
+        )
+        _clear_token_cookies(resp)
+        return resp
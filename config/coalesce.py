@@ -0,0 +1,193 @@
+# config/coalesce.py
+"""
+같은 조회 요청 합치기 (single-flight)
+
+- 키: (이름, 사용자, 호스트, 경로, 정렬한 쿼리스트링) → 같은 사용자의 같은 조회만 합침
+- 프로세스 안: 먼저 온 요청(leader)만 실행, 실행 중에 같은 키로 온 요청(follower)은 기다렸다가
+  leader 의 응답 데이터(200 일 때만)를 그대로 받음 → 응답 헤더 X-Coalesced: 1
+- 프로세스 간(REQUEST_COALESCING["CROSS_PROCESS"]): leader 가 CACHES["default"] 에 잠금(cache.add),
+  다른 워커의 follower 는 잠금 토큰의 결과 키를 POLL 간격으로 확인 (sync 워커 여러 개인 gunicorn 등)
+- follower 가 WAIT 안에 결과를 못 받거나 leader 가 실패/200 이 아니면 각자 실행 (fallback)
+- 완료된 결과는 남기지 않음: 실행 중인 leader 가 없으면 항상 새로 계산 (캐시가 아님)
+- 복제본 고정 쿠키(db_pin, 방금 쓴 요청)가 있으면 합치지 않음: 쓰기 전에 시작했거나 복제본에서 읽은
+  leader 의 결과를 받으면 read-your-writes 가 깨지므로 직접 primary 에서 읽음
+- 지표: stats() → {(이름, "leader"|"coalesced"|"timeout"|"fallback"): 건수} (프로세스별)
+"""
+import hashlib
+import json
+import math
+import threading
+import time
+import uuid
+from collections import Counter
+from functools import wraps
+
+from django.conf import settings
+from django.core.cache import cache
+from rest_framework.response import Response
+
+from config.db_router import pin_settings
+
+KEY_PREFIX = "coalesce:"
+
+_flights = {}
+_flights_lock = threading.Lock()
+_stats = Counter()
+_stats_lock = threading.Lock()
+
+
+def coalesce_settings():
+    return {
+        "ENABLED": True,
+        "WAIT": 2.0,
+        "CROSS_PROCESS": False,
+        "POLL": 0.02,
+        **getattr(settings, "REQUEST_COALESCING", {}),
+    }
+
+
+def stats():
+    with _stats_lock:
+        return dict(_stats)
+
+
+def reset_stats():
+    with _stats_lock:
+        _stats.clear()
+
+
+def _count(name, outcome):
+    with _stats_lock:
+        _stats[(name, outcome)] += 1
+
+
+class _Flight:
+    def __init__(self):
+        self.done = threading.Event()
+        self.result = None   # (data, status) — 공유 가능한 응답일 때만
+
+
+def request_key(name, request):
+    user = getattr(request, "user", None)
+    query = sorted((k, request.query_params.getlist(k)) for k in request.query_params)
+    raw = json.dumps([name, str(getattr(user, "pk", "")), request.get_host(), request.path, query])
+    return hashlib.sha256(raw.encode()).hexdigest()[:32]
+
+
+def _shareable(response):
+    streaming = getattr(response, "streaming", False)
+    if response.status_code != 200 or streaming or not hasattr(response, "data"):
+        return None
+    return response.data, response.status_code
+
+
+def _replay(result):
+    data, status = result
+    response = Response(data, status=status)
+    response["X-Coalesced"] = "1"
+    return response
+
+
+def single_flight(name, key, compute):
+    """
+    compute() 는 DRF Response 를 반환하는 조회
+    (leader 일 때만 실행, fallback 시 follower 도 실행)
+    """
+    cfg = coalesce_settings()
+    with _flights_lock:
+        flight = _flights.get(key)
+        leader = flight is None
+        if leader:
+            flight = _flights[key] = _Flight()
+
+    if not leader:
+        if not flight.done.wait(cfg["WAIT"]):
+            _count(name, "timeout")
+            return compute()
+        if flight.result is None:
+            _count(name, "fallback")
+            return compute()
+        _count(name, "coalesced")
+        return _replay(flight.result)
+
+    try:
+        response = _lead_across_processes(name, key, compute, cfg) if cfg["CROSS_PROCESS"] else None
+        if response is None:
+            _count(name, "leader")
+            response = compute()
+        flight.result = _shareable(response)
+        return response
+    finally:
+        with _flights_lock:
+            _flights.pop(key, None)
+        flight.done.set()
+
+
+def _lead_across_processes(name, key, compute, cfg):
+    """
+    다른 워커의 실행 결과를 받았거나 직접 실행했으면 그 응답,
+    잠금을 못 다루면(캐시 장애 등) None
+    """
+    lock_key = f"{KEY_PREFIX}lock:{key}"
+    hold = math.ceil(cfg["WAIT"]) + 1
+    token = uuid.uuid4().hex
+    try:
+        acquired = cache.add(lock_key, token, timeout=hold)
+        other = None if acquired else cache.get(lock_key)
+    except Exception:
+        return None
+
+    if acquired:
+        try:
+            _count(name, "leader")
+            response = compute()
+            result = _shareable(response)
+            if result is not None:
+                cache.set(f"{KEY_PREFIX}result:{token}", result, timeout=hold)
+            return response
+        finally:
+            if cache.get(lock_key) == token:
+                cache.delete(lock_key)
+    if other is None:   # 그 사이 끝남
+        return None
+
+    result_key = f"{KEY_PREFIX}result:{other}"
+    deadline = time.monotonic() + cfg["WAIT"]
+    while time.monotonic() < deadline:
+        result = cache.get(result_key)
+        if result is not None:
+            _count(name, "coalesced")
+            return _replay(result)
+        if cache.get(lock_key) != other:   # leader 가 결과 없이 끝남 (실패 / 200 아님)
+            break
+        time.sleep(cfg["POLL"])
+    else:
+        _count(name, "timeout")
+        return compute()
+    result = cache.get(result_key)
+    if result is not None:
+        _count(name, "coalesced")
+        return _replay(result)
+    _count(name, "fallback")
+    return compute()
+
+
+def coalesce(name):
+    """
+    뷰 메서드 데코레이터 (GET/HEAD 만)
+    인증/권한/샤드 컨텍스트는 요청마다 그대로 거친 뒤 본문만 합친다.
+    """
+    def decorator(method):
+        @wraps(method)
+        def wrapper(self, request, *args, **kwargs):
+            if (
+                request.method not in ("GET", "HEAD")
+                or not coalesce_settings()["ENABLED"]
+                or pin_settings()[0] in request.COOKIES
+            ):
+                return method(self, request, *args, **kwargs)
+            return single_flight(
+                name, request_key(name, request), lambda: method(self, request, *args, **kwargs)
+            )
+        return wrapper
+    return decorator
@@ -0,0 +1,108 @@
+# config/db_router.py
+"""
+Primary / Replica DB 라우팅
+
+- 안전한 요청(GET/HEAD)의 ORM 읽기만 복제본(DB_READ_REPLICAS)으로 보낸다.
+- 쓰기, select_for_update(잠금 읽기), atomic 블록 내부 읽기는 항상 primary(default).
+- 쓰기 요청 직후 일정 시간(DB_REPLICA_PIN["SECONDS"]) 동안은 쿠키로 primary에 고정
+  → 방금 입금한 거래가 복제 지연 때문에 목록에서 안 보이는 문제 방지(read-your-writes)
+"""
+import random
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+from django.conf import settings
+from django.db import DEFAULT_DB_ALIAS, connections
+
+SAFE_READ_METHODS = ("GET", "HEAD")
+WRITE_METHODS = ("POST", "PUT", "PATCH", "DELETE")
+
+# 현재 요청(또는 코드 블록)이 복제본 읽기를 허용하는지 여부
+_replica_reads: ContextVar[bool] = ContextVar("db_replica_reads", default=False)
+
+
+def replica_aliases():
+    return list(getattr(settings, "DB_READ_REPLICAS", []))
+
+
+def pin_settings():
+    cfg = getattr(settings, "DB_REPLICA_PIN", {})
+    return cfg.get("COOKIE_NAME", "db_pin"), int(cfg.get("SECONDS", 5))
+
+
+@contextmanager
+def replica_reads(enabled: bool = True):
+    """with 블록 동안 복제본 읽기 허용/금지 (관리 커맨드·테스트에서 직접 사용 가능)"""
+    token = _replica_reads.set(enabled)
+    try:
+        yield
+    finally:
+        _replica_reads.reset(token)
+
+
+class PrimaryReplicaRouter:
+    """
+    DATABASE_ROUTERS 용 라우터.
+    복제본이 설정되지 않았거나 읽기 허용 컨텍스트가 아니면 None을 돌려 기본 동작(default)을 따른다.
+    """
+
+    def db_for_read(self, model, **hints):
+        if not _replica_reads.get():
+            return None
+        # 트랜잭션 안의 읽기는 같은 스냅샷을 봐야 하므로 primary
+        if connections[DEFAULT_DB_ALIAS].in_atomic_block:
+            return None
+        replicas = replica_aliases()
+        if not replicas:
+            return None
+        return random.choice(replicas)
+
+    def db_for_write(self, model, **hints):
+        # 쓰기/잠금 읽기는 항상 primary
+        return DEFAULT_DB_ALIAS
+
+    def allow_relation(self, obj1, obj2, **hints):
+        pool = {DEFAULT_DB_ALIAS, *replica_aliases()}
+        if obj1._state.db in pool and obj2._state.db in pool:
+            return True
+        return None
+
+    def allow_migrate(self, db, app_label, model_name=None, **hints):
+        # 복제본은 물리 복제로 스키마를 받으므로 직접 migrate 하지 않음
+        if db in replica_aliases():
+            return False
+        return None
+
+
+class ReplicaRoutingMiddleware:
+    """
+    요청 단위로 복제본 읽기 여부를 결정한다.
+    - GET/HEAD + 고정 쿠키 없음 → 복제본 읽기
+    - 그 외 메서드(쓰기) → 응답에 고정 쿠키를 심어 이후 읽기를 잠시 primary로
+    """
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        cookie_name, pin_seconds = pin_settings()
+        use_replica = (
+            request.method in SAFE_READ_METHODS
+            and cookie_name not in request.COOKIES
+            and bool(replica_aliases())
+        )
+
+        with replica_reads(use_replica):
+            response = self.get_response(request)
+
+        if request.method in WRITE_METHODS and pin_seconds > 0 and replica_aliases():
+            response.set_cookie(
+                cookie_name,
+                "1",
+                max_age=pin_seconds,
+                httponly=True,
+                samesite=settings.JWT_AUTH["COOKIE_SAMESITE"],
+                secure=settings.JWT_AUTH["COOKIE_SECURE"],
+                domain=settings.JWT_AUTH["COOKIE_DOMAIN"],
+            )
+        return response
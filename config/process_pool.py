@@ -0,0 +1,33 @@
+# config/process_pool.py
+"""
+관리 커맨드용 워커 프로세스 풀
+
+- spawn 컨텍스트: 부모의 DB 커넥션/스레드를 물려받지 않음(fork 후 커넥션 공유 문제 방지)
+- 각 워커는 시작 시 django.setup() 으로 자체 커넥션을 연다
+- workers <= 1 이면 풀 없이 현재 프로세스에서 바로 실행(테스트/디버깅용)
+"""
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import contextmanager
+
+import django
+
+
+class _InlineExecutor:
+    """ProcessPoolExecutor.map 과 같은 모양의 동기 실행기"""
+
+    def map(self, fn, *iterables, chunksize=1):
+        return map(fn, *iterables)
+
+
+@contextmanager
+def worker_pool(workers: int):
+    if workers <= 1:
+        yield _InlineExecutor()
+        return
+    with ProcessPoolExecutor(
+        max_workers=workers,
+        mp_context=multiprocessing.get_context("spawn"),
+        initializer=django.setup,
+    ) as pool:
+        yield pool
@@ -16,6 +16,20 @@ STATIC_URL = "/static/"
 STATICFILES_DIRS = [BASE_DIR / "static"]
 MEDIA_URL = "/media/"
 MEDIA_ROOT = BASE_DIR / "media"
+STORAGES = {
+    "default": {"BACKEND": "django.core.files.storage.FileSystemStorage"},
+    "staticfiles": {"BACKEND": "django.contrib.staticfiles.storage.StaticFilesStorage"},
+    # 오래된 거래내역 보관 파일 (S3 호환 스토리지를 쓰려면 BACKEND/OPTIONS 만 교체)
+    "archive": {
+        "BACKEND": "django.core.files.storage.FileSystemStorage",
+        "OPTIONS": {"location": env("TRANSACTION_ARCHIVE_DIR", default=str(BASE_DIR / "archive"))},
+    },
+    # 월별 거래명세서 파일 (한 번 만들면 바뀌지 않음)
+    "statements": {
+        "BACKEND": "django.core.files.storage.FileSystemStorage",
+        "OPTIONS": {"location": env("STATEMENTS_DIR", default=str(BASE_DIR / "statements"))},
+    },
+}
 
 SECRET_KEY = env("DJANGO_SECRET_KEY", default="dev-change-me")
 
@@ -50,6 +64,7 @@ MIDDLEWARE = [
     "django.middleware.common.CommonMiddleware",
     "django.middleware.csrf.CsrfViewMiddleware",
     "django.contrib.auth.middleware.AuthenticationMiddleware",
+    "config.db_router.ReplicaRoutingMiddleware",
     "django.contrib.messages.middleware.MessageMiddleware",
     "django.middleware.clickjacking.XFrameOptionsMiddleware",
 ]
@@ -83,6 +98,34 @@ REST_FRAMEWORK = {
     "DEFAULT_AUTHENTICATION_CLASSES": [
         "apps.users.auth.CookieJWTAuthentication",
     ],
+    # config/throttling.py 의 스코프별 비율 (슬라이딩 윈도우, CACHES["default"] 사용)
+    "DEFAULT_THROTTLE_RATES": {
+        "login_ip": env("THROTTLE_LOGIN_IP", default="20/min"),
+        "login_email": env("THROTTLE_LOGIN_EMAIL", default="5/min"),
+        "register_ip": env("THROTTLE_REGISTER_IP", default="10/hour"),
+        "register_email": env("THROTTLE_REGISTER_EMAIL", default="3/hour"),
+        "refresh_ip": env("THROTTLE_REFRESH_IP", default="60/min"),
+        "transaction_create_user": env("THROTTLE_TXN_CREATE_USER", default="60/min"),
+        "transaction_create_ip": env("THROTTLE_TXN_CREATE_IP", default="300/min"),
+    },
+}
+# 프로세스(워커)당 동시 실행 상한: 초과 시 503 + Retry-After (config/throttling.shed_load)
+LOAD_SHEDDING = {
+    "LIMITS": {
+        "login": env.int("SHED_LOGIN_CONCURRENCY", default=4),
+        "register": env.int("SHED_REGISTER_CONCURRENCY", default=4),
+        "transaction_create": env.int("SHED_TXN_CREATE_CONCURRENCY", default=16),
+    },
+    "RETRY_AFTER": 2,
+}
+# 같은 사용자의 동일 조회 동시 요청은 한 번만 실행하고 결과 공유 (config/coalesce.py)
+# CROSS_PROCESS: CACHES["default"](Redis 등 공유 캐시) 잠금으로 워커 간에도 합침
+REQUEST_COALESCING = {
+    "ENABLED": env.bool("REQUEST_COALESCING_ENABLED", default=True),
+    # 초: follower 최대 대기 → 넘으면 각자 실행
+    "WAIT": env.float("REQUEST_COALESCING_WAIT", default=2.0),
+    "CROSS_PROCESS": env.bool("REQUEST_COALESCING_CROSS_PROCESS", default=False),
+    "POLL": 0.02,
 }
 SPECTACULAR_SETTINGS = {
     "TITLE": "Django Mini Project API",
@@ -101,10 +144,49 @@ DATABASES = {
     }
 }
 
+# (5-1) 읽기 복제본(Replica): 쉼표 구분 호스트 목록이 있을 때만 replica_1, replica_2 ... 추가
+#   - GET/HEAD 읽기만 복제본으로, 쓰기/잠금은 primary (config/db_router.py)
+#   - 쓰기 직후 DB_REPLICA_PIN["SECONDS"] 동안은 쿠키로 primary 고정(read-your-writes)
+REPLICA_DATABASES = {
+    f"replica_{i}": {
+        **DATABASES["default"],
+        "HOST": host,
+        "PORT": env("POSTGRES_REPLICA_PORT", default=DATABASES["default"]["PORT"]),
+        "TEST": {"MIRROR": "default"},
+    }
+    for i, host in enumerate(env.list("POSTGRES_REPLICA_HOSTS", default=[]), start=1)
+}
+DATABASES.update(REPLICA_DATABASES)
+DATABASE_ROUTERS = ["config.sharding.ShardRouter", "config.db_router.PrimaryReplicaRouter"]
+DB_READ_REPLICAS = list(REPLICA_DATABASES)
+
+# (5-2) 원장 샤드: 쉼표 구분 호스트 목록이 있을 때만 shard_1, shard_2 ... 추가 (config/sharding.py)
+#   - LEDGER_SHARDS: 해시 링에 참여하는 alias.
+#     새 샤드는 먼저 DB 만 추가 → migrate → move_user_shard 로 옮긴 뒤 링에 넣는다
+#   - 이동된 사용자는 user_shards 테이블(default)에 기록, 프로세스별 SHARD_DIRECTORY_TTL 초 캐시
+LEDGER_SHARD_DATABASES = {
+    f"shard_{i}": {**DATABASES["default"], "HOST": host}
+    for i, host in enumerate(env.list("POSTGRES_SHARD_HOSTS", default=[]), start=1)
+}
+DATABASES.update(LEDGER_SHARD_DATABASES)
+LEDGER_SHARDS = env.list("LEDGER_SHARDS", default=["default"])
+SHARD_DIRECTORY_TTL = env.int("SHARD_DIRECTORY_TTL", default=30)
+DB_REPLICA_PIN = {
+    "COOKIE_NAME": "db_pin",
+    "SECONDS": env.int("DB_REPLICA_PIN_SECONDS", default=5),
+}
+
 # (6) 이메일 (개발은 콘솔 출력)
 EMAIL_BACKEND = env("EMAIL_BACKEND", default="django.core.mail.backends.console.EmailBackend")
 DEFAULT_FROM_EMAIL = env("DEFAULT_FROM_EMAIL", default="noreply@example.com")
 # (실서버 SMTP 쓸 땐 .env에 넣고 주석 해제)
+# 메일 발송 큐 (apps/users/mailer.py, `manage.py send_queued_emails --loop`)
+EMAIL_OUTBOX = {
+    "RATE_PER_MINUTE": env.int("EMAIL_RATE_PER_MINUTE", default=600),   # 0 = 제한 없음
+    "MAX_ATTEMPTS": env.int("EMAIL_MAX_ATTEMPTS", default=5),
+    "RETRY_BACKOFF": env.int("EMAIL_RETRY_BACKOFF", default=60),        # 초, 시도마다 2배
+}
+
 # EMAIL_HOST = env("EMAIL_HOST", default=None)
 # EMAIL_PORT = env.int("EMAIL_PORT", default=587)
 # EMAIL_HOST_USER = env("EMAIL_HOST_USER", default=None)
@@ -121,6 +203,17 @@ SIMPLE_JWT = {
     "AUTH_HEADER_TYPES": ("Bearer",),
 }
 
+# 비대칭 서명 (apps/users/jwt_keys.py)
+# ALGORITHM 이 HS* 가 아니면 SIMPLE_JWT 서명 키 대신 키 링 사용
+# DIR: <kid>.pem(개인키) / <kid>.pub.pem(공개키만, 교체된 이전 키) 파일 위치
+JWT_KEYS = {
+    "ALGORITHM": env("JWT_ALGORITHM", default="HS256"),   # "RS256" | "EdDSA"
+    "DIR": env("JWT_KEYS_DIR", default=None),
+    "ACTIVE_KID": env("JWT_ACTIVE_KID", default=None),
+    "JWKS_MAX_AGE": env.int("JWT_JWKS_MAX_AGE", default=300),
+    "RELOAD_INTERVAL": 30,   # 모르는 kid 가 오면 최대 이 간격(초)으로 디렉터리 재로드
+}
+
 # 쿠키 관련 공통 상수 (뷰에서 사용)
 JWT_AUTH = {
     "ACCESS_COOKIE_NAME": "access_token",
@@ -131,3 +224,66 @@ JWT_AUTH = {
     "ACCESS_COOKIE_PATH": "/",
     "REFRESH_COOKIE_PATH": "/api/auth/refresh/",
 }
+
+# (7) 뱅킹
+# 비동기 거래 접수: POST /api/transactions/ → 202 + 핸들, 반영은 `manage.py apply_postings --loop`
+BANKING_ASYNC_POSTINGS = env.bool("BANKING_ASYNC_POSTINGS", default=False)
+# 거래내역 보관: AFTER_DAYS 보다 오래된 "끝난 달"을 STORAGES[STORAGE] 로
+# (`manage.py archive_transactions`)
+TRANSACTION_ARCHIVE = {
+    "STORAGE": "archive",
+    "AFTER_DAYS": env.int("TRANSACTION_ARCHIVE_AFTER_DAYS", default=365),
+}
+# 월별 거래명세서: 매월 초 `manage.py generate_statements --workers N`
+STATEMENTS = {"STORAGE": "statements"}
+# 금액 저장 방식: decimal → dual(+backfill_minor_units) → minor (apps/banking/money.py)
+MONEY_STORAGE = {"MODE": env("MONEY_STORAGE_MODE", default="decimal")}
+# 출금 한도 (거래타입별, None: 무제한) — DAILY: 하루 누적, PER_TRANSACTION: 1회
+# 누적은 account_daily_withdrawals 카운터로 검사 (`manage.py rebuild_withdrawal_counters` 로 재계산)
+WITHDRAWAL_LIMITS = {
+    "CASH": {   # ATM 현금 인출
+        "DAILY": env("WITHDRAWAL_LIMIT_CASH_DAILY", default=None),
+        "PER_TRANSACTION": env("WITHDRAWAL_LIMIT_CASH_PER_TRANSACTION", default=None),
+    },
+    "CARD": {
+        "DAILY": env("WITHDRAWAL_LIMIT_CARD_DAILY", default=None),
+        "PER_TRANSACTION": env("WITHDRAWAL_LIMIT_CARD_PER_TRANSACTION", default=None),
+    },
+}
+# 실시간 이벤트 SSE (GET /api/events/, ASGI 서버 필요 — apps/banking/live.py)
+LIVE_EVENTS = {
+    "HEARTBEAT": env.int("LIVE_EVENTS_HEARTBEAT", default=15),    # 초: 주석 줄 + 누락 대비 재조회
+    # 초: 연결 유지 상한 (클라이언트가 이어서 재접속)
+    "MAX_AGE": env.int("LIVE_EVENTS_MAX_AGE", default=300),
+    "RETRY_MS": 3000,
+    # 다른 프로세스 커밋 감지 주기 (0: 끔)
+    "POLL_INTERVAL": env.float("LIVE_EVENTS_POLL_INTERVAL", default=1.0),
+}
+
+# (8) 캐시 / 인증 사용자 캐시
+CACHES = {"default": env.cache("CACHE_URL", default="locmemcache://")}
+
+# CookieJWTAuthentication.get_user 결과 캐시 (apps/users/user_cache.py)
+# - TTL: 프로세스 로컬 LRU 유지 시간(초). 다른 워커의 무효화는 이 시간 안에 반영
+# - SHARED: CACHES["default"](Redis 등)를 2차 계층으로 공유
+# - TRUST_CLAIMS_FOR_READS: trust_token_claims=True 뷰의 GET/HEAD 는 토큰 user_id 만 신뢰(조회 없음)
+AUTH_USER_CACHE = {
+    "ENABLED": env.bool("AUTH_USER_CACHE_ENABLED", default=True),
+    "TTL": env.int("AUTH_USER_CACHE_TTL", default=10),
+    "MAX_SIZE": 10_000,
+    "SHARED": env.bool("AUTH_USER_CACHE_SHARED", default=False),
+    "SHARED_TTL": env.int("AUTH_USER_CACHE_SHARED_TTL", default=300),
+    "TRUST_CLAIMS_FOR_READS": env.bool("AUTH_TRUST_CLAIMS_FOR_READS", default=False),
+}
+
+# JWT refresh 회수 확인 캐시 (apps/users/revocation.py) — DB 블랙리스트가 진실 원천
+# 공유 캐시를 쓰는 경우 회수 키가 축출되지 않도록 충분한 메모리(또는 noeviction) 권장
+# 공유 캐시일 때만 `manage.py warm_token_revocations`(WARM_TTL 보다 짧은 주기) 후 DB 확인 생략
+# SHARED_CACHE: None 이면 CACHES["default"] 백엔드로 판단 (locmem/dummy → 공유 아님)
+# 만료 토큰 정리: `manage.py prune_tokens` 를 주기 실행
+JWT_REVOCATION = {
+    "CACHE_PREFIX": "jwt:revoked:",
+    "WARM_TTL": env.int("JWT_REVOCATION_WARM_TTL", default=3600),
+    "LOCAL_MAX": 100_000,
+    "SHARED_CACHE": None,
+}
@@ -23,6 +23,13 @@ if os.getenv("POSTGRES_DB"):
             "PORT": os.getenv("POSTGRES_PORT", "5432"),
         }
     }
+    # 복제본(dev.py에서 POSTGRES_REPLICA_HOSTS로 구성)은 유지
+    DATABASES.update(REPLICA_DATABASES)
+    # 원장 샤드(POSTGRES_SHARD_HOSTS)도 운영 접속 정보로 다시 구성
+    DATABASES.update({
+        alias: {**DATABASES["default"], "HOST": cfg["HOST"]}
+        for alias, cfg in LEDGER_SHARD_DATABASES.items()
+    })
 
 # 보안 권장값
 SECURE_PROXY_SSL_HEADER = ("HTTP_X_FORWARDED_PROTO", "https")
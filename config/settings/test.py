@@ -0,0 +1,36 @@
+# config/settings/test.py
+# 로컬 테스트용: PostgreSQL 없이 SQLite 여러 개(primary + replica + 원장 샤드 2개)로 라우팅까지 확인
+#   python -m pytest   (pyproject 의 DJANGO_SETTINGS_MODULE 기본값)
+#   PostgreSQL 로 돌리려면 --ds=config.settings.dev
+from .dev import *  # noqa
+
+# 워커 프로세스 여러 개가 동시에 쓸 때 "database is locked" 대신 잠금 대기
+SQLITE_OPTIONS = {"transaction_mode": "IMMEDIATE", "timeout": 20}
+
+DATABASES = {
+    "default": {
+        "ENGINE": "django.db.backends.sqlite3",
+        "NAME": BASE_DIR / "db.sqlite3",
+        "OPTIONS": SQLITE_OPTIONS,
+    },
+    "replica": {
+        "ENGINE": "django.db.backends.sqlite3",
+        "NAME": BASE_DIR / "db_replica.sqlite3",
+        "OPTIONS": SQLITE_OPTIONS,
+        "TEST": {"MIRROR": "default"},
+    },
+}
+DB_READ_REPLICAS = ["replica"]
+
+# 원장 샤드 2개 (링에는 넣지 않음 → 기본은 샤딩 꺼짐)
+# 샤딩 테스트에서만 override_settings(LEDGER_SHARDS=...)
+for _alias in ("shard_1", "shard_2"):
+    DATABASES[_alias] = {
+        "ENGINE": "django.db.backends.sqlite3",
+        "NAME": BASE_DIR / f"db_{_alias}.sqlite3",
+        "OPTIONS": SQLITE_OPTIONS,
+    }
+LEDGER_SHARD_DATABASES = ["shard_1", "shard_2"]
+LEDGER_SHARDS = ["default"]
+
+PASSWORD_HASHERS = ["django.contrib.auth.hashers.MD5PasswordHasher"]
@@ -0,0 +1,159 @@
+# config/sharding.py
+"""
+원장(ledger) 데이터 수평 샤딩 — 샤드 키는 사용자 id
+
+- LEDGER_SHARDS: 해시 링에 참여하는 DB alias 목록 (기본 ["default"] → 샤딩 꺼짐, 라우팅 변화 없음)
+- ShardRing: alias 마다 가상 노드 VNODES 개를 둔 일관 해시 → 샤드 추가 시 약 1/N 사용자만 이동
+- 원장 모델(LEDGER_MODELS)의 읽기/쓰기는 "현재 샤드" 컨텍스트(use_shard) 또는 인스턴스가 속한 DB 로
+- 샤드 DB 에는 원장 테이블만 migrate (사용자/인증 등 나머지는 default 에만)
+- 사용자 → 샤드 결정(이동된 사용자 조회 테이블 포함)은 apps/banking/shards.py
+"""
+import bisect
+import hashlib
+from contextlib import contextmanager
+from contextvars import ContextVar
+from functools import lru_cache, wraps
+
+from django.conf import settings
+from django.db import DEFAULT_DB_ALIAS, transaction
+
+# 사용자 단위로 함께 움직이는 원장 모델 (app_label.model_name)
+LEDGER_MODELS = {
+    "banking.account",
+    "banking.transactionhistory",
+    "banking.pendingposting",
+    "banking.standingorder",
+    "banking.outboxevent",
+    "banking.outboxconsumer",
+    "banking.archivesegment",
+    "banking.statement",
+    "banking.dailywithdrawal",
+}
+# 샤드 컨텍스트와 무관하게 항상 primary(default) — 라우팅 정보 자체
+DIRECTORY_MODELS = {"banking.usershard"}
+
+VNODES = 64
+
+_current_shard: ContextVar[str | None] = ContextVar("ledger_shard", default=None)
+
+
+def ledger_shards():
+    return list(getattr(settings, "LEDGER_SHARDS", [DEFAULT_DB_ALIAS]))
+
+
+def shard_aliases():
+    """원장 테이블만 두는 샤드 전용 DB (default 제외, 링에 아직 없는 예비 샤드 포함)"""
+    return set(getattr(settings, "LEDGER_SHARD_DATABASES", [])) - {DEFAULT_DB_ALIAS}
+
+
+def sharding_enabled():
+    return ledger_shards() != [DEFAULT_DB_ALIAS]
+
+
+def _hash(value):
+    return int.from_bytes(hashlib.md5(str(value).encode()).digest()[:8], "big")
+
+
+class ShardRing:
+    def __init__(self, aliases, vnodes=VNODES):
+        points = sorted((_hash(f"{alias}#{i}"), alias) for alias in aliases for i in range(vnodes))
+        self._keys = [p for p, _ in points]
+        self._aliases = [a for _, a in points]
+
+    def shard_for(self, key):
+        i = bisect.bisect(self._keys, _hash(key)) % len(self._keys)
+        return self._aliases[i]
+
+
+@lru_cache(maxsize=8)
+def _ring(aliases):
+    return ShardRing(aliases)
+
+
+def ring():
+    return _ring(tuple(ledger_shards()))
+
+
+def current_shard():
+    return _current_shard.get()
+
+
+def ledger_db():
+    """원장 쓰기/트랜잭션에 쓸 alias (컨텍스트 없으면 default)"""
+    return _current_shard.get() or DEFAULT_DB_ALIAS
+
+
+@contextmanager
+def use_shard(alias):
+    token = _current_shard.set(alias)
+    try:
+        yield alias
+    finally:
+        _current_shard.reset(token)
+
+
+def activate(alias):
+    return _current_shard.set(alias)
+
+
+def deactivate(token):
+    _current_shard.reset(token)
+
+
+def ledger_atomic(func):
+    """@transaction.atomic 대신: 현재 샤드 DB 의 트랜잭션"""
+    @wraps(func)
+    def inner(*args, **kwargs):
+        with transaction.atomic(using=ledger_db()):
+            return func(*args, **kwargs)
+    return inner
+
+
+def _label(model):
+    return model._meta.label_lower
+
+
+class ShardRouter:
+    """
+    DATABASE_ROUTERS 맨 앞에 둔다. 원장 모델이 아니면 None → 다음 라우터(복제본 라우팅)로.
+    """
+
+    def _ledger_db(self, hints):
+        # 인스턴스가 샤드에서 읽혔으면 그 샤드로
+        # (복제본에서 읽힌 인스턴스는 무시 → 복제본 라우터가 primary 로)
+        instance = hints.get("instance")
+        ledger = instance is not None and _label(instance) in LEDGER_MODELS
+        db = instance._state.db if ledger else None
+        if db in shard_aliases() or (db == DEFAULT_DB_ALIAS and sharding_enabled()):
+            return db
+        return _current_shard.get()
+
+    def db_for_read(self, model, **hints):
+        label = _label(model)
+        if label in DIRECTORY_MODELS:
+            return DEFAULT_DB_ALIAS
+        if label in LEDGER_MODELS:
+            return self._ledger_db(hints)
+        # 샤드의 원장 행에서 사용자 등 다른 모델을 따라갈 때 → default
+        instance = hints.get("instance")
+        if instance is not None and instance._state.db in shard_aliases():
+            return DEFAULT_DB_ALIAS
+        return None
+
+    def db_for_write(self, model, **hints):
+        label = _label(model)
+        if label in LEDGER_MODELS:
+            return self._ledger_db(hints)
+        return DEFAULT_DB_ALIAS if label in DIRECTORY_MODELS else None
+
+    def allow_relation(self, obj1, obj2, **hints):
+        # 원장 행 ↔ 사용자(default) 같은 샤드 간 참조 허용 (Account.user 는 db_constraint=False)
+        pool = {DEFAULT_DB_ALIAS, *shard_aliases()}
+        if obj1._state.db in pool and obj2._state.db in pool:
+            return True
+        return None
+
+    def allow_migrate(self, db, app_label, model_name=None, **hints):
+        if db in shard_aliases():
+            return f"{app_label}.{model_name}" in LEDGER_MODELS if model_name else False
+        return None
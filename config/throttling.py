@@ -0,0 +1,150 @@
+# config/throttling.py
+"""
+요청 제한(throttling) + 부하 차단(load shedding)
+
+- SlidingWindowThrottle: 캐시 기반 슬라이딩 윈도우 카운터 (locmem / Redis 모두 동작)
+  추정치 = 이전 윈도우 건수 × (남은 비율) + 현재 윈도우 건수
+  한 throttle 이 IP / 이메일 / 사용자 등 여러 스코프를 동시에 검사 (모두 통과해야 허용)
+  비율은 REST_FRAMEWORK["DEFAULT_THROTTLE_RATES"][스코프] ("5/min" 형식, 없으면 검사 안 함)
+- shed_load: 프로세스당 동시 실행 수 제한
+  초과하면 무거운 작업(비밀번호 해시 등) 전에 503 + Retry-After
+"""
+import hashlib
+import math
+import threading
+import time
+from functools import wraps
+
+from django.conf import settings
+from django.core.cache import cache
+from rest_framework import status
+from rest_framework.response import Response
+from rest_framework.settings import api_settings
+from rest_framework.throttling import BaseThrottle
+
+KEY_PREFIX = "throttle:"
+PERIODS = {"s": 1, "m": 60, "h": 3600, "d": 86400}
+
+
+def parse_rate(rate):
+    """"5/min" → (5, 60)  (DRF 표기와 동일: 기간은 첫 글자만 봄)"""
+    num, period = rate.split("/")
+    return int(num), PERIODS[period[0]]
+
+
+def _hit(key, limit, window, now):
+    """슬라이딩 윈도우 1회 기록. 반환: (허용 여부, 대기 초)"""
+    index = int(now // window)
+    elapsed = now - index * window
+    current_key, previous_key = f"{key}:{index}", f"{key}:{index - 1}"
+    counts = cache.get_many([current_key, previous_key])
+    current, previous = counts.get(current_key, 0), counts.get(previous_key, 0)
+
+    estimate = previous * (1 - elapsed / window) + current
+    if estimate >= limit:
+        return False, max(1, math.ceil(window - elapsed))
+
+    # 두 윈도우 동안만 필요 → timeout 2*window
+    cache.add(current_key, 0, timeout=2 * window)
+    try:
+        cache.incr(current_key)
+    except ValueError:  # add 직후 축출된 경우
+        cache.set(current_key, 1, timeout=2 * window)
+    return True, None
+
+
+class SlidingWindowThrottle(BaseThrottle):
+    # (스코프 이름, 식별자 종류: "ip" | "email" | "user")
+    scopes: tuple[tuple[str, str], ...] = ()
+
+    def __init__(self):
+        self.wait_seconds = None
+
+    def allow_request(self, request, view):
+        rates = api_settings.DEFAULT_THROTTLE_RATES or {}
+        now = time.time()
+        for scope, kind in self.scopes:
+            rate = rates.get(scope)
+            ident = self.ident_for(kind, request)
+            if rate is None or ident is None:
+                continue
+            limit, window = parse_rate(rate)
+            allowed, wait = _hit(f"{KEY_PREFIX}{scope}:{ident}", limit, window, now)
+            if not allowed:
+                self.wait_seconds = wait
+                return False
+        return True
+
+    def ident_for(self, kind, request):
+        if kind == "ip":
+            return self.get_ident(request)
+        if kind == "email":
+            email = request.data.get("email") if hasattr(request.data, "get") else None
+            if not email:
+                return None
+            # 캐시 키 길이/문자 제약 회피 + 평문 이메일을 키에 남기지 않음
+            return hashlib.sha256(str(email).strip().lower().encode()).hexdigest()[:32]
+        if kind == "user":
+            user = getattr(request, "user", None)
+            return str(user.pk) if user is not None and user.is_authenticated else None
+        raise ValueError(f"알 수 없는 식별자 종류: {kind}")
+
+    def wait(self):
+        return self.wait_seconds
+
+
+class LoginThrottle(SlidingWindowThrottle):
+    scopes = (("login_ip", "ip"), ("login_email", "email"))
+
+
+class RegisterThrottle(SlidingWindowThrottle):
+    scopes = (("register_ip", "ip"), ("register_email", "email"))
+
+
+class RefreshThrottle(SlidingWindowThrottle):
+    scopes = (("refresh_ip", "ip"),)
+
+
+class TransactionCreateThrottle(SlidingWindowThrottle):
+    scopes = (("transaction_create_user", "user"), ("transaction_create_ip", "ip"))
+
+
+# ---------- 동시 실행 제한 ----------
+_semaphores: dict[str, threading.BoundedSemaphore] = {}
+_semaphores_lock = threading.Lock()
+
+
+def _semaphore(name):
+    limit = settings.LOAD_SHEDDING["LIMITS"].get(name)
+    if not limit:
+        return None
+    with _semaphores_lock:
+        if name not in _semaphores:
+            _semaphores[name] = threading.BoundedSemaphore(limit)
+        return _semaphores[name]
+
+
+def shed_load(name):
+    """
+    뷰 메서드 데코레이터. LOAD_SHEDDING["LIMITS"][name] 개를 넘는 동시 실행은 기다리지 않고 503.
+    (DRF throttle 검사 이후, 핸들러 본문 이전에 적용됨)
+    """
+    def decorator(method):
+        @wraps(method)
+        def wrapper(self, request, *args, **kwargs):
+            sem = _semaphore(name)
+            if sem is None:
+                return method(self, request, *args, **kwargs)
+            if not sem.acquire(blocking=False):
+                retry_after = settings.LOAD_SHEDDING["RETRY_AFTER"]
+                return Response(
+                    {"detail": "요청이 많아 잠시 후 다시 시도해 주세요."},
+                    status=status.HTTP_503_SERVICE_UNAVAILABLE,
+                    headers={"Retry-After": str(retry_after)},
+                )
+            try:
+                return method(self, request, *args, **kwargs)
+            finally:
+                sem.release()
+        return wrapper
+    return decorator
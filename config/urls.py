@@ -1,18 +1,21 @@
 # config/urls.py
 from django.contrib import admin
-from django.urls import path, include
+from django.urls import include, path
 from drf_spectacular.views import (
     SpectacularAPIView,
-    SpectacularSwaggerView,
     SpectacularRedocView,
+    SpectacularSwaggerView,
 )
 
+from apps.users.views_jwks import JWKSView
+
 urlpatterns = [
     path("admin/", admin.site.urls),
 
     # ---- API 라우팅 ----
     path("api/auth/", include("apps.users.urls", namespace="users")),     # 유저/인증
     path("api/", include("apps.banking.urls", namespace="banking")),      # 계좌/거래
+    path(".well-known/jwks.json", JWKSView.as_view(), name="jwks"),      # JWT 공개키
 
     # ---- API 스키마 & 문서 ----
     path("api/schema/", SpectacularAPIView.as_view(), name="schema"),